@@ -1,4 +1,6 @@
 """Worker thread for running multiple sequence alignments (cross-platform)."""
+import io
+import mmap
 import os
 import shutil
 import subprocess
@@ -6,6 +8,7 @@ import tempfile
 import threading
 import time
 import uuid
+from functools import lru_cache
 from PyQt5.QtCore import QThread, pyqtSignal
 
 from core.tool_registry import ALIGNMENT_TOOL_IDS
@@ -29,6 +32,55 @@ MAX_SEQUENCES_BY_TOOL = {
 }
 
 
+@lru_cache(maxsize=32)
+def _scan_fasta_lengths(fasta_path, mtime_ns, size):
+    """
+    Return (sequence count, shortest length, longest length) for a FASTA file.
+
+    mtime_ns and size are only part of the cache key: reloading an unchanged
+    file (e.g. switching aligners or navigating back) skips the re-parse,
+    while any edit to the file produces a new key.
+    """
+    count = 0
+    max_len = 0
+    min_len = float("inf")
+
+    current_seq = []
+
+    with open(fasta_path, "rb") as raw:
+        # Fewer than two '>' bytes means fewer than two headers; finding
+        # them on a memory map is far cheaper than the line scan below
+        marks = 0
+        if size:
+            with mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                first = mm.find(b">")
+                if first >= 0:
+                    marks = 2 if mm.find(b">", first + 1) >= 0 else 1
+        if marks < 2:
+            return marks, 0, 0
+
+        raw.seek(0)
+        f = io.TextIOWrapper(raw, encoding="utf-8")
+        for line in f:
+            line = line.strip()
+            if line.startswith(">"):
+                if current_seq:
+                    seq_len = len("".join(current_seq))
+                    max_len = max(max_len, seq_len)
+                    min_len = min(min_len, seq_len)
+                    current_seq = []
+                count += 1
+            elif line:
+                current_seq.append(line)
+
+        if current_seq:
+            seq_len = len("".join(current_seq))
+            max_len = max(max_len, seq_len)
+            min_len = min(min_len, seq_len)
+
+    return count, min_len, max_len
+
+
 def max_sequences_for_tool(tool_id: str) -> int:
     return MAX_SEQUENCES_BY_TOOL.get(tool_id, 2000)
 
@@ -61,6 +113,38 @@ def check_clustalo_installation():
     return check_alignment_tool_installation("clustalo")
 
 
+# Aligner output formats under their Bio.AlignIO names
+ALIGNIO_FORMATS = {
+    "fasta": "fasta",
+    "clustal": "clustal",
+    "msf": "msf",
+    "phylip": "phylip-relaxed",
+    "stockholm": "stockholm",
+}
+
+
+def parse_alignment(content: str, output_format: str):
+    """
+    Parse aligner output into a Bio.Align.MultipleSeqAlignment.
+
+    Raises:
+        ValueError: if the format is unknown or the content does not parse
+    """
+    from io import StringIO
+    from Bio import AlignIO
+
+    if output_format not in ALIGNIO_FORMATS:
+        raise ValueError(f"Unsupported alignment format: {output_format}")
+    return AlignIO.read(StringIO(content), ALIGNIO_FORMATS[output_format])
+
+
+def format_alignment(msa, output_format: str) -> str:
+    """Render a parsed alignment in one of the aligner output formats."""
+    if output_format not in ALIGNIO_FORMATS:
+        raise ValueError(f"Unsupported alignment format: {output_format}")
+    return format(msa, ALIGNIO_FORMATS[output_format])
+
+
 class AlignmentWorker(QThread):
     """
     Worker thread for running MSA with Clustal Omega, MAFFT, MUSCLE, or FAMSA.
@@ -71,6 +155,7 @@ class AlignmentWorker(QThread):
     progress = pyqtSignal(int, str)
     finished = pyqtSignal(str, str)  # aligned_fasta_content, output_file_path
     error = pyqtSignal(str)
+    cancelled = pyqtSignal()  # run() has returned after cancel()
 
     DEFAULT_TIMEOUT = 600
 
@@ -103,18 +188,33 @@ class AlignmentWorker(QThread):
 
         self._cancelled = False
         self._temp_files = []
+        # Aligner process currently running, so cancel() can stop it directly
+        self._current_proc = None
 
     @property
     def max_sequences(self):
         return max_sequences_for_tool(self.tool_id)
 
     def cancel(self):
-        """Cancel the alignment"""
+        """Cancel the alignment.
+
+        The running aligner is terminated and run() returns on its own,
+        cleaning up its temp files and emitting ``cancelled`` instead of a
+        result or error.
+        """
         self._cancelled = True
+        proc = self._current_proc
+        if proc is not None:
+            try:
+                proc.terminate()
+            except OSError:
+                pass
 
     def run(self):
         """Run the alignment"""
         output_path = None
+        # Set once finished or error is emitted; a later cancel() then has nothing to report
+        completed = False
         display = aligner_display_name(self.tool_id)
 
         try:
@@ -166,15 +266,22 @@ class AlignmentWorker(QThread):
 
             self.progress.emit(100, "Alignment complete!")
             self.finished.emit(aligned_content, output_path)
+            completed = True
 
         except AlignmentError as e:
             self._cleanup_windows_output(output_path)
-            self.error.emit(str(e))
+            if not self._cancelled:
+                self.error.emit(str(e))
+                completed = True
         except Exception as e:
             self._cleanup_windows_output(output_path)
-            self.error.emit(f"Unexpected error: {str(e)}")
+            if not self._cancelled:
+                self.error.emit(f"Unexpected error: {str(e)}")
+                completed = True
         finally:
             self._cleanup_temp_files()
+            if self._cancelled and not completed:
+                self.cancelled.emit()
 
     def _run_aligner(self, resolution, input_path, seq_count):
         if self.tool_id == "clustalo":
@@ -269,6 +376,9 @@ class AlignmentWorker(QThread):
             if file_handle:
                 file_handle.close()
             raise AlignmentError(f"Could not start {phase_label}: {e}") from e
+        self._current_proc = proc
+        if self._cancelled:
+            proc.terminate()
 
         line_count = [0]
         last_stderr_activity = [time.monotonic()]
@@ -343,6 +453,7 @@ class AlignmentWorker(QThread):
 
             rc = proc.returncode if proc.returncode is not None else 0
         finally:
+            self._current_proc = None
             stop_drain.set()
             drain_t.join(timeout=4)
             if file_handle:
@@ -711,33 +822,13 @@ class SequenceAlignmentPrep:
         Returns:
             tuple: (is_valid: bool, message: str, sequence_count: int)
         """
-        if not os.path.exists(fasta_path):
+        try:
+            st = os.stat(fasta_path)
+        except OSError:
             return False, "File not found", 0
 
         try:
-            count = 0
-            max_len = 0
-            min_len = float("inf")
-
-            current_seq = []
-
-            with open(fasta_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith(">"):
-                        if current_seq:
-                            seq_len = len("".join(current_seq))
-                            max_len = max(max_len, seq_len)
-                            min_len = min(min_len, seq_len)
-                            current_seq = []
-                        count += 1
-                    elif line:
-                        current_seq.append(line)
-
-                if current_seq:
-                    seq_len = len("".join(current_seq))
-                    max_len = max(max_len, seq_len)
-                    min_len = min(min_len, seq_len)
+            count, min_len, max_len = _scan_fasta_lengths(fasta_path, st.st_mtime_ns, st.st_size)
 
             if count < 2:
                 return False, "At least 2 sequences are required for alignment", count
@@ -749,3 +840,50 @@ class SequenceAlignmentPrep:
 
         except Exception as e:
             return False, f"Error reading file: {str(e)}", 0
+
+
+class FastaValidationWorker(QThread):
+    """Run SequenceAlignmentPrep.validate_fasta_for_alignment off the GUI thread."""
+
+    validated = pyqtSignal(bool, str, int)  # is_valid, message, sequence_count
+
+    def __init__(self, fasta_path, max_sequences=2000, parent=None):
+        super().__init__(parent)
+        self.fasta_path = fasta_path
+        self.max_sequences = max_sequences
+        self._cancelled = False
+
+    def cancel(self):
+        """Drop the result; the scan itself is short and runs to completion."""
+        self._cancelled = True
+
+    def run(self):
+        result = SequenceAlignmentPrep.validate_fasta_for_alignment(
+            self.fasta_path, max_sequences=self.max_sequences
+        )
+        if not self._cancelled:
+            self.validated.emit(*result)
+
+
+class ToolCheckWorker(QThread):
+    """Run check_alignment_tool_installation off the GUI thread.
+
+    The status check launches the tool (through WSL on Windows) to read its
+    version, which can take hundreds of milliseconds or more.
+    """
+
+    checked = pyqtSignal(str, bool)  # tool_id, installed
+
+    def __init__(self, tool_id, parent=None):
+        super().__init__(parent)
+        self.tool_id = tool_id
+        self._cancelled = False
+
+    def cancel(self):
+        """Drop the result; the running version probe is left to finish."""
+        self._cancelled = True
+
+    def run(self):
+        installed, _version, _path = check_alignment_tool_installation(self.tool_id)
+        if not self._cancelled:
+            self.checked.emit(self.tool_id, installed)
@@ -1,17 +1,56 @@
 import subprocess
 import tempfile
 import os
+import json
+import shutil
+import hashlib
+import glob
+import time
+import xml.etree.ElementTree as ET
 from PyQt5.QtCore import QThread, pyqtSignal
-from Bio.Blast import NCBIXML
 from core.config_manager import get_config
 from core.tool_runtime import get_tool_runtime
-from utils.results_parser import BLASTResultsParser
+from utils.fasta_parser import FastaParseError, prepare_protein_queries
+from utils.results_parser import BLASTResultsParser, SearchHit
+
+
+# Per-hit HTML templates, filled once per hit by BLASTWorker._format_hit_html
+_HIT_HEADER_HTML = (
+    '<div class="hit">'
+    '<div class="hit-title">#{rank}. {title}</div>'
+    '<span style="color: #7f8c8d;">Length: {length} amino acids</span>'
+)
+
+_HSP_HTML = (
+    '<div class="stats">'
+    '<div class="stat-row"><span class="stat-label">Score:</span> <b>{score}</b> bits</div>'
+    '<div class="stat-row"><span class="stat-label">E-value:</span> <b style="color: {evalue_color};">{evalue:.2e}</b></div>'
+    '<div class="stat-row"><span class="stat-label">Identity:</span> <b style="color: {identity_color};">{identities}/{align_length} ({identity_percent:.1f}%)</b></div>'
+    '<div class="stat-row"><span class="stat-label">Positives:</span> <b>{positives}/{align_length} ({positive_percent:.1f}%)</b></div>'
+    '<div class="stat-row"><span class="stat-label">Gaps:</span> {gaps}/{align_length} ({gap_percent:.1f}%)</div>'
+    '</div>'
+    '<div class="alignment">'
+    '<b>Alignment</b> (Query: {query_from}-{query_to}, Subject: {hit_from}-{hit_to})<br><br>'
+    '<span style="color: #2980b9;">Query:</span> {qseq}<br>'
+    '<span style="color: #7f8c8d;">      {midline}</span><br>'
+    '<span style="color: #27ae60;">Sbjct:</span> {hseq}'
+    '</div>'
+)
+
+
+def _default_result_cache_dir():
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))
+        return os.path.join(base, "SenLab", "ProteinGUI", "cache", "blastp_results")
+    return os.path.join(os.path.expanduser("~"), ".senlab", "protein_gui", "cache", "blastp_results")
 
 
 class BLASTWorker(QThread):
     """Worker thread to run BLAST without freezing the GUI"""
     finished = pyqtSignal(str, list)  # HTML, SearchHit objects
     error = pyqtSignal(str)
+    progress = pyqtSignal(str)  # Progress message
+    cancelled = pyqtSignal()  # Emitted instead of finished/error after cancel()
     
     # Default advanced parameters
     DEFAULT_PARAMS = {
@@ -26,46 +65,170 @@ class BLASTWorker(QThread):
         'comp_based_stats': 2
     }
     
+    # Refuse to parse result files beyond this size instead of exhausting memory
+    MAX_XML_SIZE_MB = 200
+    XML_READ_BUFFER = 1 << 20
+    
+    # Finished searches are stored here keyed by query, database and parameters;
+    # None means the per-user cache directory
+    RESULT_CACHE_DIR = None
+    # Least recently used results beyond this count are evicted after each save
+    RESULT_CACHE_MAX_ENTRIES = 100
+    # Remote results are re-fetched after this many seconds so new NCBI releases show up
+    REMOTE_RESULT_TTL = 24 * 60 * 60
+    
     def __init__(self, sequence, database, use_remote=True, local_db_path="", advanced_params=None):
         super().__init__()
         self.sequence = sequence
         self.database = database
         self.use_remote = use_remote
         self.local_db_path = local_db_path
+        self._cancelled = False
+        self._process = None
         
         # Merge default params with provided params
         self.params = self.DEFAULT_PARAMS.copy()
         if advanced_params:
             self.params.update(advanced_params)
     
+    def cancel(self):
+        """Cancel the search and stop the running blastp process"""
+        self._cancelled = True
+        process = self._process
+        if process is not None and process.poll() is None:
+            try:
+                process.terminate()
+            except OSError:
+                pass
+    
+    @classmethod
+    def result_cache_dir(cls):
+        """Directory holding cached search results"""
+        return cls.RESULT_CACHE_DIR or _default_result_cache_dir()
+    
+    @classmethod
+    def clear_result_cache(cls):
+        """Delete every cached search result"""
+        shutil.rmtree(cls.result_cache_dir(), ignore_errors=True)
+    
+    def _local_db(self):
+        """Path prefix of the local database to search"""
+        if self.local_db_path:
+            return os.path.join(self.local_db_path, self.database)
+        return os.path.join(get_config().get_blast_db_dir(), self.database)
+    
+    def _local_db_fingerprint(self):
+        """Name, mtime and size of every file of the local database, so a rebuild changes the key"""
+        files = []
+        for path in sorted(glob.glob(glob.escape(self._local_db()) + '.*')):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            files.append([os.path.basename(path), st.st_mtime_ns, st.st_size])
+        return files
+    
+    def _result_cache_path(self):
+        """Cache file for this exact search"""
+        cache_dir = self.result_cache_dir()
+        db_files = None if self.use_remote else self._local_db_fingerprint()
+        key = json.dumps(
+            [self.sequence, self.database, self.use_remote, self.local_db_path, self.params, db_files],
+            sort_keys=True, default=str,
+        )
+        return os.path.join(cache_dir, hashlib.sha256(key.encode('utf-8')).hexdigest() + '.json')
+    
+    def _load_cached_result(self, cache_path):
+        """Return (html, hits) from a previous identical search, or None"""
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            if self.use_remote and time.time() - payload.get('saved_at', 0) > self.REMOTE_RESULT_TTL:
+                return None
+            # Mark as recently used so eviction keeps it
+            os.utime(cache_path)
+            return payload['html'], [SearchHit(**hit) for hit in payload['hits']]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def _save_cached_result(self, cache_path, html_results, structured_data):
+        """Store the formatted results; a failed write only costs a re-run later"""
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = cache_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'saved_at': time.time(),
+                    'html': html_results,
+                    'hits': [hit.to_dict() for hit in structured_data],
+                }, f)
+            os.replace(tmp_path, cache_path)
+            self._prune_result_cache(os.path.dirname(cache_path))
+        except OSError:
+            pass
+    
+    def _prune_result_cache(self, cache_dir):
+        """Evict the least recently used results beyond RESULT_CACHE_MAX_ENTRIES"""
+        entries = [e for e in os.scandir(cache_dir) if e.name.endswith('.json')]
+        if len(entries) <= self.RESULT_CACHE_MAX_ENTRIES:
+            return
+        entries.sort(key=lambda e: e.stat().st_mtime)
+        for entry in entries[:len(entries) - self.RESULT_CACHE_MAX_ENTRIES]:
+            try:
+                os.unlink(entry.path)
+            except OSError:
+                pass
+    
     def run(self):
+        output_path = None
+        # Set once finished or error is emitted; a later cancel() then has nothing to report
+        completed = False
         try:
-            # Create temporary files for input and output
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.fasta', delete=False) as query_file:
-                query_file.write(f">query\n{self.sequence}\n")
-                query_path = query_file.name
+            # Pasted input is cleaned here rather than on the GUI thread
+            try:
+                self.sequence = prepare_protein_queries(self.sequence)
+            except FastaParseError as e:
+                self.error.emit(str(e))
+                completed = True
+                return
+            
+            # Identical searches are answered from the result cache without running BLAST
+            cache_path = self._result_cache_path()
+            cached = self._load_cached_result(cache_path)
+            if cached is not None:
+                self.finished.emit(*cached)
+                completed = True
+                return
             
-            output_path = tempfile.mktemp(suffix='.xml')
+            # The query goes to blastp on stdin; only the XML output needs a file.
+            # A multi-FASTA batch is passed through as-is and searched in one run
+            if self.sequence.startswith('>'):
+                query_fasta = self.sequence
+            else:
+                query_fasta = f">query\n{self.sequence}\n"
+            with tempfile.NamedTemporaryFile(suffix='.xml', delete=False) as output_file:
+                output_path = output_file.name
             
             # Resolve BLASTP through the shared runtime layer.
-            config = get_config()
             runtime = get_tool_runtime()
             blast_resolution = runtime.resolve_tool("blastp")
             if not blast_resolution.executable:
                 self.error.emit("BLASTP is not available. Install BLAST+ or configure a valid executable path.")
+                completed = True
                 return
 
-            query_path_tool = runtime.prepare_path(blast_resolution, query_path)
             output_path_tool = runtime.prepare_path(blast_resolution, output_path)
             
             # Build command based on remote vs local database
             cmd = [
-                '-query', query_path_tool,
+                '-query', '-',
                 '-outfmt', '5',  # XML format for Biopython parsing
                 '-out', output_path_tool,
                 # Advanced parameters
                 '-evalue', str(self.params['evalue']),
                 '-max_target_seqs', str(self.params['max_target_seqs']),
+                # Only the best HSP of each hit is displayed or parsed
+                '-max_hsps', '1',
                 '-matrix', self.params['matrix'],
                 '-word_size', str(self.params['word_size']),
                 '-gapopen', str(self.params['gap_open']),
@@ -86,34 +249,63 @@ class BLASTWorker(QThread):
             if self.use_remote:
                 cmd.extend(['-remote', '-db', self.database])
             else:
-                # For local database, use the path relative to project root
-                if self.local_db_path:
-                    # If user specified a custom path
-                    local_db = os.path.join(self.local_db_path, self.database)
-                else:
-                    # Use default local database directory (relative to project root)
-                    blast_db_dir = config.get_blast_db_dir()
-                    local_db = os.path.join(blast_db_dir, self.database)
-                
-                cmd.extend(['-db', runtime.prepare_path(blast_resolution, local_db)])
+                cmd.extend(['-db', runtime.prepare_path(blast_resolution, self._local_db())])
+            
+            # Check if cancelled before starting
+            if self._cancelled:
+                return
             
             # Execute BLAST
-            runtime.run_resolved(blast_resolution, cmd, check=True, capture_output=True, text=True)
+            if self.use_remote:
+                self.progress.emit("Waiting for remote BLASTP results from NCBI...")
+            else:
+                self.progress.emit("Running local BLASTP search...")
+            self._process = runtime.popen_resolved(
+                blast_resolution, cmd,
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+            )
+            # cancel() may have run before the handle was stored
+            if self._cancelled:
+                self._process.terminate()
+            _stdout, stderr = self._process.communicate(query_fasta)
+            
+            if self._cancelled:
+                return
+            if self._process.returncode != 0:
+                self.error.emit(f"BLAST error: {stderr}")
+                completed = True
+                return
+            
+            xml_size_mb = os.path.getsize(output_path) / (1024 * 1024)
+            if xml_size_mb > self.MAX_XML_SIZE_MB:
+                self.error.emit(
+                    f"BLAST results are too large to display ({xml_size_mb:.0f}MB, "
+                    f"max {self.MAX_XML_SIZE_MB}MB). Lower Max Hits or the E-value threshold."
+                )
+                completed = True
+                return
             
             # Parse results - get both HTML and structured data
+            self.progress.emit("Parsing results...")
             html_results = self.parse_blast_xml(output_path)
             structured_data = BLASTResultsParser.parse_xml(output_path)
             
-            # Cleanup
-            os.unlink(query_path)
-            os.unlink(output_path)
-            
+            self._save_cached_result(cache_path, html_results, structured_data)
             self.finished.emit(html_results, structured_data)
+            completed = True
             
-        except subprocess.CalledProcessError as e:
-            self.error.emit(f"BLAST error: {e.stderr}")
         except Exception as e:
-            self.error.emit(f"Error: {str(e)}")
+            if not self._cancelled:
+                self.error.emit(f"Error: {str(e)}")
+                completed = True
+        finally:
+            if output_path:
+                try:
+                    os.unlink(output_path)
+                except OSError:
+                    pass
+            if self._cancelled and not completed:
+                self.cancelled.emit()
     
     def get_evalue_color(self, evalue):
         """Get color based on E-value (lower is better)"""
@@ -142,80 +334,122 @@ class BLASTWorker(QThread):
             return "#e74c3c"  # Poor - red
     
     def parse_blast_xml(self, xml_file_path):
-        """Parse BLAST XML output using Biopython and format as HTML"""
+        """Stream BLAST XML output with ElementTree and format as HTML"""
         try:
-            with open(xml_file_path, 'r') as result_handle:
-                blast_records = NCBIXML.parse(result_handle)
-                
-                html = []
-                html.append('<html><head><style>')
-                html.append('body { font-family: "Courier New", monospace; font-size: 12px; }')
-                html.append('.header { background-color: #34495e; color: white; padding: 15px; border-radius: 5px; margin-bottom: 20px; }')
-                html.append('.header h1 { margin: 0; font-size: 20px; }')
-                html.append('.info { background-color: #ecf0f1; padding: 10px; border-radius: 5px; margin-bottom: 15px; }')
-                html.append('.hit { background-color: #ffffff; border: 1px solid #bdc3c7; padding: 15px; margin-bottom: 15px; border-radius: 5px; }')
-                html.append('.hit-title { font-size: 14px; font-weight: bold; color: #2c3e50; margin-bottom: 10px; }')
-                html.append('.stats { margin: 10px 0; }')
-                html.append('.stat-row { margin: 5px 0; }')
-                html.append('.stat-label { font-weight: bold; color: #7f8c8d; }')
-                html.append('.alignment { background-color: #f8f9fa; padding: 10px; border-radius: 3px; font-family: "Courier New", monospace; margin-top: 10px; }')
-                html.append('.no-results { color: #95a5a6; font-style: italic; text-align: center; padding: 30px; }')
-                html.append('</style></head><body>')
-                
-                for blast_record in blast_records:
-                    html.append(f'<div class="header">')
-                    html.append(f'<h1>BLASTP SEARCH RESULTS</h1>')
-                    html.append(f'</div>')
-                    
-                    html.append(f'<div class="info">')
-                    html.append(f'<b>Query:</b> {blast_record.query}<br>')
-                    html.append(f'<b>Query Length:</b> {blast_record.query_length} amino acids<br>')
-                    html.append(f'<b>Database:</b> {blast_record.database}<br>')
-                    html.append(f'<b>Sequences in Database:</b> {blast_record.database_sequences:,}')
-                    html.append(f'</div>')
-                    
-                    if blast_record.alignments:
-                        html.append(f'<div style="background-color: #d5f4e6; padding: 10px; border-radius: 5px; margin-bottom: 15px;">')
-                        html.append(f'<b>✓ Found {len(blast_record.alignments)} significant alignment(s)</b>')
+            html = []
+            html.append('<html><head><style>')
+            html.append('body { font-family: "Courier New", monospace; font-size: 12px; }')
+            html.append('.header { background-color: #34495e; color: white; padding: 15px; border-radius: 5px; margin-bottom: 20px; }')
+            html.append('.header h1 { margin: 0; font-size: 20px; }')
+            html.append('.info { background-color: #ecf0f1; padding: 10px; border-radius: 5px; margin-bottom: 15px; }')
+            html.append('.hit { background-color: #ffffff; border: 1px solid #bdc3c7; padding: 15px; margin-bottom: 15px; border-radius: 5px; }')
+            html.append('.hit-title { font-size: 14px; font-weight: bold; color: #2c3e50; margin-bottom: 10px; }')
+            html.append('.stats { margin: 10px 0; }')
+            html.append('.stat-row { margin: 5px 0; }')
+            html.append('.stat-label { font-weight: bold; color: #7f8c8d; }')
+            html.append('.alignment { background-color: #f8f9fa; padding: 10px; border-radius: 3px; font-family: "Courier New", monospace; margin-top: 10px; }')
+            html.append('.no-results { color: #95a5a6; font-style: italic; text-align: center; padding: 30px; }')
+            html.append('</style></head><body>')
+            
+            # Pre-2.2.14 output only carries the query on <BlastOutput>, so keep it as a fallback
+            header_query = ""
+            header_query_len = ""
+            database = ""
+            hits_html = []
+            
+            # Binary handle with a large buffer: the expat parser reads raw bytes in big chunks
+            with open(xml_file_path, 'rb', buffering=self.XML_READ_BUFFER) as result_handle:
+                for _event, elem in ET.iterparse(result_handle, events=('end',)):
+                    tag = elem.tag
+                    if tag == 'Hit':
+                        # Format each hit as soon as it is complete and drop its subtree
+                        hits_html.append(self._format_hit_html(len(hits_html) + 1, elem))
+                        elem.clear()
+                    elif tag == 'Iteration':
+                        query = elem.findtext('Iteration_query-def') or header_query
+                        query_length = elem.findtext('Iteration_query-len') or header_query_len
+                        db_sequences = _xml_int(elem.findtext('Iteration_stat/Statistics/Statistics_db-num'))
+                        
+                        html.append(f'<div class="header">')
+                        html.append(f'<h1>BLASTP SEARCH RESULTS</h1>')
                         html.append(f'</div>')
                         
-                        for i, alignment in enumerate(blast_record.alignments, 1):
-                            html.append(f'<div class="hit">')
-                            html.append(f'<div class="hit-title">#{i}. {alignment.title}</div>')
-                            html.append(f'<span style="color: #7f8c8d;">Length: {alignment.length} amino acids</span>')
-                            
-                            # Get the best HSP (High-scoring Segment Pair)
-                            if alignment.hsps:
-                                hsp = alignment.hsps[0]  # Best HSP
-                                identity_percent = (hsp.identities/hsp.align_length)*100
-                                positive_percent = (hsp.positives/hsp.align_length)*100
-                                gap_percent = (hsp.gaps/hsp.align_length)*100
-                                
-                                evalue_color = self.get_evalue_color(hsp.expect)
-                                identity_color = self.get_identity_color(identity_percent)
-                                
-                                html.append(f'<div class="stats">')
-                                html.append(f'<div class="stat-row"><span class="stat-label">Score:</span> <b>{hsp.score}</b> bits</div>')
-                                html.append(f'<div class="stat-row"><span class="stat-label">E-value:</span> <b style="color: {evalue_color};">{hsp.expect:.2e}</b></div>')
-                                html.append(f'<div class="stat-row"><span class="stat-label">Identity:</span> <b style="color: {identity_color};">{hsp.identities}/{hsp.align_length} ({identity_percent:.1f}%)</b></div>')
-                                html.append(f'<div class="stat-row"><span class="stat-label">Positives:</span> <b>{hsp.positives}/{hsp.align_length} ({positive_percent:.1f}%)</b></div>')
-                                html.append(f'<div class="stat-row"><span class="stat-label">Gaps:</span> {hsp.gaps}/{hsp.align_length} ({gap_percent:.1f}%)</div>')
-                                html.append(f'</div>')
-                                
-                                # Show alignment
-                                html.append(f'<div class="alignment">')
-                                html.append(f'<b>Alignment</b> (Query: {hsp.query_start}-{hsp.query_end}, Subject: {hsp.sbjct_start}-{hsp.sbjct_end})<br><br>')
-                                html.append(f'<span style="color: #2980b9;">Query:</span> {hsp.query}<br>')
-                                html.append(f'<span style="color: #7f8c8d;">      {hsp.match}</span><br>')
-                                html.append(f'<span style="color: #27ae60;">Sbjct:</span> {hsp.sbjct}')
-                                html.append(f'</div>')
-                            
+                        html.append(f'<div class="info">')
+                        html.append(f'<b>Query:</b> {query}<br>')
+                        html.append(f'<b>Query Length:</b> {query_length} amino acids<br>')
+                        html.append(f'<b>Database:</b> {database}<br>')
+                        html.append(f'<b>Sequences in Database:</b> {db_sequences:,}')
+                        html.append(f'</div>')
+                        
+                        if hits_html:
+                            html.append(f'<div style="background-color: #d5f4e6; padding: 10px; border-radius: 5px; margin-bottom: 15px;">')
+                            html.append(f'<b>✓ Found {len(hits_html)} significant alignment(s)</b>')
                             html.append(f'</div>')
-                    else:
-                        html.append(f'<div class="no-results">No significant alignments found.</div>')
-                
-                html.append('</body></html>')
-                return ''.join(html)
-                
+                            html.extend(hits_html)
+                        else:
+                            html.append(f'<div class="no-results">No significant alignments found.</div>')
+                        
+                        hits_html = []
+                        elem.clear()
+                    elif tag == 'BlastOutput_query-def':
+                        header_query = elem.text or ""
+                    elif tag == 'BlastOutput_query-len':
+                        header_query_len = elem.text or ""
+                    elif tag == 'BlastOutput_db':
+                        database = elem.text or ""
+            
+            html.append('</body></html>')
+            return ''.join(html)
+            
         except Exception as e:
             return f'<html><body><div style="color: red; padding: 20px;">Error parsing BLAST results: {str(e)}</div></body></html>'
+    
+    def _format_hit_html(self, rank, hit):
+        """Format a single <Hit> element (and its best HSP) as an HTML block"""
+        parts = [_HIT_HEADER_HTML.format(
+            rank=rank,
+            title=f"{hit.findtext('Hit_id', '')} {hit.findtext('Hit_def', '')}",
+            length=_xml_int(hit.findtext('Hit_len')),
+        )]
+        
+        # Get the best HSP (High-scoring Segment Pair)
+        hsp = hit.find('Hit_hsps/Hsp')
+        if hsp is not None:
+            identities = _xml_int(hsp.findtext('Hsp_identity'))
+            positives = _xml_int(hsp.findtext('Hsp_positive'))
+            gaps = _xml_int(hsp.findtext('Hsp_gaps'))
+            align_length = _xml_int(hsp.findtext('Hsp_align-len'))
+            expect = float(hsp.findtext('Hsp_evalue') or 0)
+            
+            identity_percent = (identities/align_length)*100 if align_length else 0.0
+            positive_percent = (positives/align_length)*100 if align_length else 0.0
+            gap_percent = (gaps/align_length)*100 if align_length else 0.0
+            
+            parts.append(_HSP_HTML.format(
+                score=float(hsp.findtext('Hsp_score') or 0),
+                evalue=expect,
+                evalue_color=self.get_evalue_color(expect),
+                identities=identities,
+                identity_percent=identity_percent,
+                identity_color=self.get_identity_color(identity_percent),
+                positives=positives,
+                positive_percent=positive_percent,
+                gaps=gaps,
+                gap_percent=gap_percent,
+                align_length=align_length,
+                query_from=hsp.findtext('Hsp_query-from', ''),
+                query_to=hsp.findtext('Hsp_query-to', ''),
+                hit_from=hsp.findtext('Hsp_hit-from', ''),
+                hit_to=hsp.findtext('Hsp_hit-to', ''),
+                qseq=hsp.findtext('Hsp_qseq', ''),
+                midline=hsp.findtext('Hsp_midline', ''),
+                hseq=hsp.findtext('Hsp_hseq', ''),
+            ))
+        
+        parts.append('</div>')
+        return ''.join(parts)
+
+
+def _xml_int(text):
+    """Convert optional XML element text to int, treating missing values as 0"""
+    return int(text) if text else 0
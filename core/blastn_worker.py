@@ -3,7 +3,6 @@ import subprocess
 import tempfile
 import os
 from PyQt5.QtCore import QThread, pyqtSignal
-from Bio.Blast import NCBIXML
 from core.config_manager import get_config
 from core.db_definitions import (
     REMOTE_NUCLEOTIDE_DEFAULT,
@@ -236,6 +235,9 @@ class BLASTNWorker(QThread):
     
     def parse_blast_xml(self, xml_file_path):
         """Parse BLAST XML output using Biopython and format as HTML"""
+        # Deferred so Biopython stays off the GUI startup path
+        from Bio.Blast import NCBIXML
+
         try:
             with open(xml_file_path, 'r') as result_handle:
                 blast_records = NCBIXML.parse(result_handle)
@@ -15,6 +15,10 @@ class ConfigManager:
 
     def __init__(self, config_path="config.json"):
         self.config_path = config_path
+        # Resolved once: the config file does not move while the app runs
+        self._project_root = os.path.dirname(os.path.abspath(config_path))
+        self._blast_db_dir = os.path.join(self._project_root, 'blast_databases')
+        self._mmseqs_db_dir = os.path.join(self._project_root, 'mmseqs_databases')
         self.config = self._load_config()
     
     def _load_config(self):
@@ -142,17 +146,15 @@ class ConfigManager:
     
     def get_project_root(self):
         """Get the project root directory (where config.json is located)"""
-        return os.path.dirname(os.path.abspath(self.config_path))
+        return self._project_root
     
     def get_blast_db_dir(self):
         """Get the BLAST database directory relative to project root"""
-        root = self.get_project_root()
-        return os.path.join(root, 'blast_databases')
+        return self._blast_db_dir
     
     def get_mmseqs_db_dir(self):
         """Get the MMSeqs2 database directory relative to project root"""
-        root = self.get_project_root()
-        return os.path.join(root, 'mmseqs_databases')
+        return self._mmseqs_db_dir
 
 
 # Global config instance
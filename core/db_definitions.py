@@ -1,5 +1,7 @@
+from types import MappingProxyType
+
 # Comprehensive NCBI BLAST databases with descriptions
-NCBI_DATABASES = {
+NCBI_DATABASES = MappingProxyType({
     # Protein databases
     'nr': 'Non-redundant protein sequences (all proteins)',
     'refseq_protein': 'Reference proteins (RefSeq)',
@@ -54,7 +56,7 @@ NCBI_DATABASES = {
     'human_genome': 'Human genome',
     'mouse_genomic': 'Mouse genomic sequences',
     'mouse_genome': 'Mouse genome'
-}
+})
 
 # Categories for better organization
 DATABASE_CATEGORIES = {
@@ -82,7 +84,7 @@ DATABASE_CATEGORIES = {
 }
 
 # Protein-specific databases for BLASTP
-PROTEIN_DATABASES = {
+PROTEIN_DATABASES = MappingProxyType({
     'swissprot': 'UniProtKB/Swiss-Prot (curated protein sequences)',
     'nr': 'Non-redundant protein sequences (all proteins)',
     'pdb': 'Protein Data Bank proteins',
@@ -90,10 +92,10 @@ PROTEIN_DATABASES = {
     'env_nr': 'Non-redundant protein sequences from environmental samples',
     'tsa_nr': 'Non-redundant protein sequences from transcriptome shotgun assembly',
     'pataa': 'Patent protein sequences',
-}
+})
 
 # Nucleotide-specific databases for BLASTN
-NUCLEOTIDE_DATABASES = {
+NUCLEOTIDE_DATABASES = MappingProxyType({
     'nt': 'Nucleotide collection (comprehensive)',
     'refseq_rna': 'Reference RNA sequences (RefSeq)',
     'refseq_genomic': 'Reference genomic sequences (RefSeq)',
@@ -116,18 +118,18 @@ NUCLEOTIDE_DATABASES = {
     'Betacoronavirus': 'Betacoronavirus sequences',
     'human_genomic': 'Human genomic sequences',
     'mouse_genomic': 'Mouse genomic sequences',
-}
+})
 
 # Remote BLASTN is much more limited than local BLAST database installs.
 # Keep the remote list intentionally small and conservative so the GUI does
 # not offer databases that are only available for local use or fail remotely.
-REMOTE_NUCLEOTIDE_DATABASES = {
+REMOTE_NUCLEOTIDE_DATABASES = MappingProxyType({
     'core_nt': 'Core nucleotide collection (faster remote default)',
     'nt': 'Nucleotide collection (comprehensive)',
     'refseq_rna': 'Reference RNA sequences (RefSeq)',
     'refseq_genomic': 'Reference genomic sequences (RefSeq)',
     'est': 'Expressed sequence tags (all organisms)',
-}
+})
 
 LOCAL_NUCLEOTIDE_DEFAULT = 'nt'
 REMOTE_NUCLEOTIDE_DEFAULT = 'core_nt'
@@ -3,6 +3,10 @@ import subprocess
 import tempfile
 import os
 import shutil
+import threading
+import time
+from collections import deque
+from itertools import islice
 from PyQt5.QtCore import QThread, pyqtSignal
 
 from core.tool_runtime import ToolRuntimeError, get_tool_runtime
@@ -10,10 +14,34 @@ from core.wsl_utils import WSLError
 from utils.results_parser import MMSeqsResultsParser
 
 
+# Per-hit HTML, filled once per result line by MMseqsWorker.format_results
+_HIT_HTML = (
+    '<div class="hit">'
+    '<div class="hit-title">#{rank}. {target_desc}</div>'
+    '<span style="color: #7f8c8d;">Accession: {target_acc}</span>'
+    '<div class="stats">'
+    '<div class="stat-row"><span class="stat-label">Identity:</span> <b style="color: {identity_color};">{identity}%</b></div>'
+    '<div class="stat-row"><span class="stat-label">E-value:</span> <b style="color: {evalue_color};">{evalue}</b></div>'
+    '<div class="stat-row"><span class="stat-label">Bit Score:</span> <b>{bits}</b></div>'
+    '<div class="stat-row"><span class="stat-label">Alignment Length:</span> {alnlen} amino acids</div>'
+    '<div class="stat-row"><span class="stat-label">Query Position:</span> {qstart}-{qend}</div>'
+    '<div class="stat-row"><span class="stat-label">Target Position:</span> {tstart}-{tend}</div>'
+    '</div>'
+    '</div>'
+)
+
+
 class MMseqsWorker(QThread):
     """Worker thread to run MMseqs2 search without freezing the GUI"""
     finished = pyqtSignal(str, list)  # HTML, SearchHit objects
     error = pyqtSignal(str)
+    progress = pyqtSignal(str)  # Live MMseqs2 search log lines
+    
+    SEARCH_TIMEOUT = 300  # seconds
+    # Trailing log lines kept for the error message when the search fails
+    SEARCH_LOG_TAIL = 40
+    # mmseqs prints many log lines per second; at most one reaches the UI per interval
+    PROGRESS_INTERVAL = 0.1  # seconds
     
     def __init__(self, sequence, database_path, sensitivity="sensitive"):
         super().__init__()
@@ -62,14 +90,14 @@ class MMseqsWorker(QThread):
             
             # Step 2: Run search
             sensitivity_value = self.get_sensitivity_value()
-            result = runtime.run_resolved(
+            returncode, log_tail = self._run_search(
+                runtime,
                 resolution,
                 ["search", query_db_tool, database_tool, result_db_tool, tmp_folder_tool, "-s", sensitivity_value],
-                timeout=300,
             )
             
-            if result.returncode != 0:
-                self.error.emit(f"MMseqs2 search error:\n{result.stderr}\n\nStdout:\n{result.stdout}")
+            if returncode != 0:
+                self.error.emit(f"MMseqs2 search error:\n{log_tail}")
                 shutil.rmtree(temp_dir, ignore_errors=True)
                 return
             
@@ -111,6 +139,53 @@ class MMseqsWorker(QThread):
             import traceback
             self.error.emit(f"Error: {str(e)}\n\n{traceback.format_exc()}")
     
+    def _run_search(self, runtime, resolution, args):
+        """Run the long `mmseqs search` step, streaming its log as progress.
+        
+        Output is read line by line instead of buffered, and only the last
+        SEARCH_LOG_TAIL lines are kept. The newest line is emitted as progress
+        at most once per PROGRESS_INTERVAL, and the final line always is.
+        Returns (returncode, log tail).
+        """
+        process = runtime.popen_resolved(
+            resolution, args,
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1,
+        )
+        timed_out = threading.Event()
+        
+        def _kill():
+            timed_out.set()
+            process.kill()
+        
+        watchdog = threading.Timer(self.SEARCH_TIMEOUT, _kill)
+        watchdog.start()
+        tail = deque(maxlen=self.SEARCH_LOG_TAIL)
+        last_emit = None
+        pending = None
+        try:
+            for line in process.stdout:
+                line = line.strip()
+                if not line:
+                    continue
+                tail.append(line)
+                now = time.monotonic()
+                if last_emit is None or now - last_emit >= self.PROGRESS_INTERVAL:
+                    self.progress.emit(line)
+                    last_emit = now
+                    pending = None
+                else:
+                    pending = line
+            if pending is not None:
+                self.progress.emit(pending)
+            returncode = process.wait()
+        finally:
+            watchdog.cancel()
+            process.stdout.close()
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(args, self.SEARCH_TIMEOUT)
+        return returncode, "\n".join(tail)
+    
     def get_sensitivity_value(self):
         """Convert sensitivity name to MMseqs2 parameter value"""
         sensitivity_map = {
@@ -177,47 +252,39 @@ class MMseqsWorker(QThread):
         
         try:
             if os.path.exists(results_file) and os.path.getsize(results_file) > 0:
+                # Only the top 20 lines are kept; the rest are just counted
                 with open(results_file, 'r') as f:
-                    lines = f.readlines()
+                    lines = list(islice(f, 20))
+                    total = len(lines) + sum(1 for _ in f)
                 
                 if lines:
                     html.append(f'<div style="background-color: #d5f4e6; padding: 10px; border-radius: 5px; margin-bottom: 15px;">')
-                    html.append(f'<b>✓ Found {len(lines)} alignment(s)</b>')
-                    if len(lines) > 20:
+                    html.append(f'<b>✓ Found {total} alignment(s)</b>')
+                    if total > 20:
                         html.append(f' <span style="color: #7f8c8d;">(showing top 20)</span>')
                     html.append(f'</div>')
                     
-                    for i, line in enumerate(lines[:20], 1):
-                        fields = line.strip().split('\t')
-                        if len(fields) >= 13:
-                            target_acc = fields[1]
-                            target_desc = fields[2]
-                            identity = fields[3]
-                            alnlen = fields[4]
-                            qstart = fields[7]
-                            qend = fields[8]
-                            tstart = fields[9]
-                            tend = fields[10]
-                            evalue = fields[11]
-                            bits = fields[12]
-                            
-                            evalue_color = self.get_evalue_color(evalue)
-                            identity_color = self.get_identity_color(identity)
-                            
-                            html.append(f'<div class="hit">')
-                            html.append(f'<div class="hit-title">#{i}. {target_desc}</div>')
-                            html.append(f'<span style="color: #7f8c8d;">Accession: {target_acc}</span>')
-                            
-                            html.append(f'<div class="stats">')
-                            html.append(f'<div class="stat-row"><span class="stat-label">Identity:</span> <b style="color: {identity_color};">{identity}%</b></div>')
-                            html.append(f'<div class="stat-row"><span class="stat-label">E-value:</span> <b style="color: {evalue_color};">{evalue}</b></div>')
-                            html.append(f'<div class="stat-row"><span class="stat-label">Bit Score:</span> <b>{bits}</b></div>')
-                            html.append(f'<div class="stat-row"><span class="stat-label">Alignment Length:</span> {alnlen} amino acids</div>')
-                            html.append(f'<div class="stat-row"><span class="stat-label">Query Position:</span> {qstart}-{qend}</div>')
-                            html.append(f'<div class="stat-row"><span class="stat-label">Target Position:</span> {tstart}-{tend}</div>')
-                            html.append(f'</div>')
-                            
-                            html.append(f'</div>')
+                    for i, line in enumerate(lines, 1):
+                        # run() fixes --format-output at 13 columns; stop splitting there
+                        fields = line.rstrip().split('\t', 12)
+                        if len(fields) == 13:
+                            (_query, target_acc, target_desc, identity, alnlen, _mismatch, _gapopen,
+                             qstart, qend, tstart, tend, evalue, bits) = fields
+                            html.append(_HIT_HTML.format(
+                                rank=i,
+                                target_acc=target_acc,
+                                target_desc=target_desc,
+                                identity=identity,
+                                identity_color=self.get_identity_color(identity),
+                                alnlen=alnlen,
+                                qstart=qstart,
+                                qend=qend,
+                                tstart=tstart,
+                                tend=tend,
+                                evalue=evalue,
+                                evalue_color=self.get_evalue_color(evalue),
+                                bits=bits,
+                            ))
                         else:
                             html.append(f'<div class="hit">#{i}. {line.strip()}</div>')
                 else:
@@ -9,7 +9,6 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
-from scipy.stats import scoreatpercentile
 
 from core.pysca_io import get_array, ic_list_from_dsect
 from core.pysca_sector_model import MergedSector
@@ -277,7 +276,10 @@ def draw_ic_distribution_figures(
         data = Vp[:, k]
         if len(data) < 1:
             continue
-        iqr = scoreatpercentile(data, 75) - scoreatpercentile(data, 25)
+        # np.percentile (linear) matches scipy's scoreatpercentile, without
+        # importing scipy.stats when the app starts
+        q25, q75 = np.percentile(data, [25, 75])
+        iqr = q75 - q25
         binw = 2 * iqr * (len(data) ** (-0.33)) if iqr > 0 else max((data.max() - data.min()) / 10.0, 1e-9)
         dr = data.max() - data.min()
         nbins = max(4, int(round(dr / max(binw, 1e-9))))
@@ -183,6 +183,17 @@ class ToolRuntime:
             )
         return result
 
+    def popen_resolved(self, resolution: ToolResolution, args, **popen_kwargs) -> subprocess.Popen:
+        """Start a previously resolved tool command without waiting for it to finish."""
+
+        if not resolution.executable:
+            raise ToolRuntimeError(f"Tool '{resolution.tool_id}' is not available")
+
+        command = [resolution.executable, *args]
+        if resolution.backend == "wsl":
+            command = ["wsl", *command]
+        return subprocess.Popen(command, **popen_kwargs)
+
     def run_tool(self, tool_id: str, args, **kwargs):
         """Resolve and execute a tool in one step."""
 
@@ -4,6 +4,7 @@ from dataclasses import asdict, dataclass
 from datetime import datetime
 import json
 import os
+import threading
 from typing import Dict
 
 
@@ -38,6 +39,8 @@ class ToolStateStore:
     def __init__(self, state_file: str | None = None):
         self.state_file = state_file or os.path.join(_default_state_root(), "tool_state.json")
         self._state = self._load()
+        # Tools may be probed from several threads; serialize changes and writes
+        self._lock = threading.RLock()
 
     def _load(self) -> Dict[str, ToolStatus]:
         if not os.path.exists(self.state_file):
@@ -50,18 +53,20 @@ class ToolStateStore:
             return {}
 
     def save(self):
-        os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
-        serializable = {tool_id: asdict(status) for tool_id, status in self._state.items()}
-        with open(self.state_file, "w", encoding="utf-8") as handle:
-            json.dump(serializable, handle, indent=2, sort_keys=True)
+        with self._lock:
+            os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+            serializable = {tool_id: asdict(status) for tool_id, status in self._state.items()}
+            with open(self.state_file, "w", encoding="utf-8") as handle:
+                json.dump(serializable, handle, indent=2, sort_keys=True)
 
     def get(self, tool_id: str) -> ToolStatus:
         return self._state.get(tool_id, ToolStatus())
 
     def set(self, tool_id: str, status: ToolStatus):
         status.last_checked = status.last_checked or datetime.utcnow().isoformat()
-        self._state[tool_id] = status
-        self.save()
+        with self._lock:
+            self._state[tool_id] = status
+            self.save()
 
     def update(
         self,
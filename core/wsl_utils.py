@@ -8,6 +8,7 @@ import subprocess
 import os
 import sys
 import shutil
+import threading
 
 
 def is_windows():
@@ -20,11 +21,16 @@ class WSLError(Exception):
     pass
 
 
+# Set once WSL has answered; later warmups in this process are skipped
+_wsl_warmed = threading.Event()
+
+
 def warmup_wsl():
     """Warm up WSL to avoid timeout on first command after boot.
+    Only the first successful warmup in a process starts WSL.
     No-op on macOS/Linux since tools run natively.
     """
-    if not is_windows():
+    if not is_windows() or _wsl_warmed.is_set():
         return
     try:
         subprocess.run(
@@ -32,6 +38,7 @@ def warmup_wsl():
             capture_output=True,
             timeout=15
         )
+        _wsl_warmed.set()
     except:
         pass
 
@@ -6,7 +6,6 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt, QSize
 from PyQt5.QtGui import QCloseEvent
 
-from core.alignment_worker import AlignmentWorker
 from core.clustering_worker import ClusteringWorker
 from ui.theme import get_theme
 from ui.icons import feather_icon, set_button_icon
@@ -24,6 +23,41 @@ TAB_ICONS = [
     "grid", "bar-chart-2", "filter", "tool", "database",
 ]
 
+# Tab pages in display order (icons follow TAB_ICONS): attribute, class, label.
+# Only the home page is built at startup; the rest on first visit.
+PAGES = [
+    ("home_page",               HomePage,              "Home"),
+    ("protein_search_page",     ProteinSearchPage,     "Protein Search"),
+    ("blastn_page",             BLASTNPage,            "BLASTN"),
+    ("clustering_page",         ClusteringPage,        "Clustering"),
+    ("alignment_page",          AlignmentPage,         "Alignment"),
+    ("motif_search_page",       MotifSearchPage,       "Motif Search"),
+    ("tools_page",              ToolsPage,             "Tools"),
+    ("database_downloads_page", DatabaseDownloadsPage, "Databases"),
+]
+
+THEME_BUTTON_QSS = """
+    QPushButton {{
+        background-color: {bg_secondary};
+        color: {text_muted};
+        border: none;
+        border-bottom: 3px solid transparent;
+        border-radius: 0px;
+        padding: 10px 18px;
+        font-size: 12px;
+        font-weight: 600;
+    }}
+    QPushButton:hover {{
+        background-color: {bg_hover};
+        color: {text_primary};
+    }}
+    QPushButton:pressed {{
+        background-color: {bg_selected};
+        color: {accent};
+        border-bottom: 3px solid {accent};
+    }}
+"""
+
 
 class ProteinGUI(QMainWindow):
     def __init__(self):
@@ -48,25 +82,18 @@ class ProteinGUI(QMainWindow):
         self.tabs.setMovable(False)
         self.tabs.setIconSize(QSize(18, 18))
 
-        # Create pages
-        self.home_page = HomePage()
-        self.protein_search_page = ProteinSearchPage()
-        self.blastn_page = BLASTNPage()
-        self.clustering_page = ClusteringPage()
-        self.alignment_page = AlignmentPage()
-        self.motif_search_page = MotifSearchPage()
-        self.tools_page = ToolsPage()
-        self.database_downloads_page = DatabaseDownloadsPage()
-
-        # Add tabs with Feather icons
-        self.tabs.addTab(self.home_page,               feather_icon("home", 18),           "Home")
-        self.tabs.addTab(self.protein_search_page,     feather_icon("search", 18),         "Protein Search")
-        self.tabs.addTab(self.blastn_page,              feather_icon("search", 18),         "BLASTN")
-        self.tabs.addTab(self.clustering_page,          feather_icon("grid", 18),           "Clustering")
-        self.tabs.addTab(self.alignment_page,           feather_icon("bar-chart-2", 18),    "Alignment")
-        self.tabs.addTab(self.motif_search_page,        feather_icon("filter", 18),         "Motif Search")
-        self.tabs.addTab(self.tools_page,               feather_icon("tool", 18),           "Tools")
-        self.tabs.addTab(self.database_downloads_page,  feather_icon("database", 18),       "Databases")
+        # Each tab holds an empty container; its page is built on first visit
+        self._page_slots = {}
+        self.tabs.setUpdatesEnabled(False)
+        for (attr, _cls, label), icon_name in zip(PAGES, TAB_ICONS):
+            setattr(self, attr, None)
+            slot = QWidget()
+            slot_layout = QVBoxLayout(slot)
+            slot_layout.setContentsMargins(0, 0, 0, 0)
+            self._page_slots[attr] = slot
+            self.tabs.addTab(slot, feather_icon(icon_name, 18), label)
+        self.tabs.setUpdatesEnabled(True)
+        self._ensure_page("home_page")
 
         # Theme toggle integrated into the tab bar as a corner widget
         self._theme_btn = QPushButton()
@@ -87,30 +114,46 @@ class ProteinGUI(QMainWindow):
         credit.setAlignment(Qt.AlignCenter)
         status.addWidget(credit, 1)
 
-        # Connect home page card clicks to tab switches
-        self.home_page.service_selected.connect(self._navigate_from_home)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+
+    def _ensure_page(self, attr: str):
+        """Return the page stored under *attr*, building it on first use."""
+        page = getattr(self, attr)
+        if page is not None:
+            return page
+        page_cls = next(cls for name, cls, _label in PAGES if name == attr)
+        page = page_cls()
+        setattr(self, attr, page)
+        self._page_slots[attr].layout().addWidget(page)
 
-        # Cross-page navigation signals
-        self.protein_search_page.navigate_to_clustering.connect(self._show_clustering_with_fasta)
-        self.protein_search_page.navigate_to_alignment.connect(self._show_alignment_with_fasta)
+        # Connect signals of the freshly built page
+        if attr == "home_page":
+            page.service_selected.connect(self._navigate_from_home)
+        elif attr == "protein_search_page":
+            page.navigate_to_clustering.connect(self._show_clustering_with_fasta)
+            page.navigate_to_alignment.connect(self._show_alignment_with_fasta)
+        return page
 
-        self.tabs.currentChanged.connect(self._on_tab_changed)
+    def _show_page(self, attr: str):
+        self._ensure_page(attr)
+        self.tabs.setCurrentWidget(self._page_slots[attr])
 
     def _navigate_from_home(self, service: str):
         page_map = {
-            "protein_search":     self.protein_search_page,
-            "blastn":             self.blastn_page,
-            "clustering":         self.clustering_page,
-            "alignment":          self.alignment_page,
-            "motif_search":       self.motif_search_page,
-            "tools":              self.tools_page,
-            "database_downloads": self.database_downloads_page,
+            "protein_search":     "protein_search_page",
+            "blastn":             "blastn_page",
+            "clustering":         "clustering_page",
+            "alignment":          "alignment_page",
+            "motif_search":       "motif_search_page",
+            "tools":              "tools_page",
+            "database_downloads": "database_downloads_page",
         }
-        page = page_map.get(service)
-        if page:
-            self.tabs.setCurrentWidget(page)
+        attr = page_map.get(service)
+        if attr:
+            self._show_page(attr)
 
     def _on_tab_changed(self, index: int):
+        self._ensure_page(PAGES[index][0])
         titles = {
             0: "Sen Lab - Protein Analysis Suite",
             1: "Sen Lab - Protein Search",
@@ -124,12 +167,12 @@ class ProteinGUI(QMainWindow):
         self.setWindowTitle(titles.get(index, "Sen Lab"))
 
     def _show_clustering_with_fasta(self, fasta_path: str, clustering_params: dict):
-        self.clustering_page.load_fasta_from_search(fasta_path, clustering_params)
-        self.tabs.setCurrentWidget(self.clustering_page)
+        self._ensure_page("clustering_page").load_fasta_from_search(fasta_path, clustering_params)
+        self._show_page("clustering_page")
 
     def _show_alignment_with_fasta(self, fasta_path: str):
-        self.alignment_page.load_sequences_from_search(fasta_path)
-        self.tabs.setCurrentWidget(self.alignment_page)
+        self._ensure_page("alignment_page").load_sequences_from_search(fasta_path)
+        self._show_page("alignment_page")
 
     def _on_theme_changed(self, theme_name: str):
         self._update_theme_button()
@@ -142,27 +185,14 @@ class ProteinGUI(QMainWindow):
         label = "Light" if is_dark else "Dark"
         self._theme_btn.setIcon(feather_icon(icon_name, 16, t.get("text_muted")))
         self._theme_btn.setText(label)
-        self._theme_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {t.get('bg_secondary')};
-                color: {t.get('text_muted')};
-                border: none;
-                border-bottom: 3px solid transparent;
-                border-radius: 0px;
-                padding: 10px 18px;
-                font-size: 12px;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background-color: {t.get('bg_hover')};
-                color: {t.get('text_primary')};
-            }}
-            QPushButton:pressed {{
-                background-color: {t.get('bg_selected')};
-                color: {t.get('accent')};
-                border-bottom: 3px solid {t.get('accent')};
-            }}
-        """)
+        self._theme_btn.setStyleSheet(THEME_BUTTON_QSS.format(
+            bg_secondary=t.get("bg_secondary"),
+            bg_hover=t.get("bg_hover"),
+            bg_selected=t.get("bg_selected"),
+            text_muted=t.get("text_muted"),
+            text_primary=t.get("text_primary"),
+            accent=t.get("accent"),
+        ))
 
     def _refresh_tab_icons(self):
         for i, icon_name in enumerate(TAB_ICONS):
@@ -170,31 +200,37 @@ class ProteinGUI(QMainWindow):
 
     def closeEvent(self, event: QCloseEvent):
         """Avoid destroying QThread-based workers while they are still running (Qt abort)."""
-        ps = self.protein_search_page
-        workers = [
-            self.tools_page.current_worker,
-            self.alignment_page.tool_install_worker,
-            self.alignment_page.alignment_worker,
-            ps.tool_install_worker,
-            ps.blast_worker,
-            ps.mmseqs_worker,
-            getattr(ps, "sequence_fetcher", None),
-            getattr(ps, "align_sequence_fetcher", None),
-            self.clustering_page.tool_install_worker,
-            self.clustering_page.clustering_worker,
-            self.blastn_page.tool_install_worker,
-            self.blastn_page.blast_worker,
-            self.database_downloads_page.current_worker,
-            self.motif_search_page.search_worker,
-            self.alignment_page._sca_worker,
-            self.alignment_page._pysca_install_worker,
-            self.alignment_page._pysca_run_worker,
-            self.alignment_page._pysca_export_worker,
-        ]
+        # Worker attributes per page; pages never visited have nothing running
+        page_workers = {
+            "tools_page": ["current_worker"],
+            "alignment_page": [
+                "tool_install_worker", "tool_check_worker", "alignment_worker",
+                "validation_worker", "_background_workers", "_sca_worker",
+                "_pysca_install_worker", "_pysca_run_worker", "_pysca_export_worker",
+            ],
+            "protein_search_page": [
+                "tool_install_worker", "blast_worker", "mmseqs_worker",
+                "_diamond_worker", "_mmseqs_gpu_worker",
+                "sequence_fetcher", "align_sequence_fetcher",
+            ],
+            "clustering_page": ["tool_install_worker", "clustering_worker"],
+            "blastn_page": ["tool_install_worker", "blast_worker", "_mmseqs_gpu_worker"],
+            "database_downloads_page": ["current_worker"],
+            "motif_search_page": ["search_worker"],
+        }
+        workers = []
+        for attr, names in page_workers.items():
+            page = getattr(self, attr)
+            if page is None:
+                continue
+            for name in names:
+                w = getattr(page, name, None)
+                # A set holds several workers, e.g. superseded background checks
+                workers.extend(list(w) if isinstance(w, set) else [w])
         for w in workers:
             if w is None or not w.isRunning():
                 continue
-            if isinstance(w, (AlignmentWorker, ClusteringWorker)):
+            if isinstance(w, ClusteringWorker):
                 w.cancel()
                 w.terminate()
             elif callable(getattr(w, "cancel", None)):
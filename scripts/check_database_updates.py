@@ -8,14 +8,132 @@ and reports which ones have been updated since the manifest was last updated.
 
 import argparse
 import json
+import os
 import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from urllib.request import urlopen, Request
-from urllib.error import URLError
 
+import requests
 
-def get_ncbi_blast_db_info():
+
+# Per-request timeout in seconds; the upstream probes run concurrently
+REQUEST_TIMEOUT = 10
+
+# A probe answered within this many seconds is reused without any request;
+# --force always goes to the network
+PROBE_TTL_SECONDS = 3600
+
+# ETag/Last-Modified, body and fetch time of each probed URL from earlier runs
+HTTP_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.protein_gui', 'http_cache.json')
+
+# One keep-alive connection pool shared by all probes
+_session = requests.Session()
+_session.headers['User-Agent'] = 'ProteinGUI/1.0'
+
+_http_cache = None
+_http_cache_lock = threading.Lock()
+
+# Manifest database ids containing one of these follow the UniProt release
+_UNIPROT_MARKERS = ('uniref', 'uniprot')
+
+# Parse: "UniProt Knowledgebase Release 2024_01 consists of:"
+_UNIPROT_RELEASE_RE = re.compile(r'Release (\d{4}_\d{2})')
+
+
+def _load_http_cache():
+    try:
+        with open(HTTP_CACHE_PATH, 'r') as f:
+            return json.load(f)
+    except (IOError, json.JSONDecodeError):
+        return {}
+
+
+def _save_http_cache():
+    try:
+        os.makedirs(os.path.dirname(HTTP_CACHE_PATH), exist_ok=True)
+        # Replace the file in one step so a concurrent run never reads half of it
+        tmp_path = f"{HTTP_CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(_http_cache, f, indent=2)
+        os.replace(tmp_path, HTTP_CACHE_PATH)
+    except IOError as e:
+        print(f"Warning: Could not save HTTP cache: {e}", file=sys.stderr)
+
+
+def fetch_text(url, max_age=PROBE_TTL_SECONDS):
+    """
+    GET a URL and return its body as text.
+    
+    A body fetched less than max_age seconds ago is returned without a
+    request. Otherwise the validators saved from the previous run are sent,
+    so an unchanged resource comes back as an empty 304 and the cached body
+    is reused. Raises requests.RequestException on network or HTTP errors.
+    """
+    global _http_cache
+    with _http_cache_lock:
+        if _http_cache is None:
+            _http_cache = _load_http_cache()
+        cached = _http_cache.get(url)
+    
+    if cached and time.time() - cached.get('fetched', 0) < max_age:
+        return cached['body']
+    
+    headers = {}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+    
+    response = _session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+    if response.status_code == 304 and cached:
+        entry = dict(cached, fetched=time.time())
+    else:
+        response.raise_for_status()
+        entry = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'body': response.text,
+            'fetched': time.time(),
+        }
+    
+    with _http_cache_lock:
+        _http_cache[url] = entry
+        _save_http_cache()
+    return entry['body']
+
+
+def fetch_last_modified(url, max_age=PROBE_TTL_SECONDS):
+    """
+    Return the Last-Modified header of a URL using a HEAD request.
+    
+    Nothing but headers is transferred. Results are cached like fetch_text(),
+    under a separate key. Raises requests.RequestException on errors.
+    """
+    global _http_cache
+    key = f"HEAD {url}"
+    with _http_cache_lock:
+        if _http_cache is None:
+            _http_cache = _load_http_cache()
+        cached = _http_cache.get(key)
+    
+    if cached and time.time() - cached.get('fetched', 0) < max_age:
+        return cached['last_modified']
+    
+    response = _session.head(url, timeout=REQUEST_TIMEOUT, allow_redirects=True)
+    response.raise_for_status()
+    entry = {'last_modified': response.headers.get('Last-Modified'), 'fetched': time.time()}
+    
+    with _http_cache_lock:
+        _http_cache[key] = entry
+        _save_http_cache()
+    return entry['last_modified']
+
+
+def get_ncbi_blast_db_info(max_age=PROBE_TTL_SECONDS):
     """
     Get information about NCBI BLAST database versions.
     Checks the NCBI FTP for last-modified dates.
@@ -24,17 +142,14 @@ def get_ncbi_blast_db_info():
     url = "https://ftp.ncbi.nlm.nih.gov/blast/db/README"
     
     try:
-        req = Request(url, headers={'User-Agent': 'ProteinGUI/1.0'})
-        with urlopen(req, timeout=30) as response:
-            content = response.read().decode('utf-8')
-            # The README is updated when databases change
-            # We can use the current date as a proxy for "latest"
-            return {
-                "source": "ncbi_blast",
-                "checked": datetime.now().isoformat(),
-                "status": "available"
-            }
-    except URLError as e:
+        # The README is updated when databases change; only its date is needed
+        last_modified = fetch_last_modified(url, max_age)
+        return {
+            "source": "ncbi_blast",
+            "status": "available",
+            "last_modified": last_modified
+        }
+    except requests.RequestException as e:
         return {
             "source": "ncbi_blast",
             "error": str(e),
@@ -42,7 +157,7 @@ def get_ncbi_blast_db_info():
         }
 
 
-def get_uniprot_release_info():
+def get_uniprot_release_info(max_age=PROBE_TTL_SECONDS):
     """
     Get the current UniProt release version.
     UniProt has a nice release notes page we can check.
@@ -50,19 +165,15 @@ def get_uniprot_release_info():
     url = "https://ftp.uniprot.org/pub/databases/uniprot/current_release/knowledgebase/complete/reldate.txt"
     
     try:
-        req = Request(url, headers={'User-Agent': 'ProteinGUI/1.0'})
-        with urlopen(req, timeout=30) as response:
-            content = response.read().decode('utf-8')
-            # Parse: "UniProt Knowledgebase Release 2024_01 consists of:"
-            match = re.search(r'Release (\d{4}_\d{2})', content)
-            if match:
-                return {
-                    "source": "uniprot",
-                    "version": match.group(1),
-                    "checked": datetime.now().isoformat(),
-                    "status": "available"
-                }
-    except URLError as e:
+        content = fetch_text(url, max_age)
+        match = _UNIPROT_RELEASE_RE.search(content)
+        if match:
+            return {
+                "source": "uniprot",
+                "version": match.group(1),
+                "status": "available"
+            }
+    except requests.RequestException as e:
         pass
     
     return {
@@ -72,13 +183,13 @@ def get_uniprot_release_info():
     }
 
 
-def get_pdb_release_info():
+def get_pdb_release_info(now=None):
     """
     Get the current PDB release information.
     """
     # PDB releases weekly on Wednesday
     # We can approximate based on the current date
-    today = datetime.now()
+    today = now or datetime.now()
     # Find the most recent Wednesday
     days_since_wednesday = (today.weekday() - 2) % 7
     last_release = today.replace(hour=0, minute=0, second=0, microsecond=0)
@@ -86,7 +197,6 @@ def get_pdb_release_info():
     return {
         "source": "pdb",
         "version": today.strftime("%Y-%m-%d"),
-        "checked": datetime.now().isoformat(),
         "status": "available",
         "note": "PDB releases weekly on Wednesdays"
     }
@@ -102,6 +212,31 @@ def load_current_manifest(manifest_path):
         return None
 
 
+def write_result(result, output_path):
+    """
+    Write the result JSON, unless the existing file already says the same.
+    
+    The result carries no per-run timestamp, so an unchanged check leaves
+    nothing stale behind; the file's mtime tells when it last changed.
+    
+    Returns True if the file was written. Writes go through a temporary
+    file in the same directory so readers never see a partial file.
+    """
+    try:
+        with open(output_path, 'r') as f:
+            previous = json.load(f)
+        if previous == result:
+            return False
+    except (IOError, json.JSONDecodeError):
+        pass
+    
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(result, f, indent=2)
+    os.replace(tmp_path, output_path)
+    return True
+
+
 def check_for_updates(manifest, force=False):
     """
     Check all sources for updates.
@@ -109,25 +244,28 @@ def check_for_updates(manifest, force=False):
     Returns dict with update information.
     """
     updates = {}
+    # One timestamp for every date in this run
+    now = datetime.now()
+    today = now.strftime("%Y-%m-%d")
     
     # Get current versions from manifest
     manifest_date = manifest.get('last_updated', '2000-01-01')
     
-    # Check NCBI
-    ncbi_info = get_ncbi_blast_db_info()
-    print(f"NCBI BLAST: {ncbi_info.get('status')}")
+    # Query NCBI and UniProt at the same time; each is a blocking HTTP request
+    max_age = 0 if force else PROBE_TTL_SECONDS
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        ncbi_future = executor.submit(get_ncbi_blast_db_info, max_age)
+        uniprot_future = executor.submit(get_uniprot_release_info, max_age)
+        pdb_info = get_pdb_release_info(now)
+        ncbi_info = ncbi_future.result()
+        uniprot_info = uniprot_future.result()
     
-    # Check UniProt
-    uniprot_info = get_uniprot_release_info()
+    print(f"NCBI BLAST: {ncbi_info.get('status')}")
     print(f"UniProt: {uniprot_info.get('status')} - {uniprot_info.get('version', 'N/A')}")
-    
-    # Check PDB
-    pdb_info = get_pdb_release_info()
     print(f"PDB: {pdb_info.get('status')} - {pdb_info.get('version', 'N/A')}")
     
     # Determine if updates are needed
-    today = datetime.now().strftime("%Y-%m-%d")
-    manifest_age_days = (datetime.now() - datetime.fromisoformat(manifest_date)).days
+    manifest_age_days = (now - datetime.fromisoformat(manifest_date)).days
     
     # Consider update needed if manifest is older than 7 days
     updates_available = force or manifest_age_days >= 7
@@ -140,10 +278,11 @@ def check_for_updates(manifest, force=False):
         }
     
     # Check UniProt version against manifest
-    for db in manifest.get('databases', []):
-        if 'uniref' in db['id'].lower() or 'uniprot' in db['id'].lower():
+    upstream_version = uniprot_info.get('version', '')
+    for db in manifest.get('databases', ()):
+        db_id = db['id'].lower()
+        if any(marker in db_id for marker in _UNIPROT_MARKERS):
             manifest_version = db.get('version', '')
-            upstream_version = uniprot_info.get('version', '')
             
             if upstream_version and manifest_version != upstream_version:
                 updates[db['id']] = {
@@ -156,7 +295,6 @@ def check_for_updates(manifest, force=False):
     return {
         'updates_available': updates_available,
         'updates': updates,
-        'checked': datetime.now().isoformat(),
         'new_manifest_version': today if updates_available else manifest_date,
         'sources': {
             'ncbi': ncbi_info,
@@ -195,8 +333,7 @@ def main():
     result = check_for_updates(manifest, force=args.force)
     
     # Save results
-    with open(args.output, 'w') as f:
-        json.dump(result, f, indent=2)
+    written = write_result(result, args.output)
     
     print()
     print("=" * 60)
@@ -209,7 +346,10 @@ def main():
         for db_id, info in result['updates'].items():
             print(f"  - {db_id}: {info.get('old_version', 'N/A')} -> {info.get('new_version', 'N/A')}")
     
-    print(f"\nResults saved to: {args.output}")
+    if written:
+        print(f"\nResults saved to: {args.output}")
+    else:
+        print(f"\nNo changes since the last check; kept {args.output}")
     
     # Exit with code 0 if updates available, 1 if not (for CI/CD)
     sys.exit(0 if result['updates_available'] else 1)
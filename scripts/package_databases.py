@@ -6,27 +6,99 @@ Usage:
     python package_databases.py --list             # List available databases
     python package_databases.py --db swissprot     # Package specific database
     python package_databases.py --db refseq        # Package refseq (warning: large!)
+    python package_databases.py --db refseq_blast --yes   # Skip the large-database prompt
+    python package_databases.py --force            # Rebuild archives even if sources are unchanged
+    python package_databases.py --format tar.zst   # Zstandard-compressed tar instead of ZIP
+    python package_databases.py --fast-deflate     # libdeflate for speed; archive SHA256 then depends on it
 
 This script:
 1. Creates ZIP archives of database files
-2. Calculates SHA256 checksums
+2. Calculates SHA256 checksums (of each archive and of every file in it)
 3. Outputs the information needed to update the manifest
 """
 
 import os
+import re
 import sys
+import shutil
+import tarfile
+import tempfile
 import zipfile
+import zlib
 import hashlib
 import json
 import argparse
+import itertools
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import deflate  # libdeflate binding; faster than zlib at the same ratio
+except ImportError:
+    deflate = None
+
+try:
+    import zstandard  # only needed for --format tar.zst
+except ImportError:
+    zstandard = None
+
 # Configuration
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
 OUTPUT_DIR = os.path.join(PROJECT_ROOT, "s3_upload")
 VERSION = datetime.now().strftime("%Y-%m-%d")
 
+# Archives built from unchanged source files are reused on the next run
+PACKAGE_CACHE_PATH = os.path.join(OUTPUT_DIR, ".package_cache.json")
+_package_cache = None
+_package_cache_lock = threading.Lock()
+
+# Database files are compressed concurrently; zlib releases the GIL while deflating
+COMPRESS_WORKERS = os.cpu_count() or 1
+# Files compressed ahead of the one being appended to the archive
+COMPRESS_WINDOW = 2 * COMPRESS_WORKERS
+# Databases packaged at once. Each already compresses on every core, so this is
+# kept small: enough to overlap I/O with compression, not to multiply the pools
+PACKAGE_WORKERS = 2
+COMPRESS_LEVEL = 6
+COPY_CHUNK_SIZE = 1024 * 1024
+# libdeflate has no streaming API, so each file is held in memory with its output
+# in every worker at once; larger files are streamed through zlib instead
+LIBDEFLATE_MAX_BYTES = 32 * 1024 * 1024
+# zlib and libdeflate emit different (equally valid) streams, so libdeflate is
+# opt-in (--fast-deflate) to keep archive SHA256s reproducible across machines
+USE_LIBDEFLATE = False
+
+# Files that barely shrink are stored as-is instead of spending a deflate pass on them.
+# 2-bit packed nucleotide sequences are known to be dense; anything else is judged
+# by how well its first COMPRESSIBILITY_SAMPLE_BYTES compress at level 1.
+STORE_EXTENSIONS = {'.nsq'}
+COMPRESSIBILITY_SAMPLE_BYTES = 64 * 1024
+MIN_COMPRESSION_GAIN = 0.1
+
+# Timestamp and permissions recorded for every archive member
+ARCHIVE_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+ARCHIVE_MTIME = 315532800  # ARCHIVE_DATE_TIME as a Unix timestamp, for tar members
+ARCHIVE_FILE_MODE = 0o100644  # regular file, rw-r--r--
+
+# Archive formats; the downloader picks the extractor from the file extension
+ARCHIVE_FORMATS = ('zip', 'tar.zst')
+ZSTD_LEVEL = 10
+
+# Printed per packaged database for pasting into databases_manifest.json
+MANIFEST_SNIPPET = """
+{{
+  "id": "{id}",
+  "distribution": {{
+    "type": "s3",
+    "url": "https://sen-lab-protein-databases.s3.us-east-2.amazonaws.com/databases/{folder}/{version}/{filename}",
+    "sha256": "{sha256}",
+    "compressed": true
+  }}
+}}"""
+
 # Available databases to package
 AVAILABLE_DATABASES = {
     "swissprot_blast": {
@@ -66,11 +138,87 @@ AVAILABLE_DATABASES = {
 
 def calculate_sha256(filepath):
     """Calculate SHA256 hash of a file"""
-    sha256_hash = hashlib.sha256()
     with open(filepath, 'rb') as f:
-        for chunk in iter(lambda: f.read(8192 * 1024), b''):
-            sha256_hash.update(chunk)
-    return sha256_hash.hexdigest()
+        # Python 3.11+ runs the whole read/update loop in C
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        # Otherwise refill one buffer instead of allocating a new chunk per read
+        sha256_hash = hashlib.sha256()
+        buffer = bytearray(COPY_CHUNK_SIZE)
+        view = memoryview(buffer)
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            sha256_hash.update(view[:n])
+        return sha256_hash.hexdigest()
+
+
+class HashingReader:
+    """Read-only file wrapper that SHA256-hashes every byte read through it"""
+    
+    def __init__(self, f):
+        self._f = f
+        self.sha256 = hashlib.sha256()
+    
+    def read(self, size=-1):
+        data = self._f.read(size)
+        self.sha256.update(data)
+        return data
+
+
+class HashingWriter:
+    """
+    Write-only file wrapper that SHA256-hashes every byte on its way to disk.
+    
+    It has no seek(), so ZipFile streams each entry with a data descriptor
+    instead of patching headers in place, and the digest matches the
+    finished archive without reading it back.
+    """
+    
+    def __init__(self, f):
+        self._f = f
+        self.sha256 = hashlib.sha256()
+    
+    def write(self, data):
+        self.sha256.update(data)
+        return self._f.write(data)
+    
+    def flush(self):
+        self._f.flush()
+
+
+def describe_hash_backend():
+    """Name the implementation behind hashlib.sha256 (OpenSSL picks SHA-NI/ARMv8 CE at runtime)"""
+    if hashlib.sha256.__name__.startswith('openssl_'):
+        import ssl
+        return ssl.OPENSSL_VERSION
+    return "Python built-in (no OpenSSL; hashing will be slow)"
+
+
+def _use_libdeflate():
+    return USE_LIBDEFLATE and deflate is not None
+
+
+def deflate_backend_id():
+    """
+    Short name of the DEFLATE backend, recorded with each package.
+    
+    Archives only hash the same when rebuilt with the same backend (and zlib version).
+    """
+    if _use_libdeflate():
+        return f"libdeflate+zlib {zlib.ZLIB_RUNTIME_VERSION}"
+    return f"zlib {zlib.ZLIB_RUNTIME_VERSION}"
+
+
+def describe_deflate_backend():
+    """Name the DEFLATE implementation used for archive members"""
+    if _use_libdeflate():
+        return (f"libdeflate (files up to {format_size(LIBDEFLATE_MAX_BYTES)}), "
+                f"zlib {zlib.ZLIB_RUNTIME_VERSION} above; archive SHA256 is not reproducible with zlib")
+    if USE_LIBDEFLATE:
+        return f"zlib {zlib.ZLIB_RUNTIME_VERSION} (pip install deflate for --fast-deflate)"
+    return f"zlib {zlib.ZLIB_RUNTIME_VERSION} (reproducible)"
 
 
 def format_size(size_bytes):
@@ -83,46 +231,278 @@ def format_size(size_bytes):
         return f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
 
 
-def package_blast_database(source_dir, output_zip):
-    """Package a BLAST database into a ZIP file"""
-    print(f"  Packaging BLAST database from {source_dir}")
+def _is_worth_deflating(filepath, src):
+    """Check the extension and a leading sample of *src*, then rewind it"""
+    if os.path.splitext(filepath)[1].lower() in STORE_EXTENSIONS:
+        return False
+    sample = src.read(COMPRESSIBILITY_SAMPLE_BYTES)
+    src.seek(0)
+    if not sample:
+        return True
+    return len(zlib.compress(sample, 1)) <= len(sample) * (1 - MIN_COMPRESSION_GAIN)
+
+
+def _compress_member(filepath, spool_dir):
+    """
+    Prepare one file for the archive.
     
-    with zipfile.ZipFile(output_zip, 'w', zipfile.ZIP_DEFLATED) as zf:
-        for filename in os.listdir(source_dir):
-            filepath = os.path.join(source_dir, filename)
-            if os.path.isfile(filepath):
+    Compressible files are raw-deflated into an anonymous spool file; dense
+    ones only get their CRC computed and are later copied from the source.
+    The file's own SHA256 is taken on the same read.
+    Returns (spool or None, compress_type, crc, file_size, compress_size, sha256)
+    with the spool rewound, ready to be copied into the archive as-is.
+    """
+    file_hash = hashlib.sha256()
+    with open(filepath, 'rb') as src:
+        if not _is_worth_deflating(filepath, src):
+            crc = 0
+            file_size = 0
+            for chunk in iter(lambda: src.read(COPY_CHUNK_SIZE), b''):
+                crc = zlib.crc32(chunk, crc)
+                file_hash.update(chunk)
+                file_size += len(chunk)
+            return None, zipfile.ZIP_STORED, crc, file_size, file_size, file_hash.hexdigest()
+        
+        spool = tempfile.TemporaryFile(dir=spool_dir)
+        if _use_libdeflate() and os.path.getsize(filepath) <= LIBDEFLATE_MAX_BYTES:
+            data = src.read()
+            crc = zlib.crc32(data)
+            file_hash.update(data)
+            file_size = len(data)
+            spool.write(deflate.deflate_compress(data, COMPRESS_LEVEL))
+        else:
+            compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS)
+            crc = 0
+            file_size = 0
+            for chunk in iter(lambda: src.read(COPY_CHUNK_SIZE), b''):
+                crc = zlib.crc32(chunk, crc)
+                file_hash.update(chunk)
+                file_size += len(chunk)
+                spool.write(compressor.compress(chunk))
+            spool.write(compressor.flush())
+    compress_size = spool.tell()
+    spool.seek(0)
+    return spool, zipfile.ZIP_DEFLATED, crc, file_size, compress_size, file_hash.hexdigest()
+
+
+def _append_member(zf, filepath, arcname, member):
+    """Append a member prepared by _compress_member without recompressing it"""
+    spool, compress_type, crc, file_size, compress_size, _ = member
+    # Fixed metadata so identical content gives the same archive (and SHA256) on any machine
+    zinfo = zipfile.ZipInfo(arcname, date_time=ARCHIVE_DATE_TIME)
+    zinfo.create_system = 3  # Unix, so external_attr holds the permission bits
+    zinfo.external_attr = ARCHIVE_FILE_MODE << 16
+    zinfo.compress_type = compress_type
+    zinfo.CRC = crc
+    zinfo.file_size = file_size
+    zinfo.compress_size = compress_size
+    
+    # Same bookkeeping ZipFile.write() does, minus the compressor
+    zinfo.header_offset = zf.start_dir
+    zf.fp.write(zinfo.FileHeader())
+    with spool or open(filepath, 'rb') as data:
+        shutil.copyfileobj(data, zf.fp, COPY_CHUNK_SIZE)
+    zf.start_dir = zf.fp.tell()
+    zf.filelist.append(zinfo)
+    zf.NameToInfo[arcname] = zinfo
+    zf._didModify = True
+
+
+def _load_package_cache():
+    try:
+        with open(PACKAGE_CACHE_PATH, 'r') as f:
+            return json.load(f)
+    except (IOError, json.JSONDecodeError):
+        return {}
+
+
+def _save_package_cache():
+    try:
+        # Replace the file in one step so a concurrent run never reads half of it
+        tmp_path = f"{PACKAGE_CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(_package_cache, f, indent=2)
+        os.replace(tmp_path, PACKAGE_CACHE_PATH)
+    except IOError as e:
+        print(f"  [WARNING] Could not save package cache: {e}")
+
+
+def source_fingerprint(filepaths):
+    """Digest of the names, sizes and mtimes of *filepaths*, independent of their order"""
+    entries = []
+    for filepath in filepaths:
+        st = os.stat(filepath)
+        entries.append((os.path.basename(filepath), st.st_size, st.st_mtime_ns))
+    entries.sort()
+    return hashlib.blake2b(json.dumps(entries).encode(), digest_size=16).hexdigest()
+
+
+def _cached_hashes(output_zip, fingerprint):
+    """(archive SHA256, file SHA256s) if *output_zip* was built from *fingerprint* and is untouched since"""
+    global _package_cache
+    with _package_cache_lock:
+        if _package_cache is None:
+            _package_cache = _load_package_cache()
+        entry = _package_cache.get(os.path.abspath(output_zip))
+    if not entry or entry.get('fingerprint') != fingerprint:
+        return None
+    try:
+        st = os.stat(output_zip)
+    except OSError:
+        return None
+    if (st.st_size, st.st_mtime_ns) != (entry.get('size'), entry.get('mtime_ns')):
+        return None
+    if not entry.get('sha256') or 'files' not in entry:
+        return None
+    return entry['sha256'], entry['files']
+
+
+def _remember_hashes(output_zip, fingerprint, sha256, file_hashes):
+    global _package_cache
+    st = os.stat(output_zip)
+    with _package_cache_lock:
+        if _package_cache is None:
+            _package_cache = _load_package_cache()
+        _package_cache[os.path.abspath(output_zip)] = {
+            'fingerprint': fingerprint,
+            'sha256': sha256,
+            'files': file_hashes,
+            'size': st.st_size,
+            'mtime_ns': st.st_mtime_ns,
+        }
+        _save_package_cache()
+
+
+def write_archive(output_zip, filepaths, force=False):
+    """
+    Zip *filepaths* (stored by basename, in the given order) into *output_zip*,
+    or tar them through Zstandard when it ends in .tar.zst.
+    
+    Returns (archive SHA256, {filename: SHA256 of that file}).
+    
+    Files are compressed in parallel into spool files next to the archive and
+    stitched in order, so the archive can be written while later files are
+    still compressing. At most COMPRESS_WINDOW files are in flight at a time. If none of the files changed since *output_zip* was
+    last built, the archive is kept and its cached hashes returned, unless
+    *force* is set.
+    """
+    # An archive built with another deflate backend would hash differently, so rebuild it
+    fingerprint = f"{source_fingerprint(filepaths)}/{deflate_backend_id()}"
+    if not force:
+        cached = _cached_hashes(output_zip, fingerprint)
+        if cached:
+            print("    Sources unchanged since the last run; reusing the existing archive")
+            if not os.path.exists(f"{output_zip}.sha256"):
+                write_checksum_file(output_zip, cached[0])
+            return cached
+    
+    if output_zip.endswith('.tar.zst'):
+        sha256, file_hashes = _write_tar_zst(output_zip, filepaths)
+    else:
+        sha256, file_hashes = _write_zip(output_zip, filepaths)
+    _remember_hashes(output_zip, fingerprint, sha256, file_hashes)
+    write_checksum_file(output_zip, sha256)
+    return sha256, file_hashes
+
+
+def write_checksum_file(archive_path, sha256):
+    """
+    Write *archive_path*.sha256 in sha256sum format.
+    
+    The digest travels with the archive, so it can be checked after an upload
+    or copy with `sha256sum -c` instead of trusting a separate re-hash.
+    """
+    with open(f"{archive_path}.sha256", 'w') as f:
+        f.write(f"{sha256}  {os.path.basename(archive_path)}\n")
+
+
+def _write_zip(output_zip, filepaths):
+    spool_dir = os.path.dirname(os.path.abspath(output_zip))
+    with open(output_zip, 'wb') as f, ThreadPoolExecutor(max_workers=COMPRESS_WORKERS) as pool:
+        writer = HashingWriter(f)
+        # Only a window of files is compressed ahead of the writer, so finished
+        # spool files (disk space and open handles) don't pile up on large databases
+        pending = deque()
+        remaining = iter(filepaths)
+        for filepath in itertools.islice(remaining, COMPRESS_WINDOW):
+            pending.append((filepath, pool.submit(_compress_member, filepath, spool_dir)))
+        file_hashes = {}
+        with zipfile.ZipFile(writer, 'w', zipfile.ZIP_DEFLATED, allowZip64=True) as zf:
+            while pending:
+                filepath, future = pending.popleft()
+                filename = os.path.basename(filepath)
                 print(f"    Adding: {filename}")
-                zf.write(filepath, filename)
+                member = future.result()
+                next_path = next(remaining, None)
+                if next_path is not None:
+                    pending.append((next_path, pool.submit(_compress_member, next_path, spool_dir)))
+                _append_member(zf, filepath, filename, member)
+                file_hashes[filename] = member[-1]
+    
+    return writer.sha256.hexdigest(), file_hashes
+
+
+def _write_tar_zst(output_path, filepaths):
+    """Stream a tar of *filepaths* through a multithreaded Zstandard compressor"""
+    if zstandard is None:
+        raise RuntimeError("The tar.zst format needs the 'zstandard' package (pip install zstandard)")
+    
+    file_hashes = {}
+    compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=-1)
+    with open(output_path, 'wb') as f:
+        writer = HashingWriter(f)
+        with compressor.stream_writer(writer, closefd=False) as zw, \
+                tarfile.open(fileobj=zw, mode='w|', format=tarfile.PAX_FORMAT) as tf:
+            for filepath in filepaths:
+                filename = os.path.basename(filepath)
+                print(f"    Adding: {filename}")
+                # Same fixed metadata as the zip members
+                tarinfo = tf.gettarinfo(filepath, filename)
+                tarinfo.mtime = ARCHIVE_MTIME
+                tarinfo.mode = ARCHIVE_FILE_MODE & 0o777
+                tarinfo.uid = tarinfo.gid = 0
+                tarinfo.uname = tarinfo.gname = ""
+                with open(filepath, 'rb') as src:
+                    reader = HashingReader(src)
+                    tf.addfile(tarinfo, reader)
+                file_hashes[filename] = reader.sha256.hexdigest()
+    
+    return writer.sha256.hexdigest(), file_hashes
+
+
+def package_blast_database(source_dir, output_zip, force=False):
+    """Package a BLAST database into a ZIP file and return its hashes (see write_archive)"""
+    print(f"  Packaging BLAST database from {source_dir}")
     
-    return output_zip
+    # scandir reports the entry type from the directory listing, without a stat per file
+    with os.scandir(source_dir) as entries:
+        filepaths = sorted(entry.path for entry in entries if entry.is_file())
+    return write_archive(output_zip, filepaths, force)
 
 
-def package_mmseqs_database(source_dir, output_zip, db_name):
-    """Package an MMseqs2 database into a ZIP file"""
+def package_mmseqs_database(source_dir, output_zip, db_name, force=False):
+    """Package an MMseqs2 database into a ZIP file and return its hashes (see write_archive)"""
     print(f"  Packaging MMseqs2 database '{db_name}' from {source_dir}")
     
     # MMseqs2 database files follow pattern: dbname, dbname.*, dbname_h, dbname_h.*
-    prefixes = [db_name, f"{db_name}_h"]
-    
-    files_added = 0
-    with zipfile.ZipFile(output_zip, 'w', zipfile.ZIP_DEFLATED) as zf:
-        for filename in os.listdir(source_dir):
-            filepath = os.path.join(source_dir, filename)
-            if os.path.isfile(filepath):
-                # Check if file belongs to this database
-                for prefix in prefixes:
-                    if filename == prefix or filename.startswith(f"{prefix}."):
-                        print(f"    Adding: {filename}")
-                        zf.write(filepath, filename)
-                        files_added += 1
-                        break
-    
-    if files_added == 0:
+    member_re = re.compile(rf"{re.escape(db_name)}(?:_h)?(?:\..*)?", re.DOTALL)
+    
+    with os.scandir(source_dir) as entries:
+        filepaths = sorted(
+            entry.path for entry in entries
+            if member_re.fullmatch(entry.name) and entry.is_file()
+        )
+    
+    if not filepaths:
         print(f"  [WARNING] No files found for database '{db_name}'")
-        os.remove(output_zip)
         return None
     
-    return output_zip
+    return write_archive(output_zip, filepaths, force)
+
+
+def s3_folder(db_id):
+    """S3 folder shared by the BLAST and MMseqs2 builds of a database"""
+    return db_id.removesuffix("_blast").removesuffix("_mmseqs")
 
 
 def list_databases():
@@ -131,8 +511,17 @@ def list_databases():
     print(f"{'ID':<20} {'Name':<30} {'Source Exists':<15} {'Recommended'}")
     print("-" * 80)
     
+    # One listing per parent directory instead of a stat per database
+    existing_dirs = set()
+    for parent in {os.path.dirname(info["source_dir"]) for info in AVAILABLE_DATABASES.values()}:
+        try:
+            with os.scandir(parent) as entries:
+                existing_dirs.update(entry.path for entry in entries if entry.is_dir())
+        except OSError:
+            pass
+    
     for db_id, db_info in AVAILABLE_DATABASES.items():
-        exists = os.path.exists(db_info["source_dir"])
+        exists = db_info["source_dir"] in existing_dirs
         recommended = "Yes (small)" if db_info["recommended_for_s3"] else "No (large)"
         status = "Yes" if exists else "No"
         print(f"{db_id:<20} {db_info['display_name']:<30} {status:<15} {recommended}")
@@ -143,8 +532,26 @@ def list_databases():
     print("  python package_databases.py --all")
 
 
-def package_database(db_id):
-    """Package a single database"""
+def confirm_large_database(db_info):
+    """Ask before packaging a database that is not recommended for S3"""
+    if db_info["recommended_for_s3"]:
+        return True
+    print(f"\n[WARNING] {db_info['display_name']} is large and not recommended for S3 hosting.")
+    print("Consider using the 'installer' distribution type instead.")
+    response = input("Continue anyway? (y/N): ").strip().lower()
+    if response != 'y':
+        print("Skipped.")
+        return False
+    return True
+
+
+def package_database(db_id, confirmed=False, force=False, archive_format='zip'):
+    """
+    Package a single database as one of ARCHIVE_FORMATS.
+    
+    *confirmed* skips the large-database prompt; *force* rebuilds the
+    archive even if its source files are unchanged.
+    """
     if db_id not in AVAILABLE_DATABASES:
         print(f"[ERROR] Unknown database: {db_id}")
         print(f"Available: {', '.join(AVAILABLE_DATABASES.keys())}")
@@ -158,32 +565,31 @@ def package_database(db_id):
         return None
     
     # Warn about large databases
-    if not db_info["recommended_for_s3"]:
-        print(f"\n[WARNING] {db_info['display_name']} is large and not recommended for S3 hosting.")
-        print("Consider using the 'installer' distribution type instead.")
-        response = input("Continue anyway? (y/N): ").strip().lower()
-        if response != 'y':
-            print("Skipped.")
-            return None
+    if not confirmed and not confirm_large_database(db_info):
+        return None
     
-    output_zip = os.path.join(OUTPUT_DIR, db_info["output_name"])
+    output_name = db_info["output_name"]
+    if archive_format != 'zip':
+        output_name = output_name.removesuffix('.zip') + f'.{archive_format}'
+    output_zip = os.path.join(OUTPUT_DIR, output_name)
     
     print(f"\nPackaging: {db_info['display_name']}")
     
+    # The archive is hashed while it is written, so it is never read back
     if db_info["type"] == "blast":
-        result = package_blast_database(source_dir, output_zip)
+        hashes = package_blast_database(source_dir, output_zip, force)
     elif db_info["type"] == "mmseqs":
-        result = package_mmseqs_database(source_dir, output_zip, db_info["db_name"])
+        hashes = package_mmseqs_database(source_dir, output_zip, db_info["db_name"], force)
     else:
         print(f"[ERROR] Unknown database type: {db_info['type']}")
         return None
     
-    if result is None:
+    if hashes is None:
         return None
+    sha256, file_hashes = hashes
     
     # Calculate stats
     file_size = os.path.getsize(output_zip)
-    sha256 = calculate_sha256(output_zip)
     
     print(f"  [OK] Created: {output_zip}")
     print(f"  [OK] Size: {format_size(file_size)}")
@@ -193,11 +599,15 @@ def package_database(db_id):
         "id": db_id,
         "display_name": db_info["display_name"],
         "file": output_zip,
-        "filename": db_info["output_name"],
+        "filename": output_name,
         "size_bytes": file_size,
         "size_gb": round(file_size / (1024 * 1024 * 1024), 3),
         "sha256": sha256,
-        "type": db_info["type"]
+        # Per-file hashes let a client verify individual files after extraction
+        "files": file_hashes,
+        "type": db_info["type"],
+        # A ZIP's SHA256 is only reproducible with the same deflate backend
+        "deflate_backend": deflate_backend_id() if archive_format == 'zip' else None
     }
 
 
@@ -206,9 +616,19 @@ def main():
     parser.add_argument("--list", action="store_true", help="List available databases")
     parser.add_argument("--db", nargs="+", help="Database IDs to package")
     parser.add_argument("--all", action="store_true", help="Package all recommended databases")
+    parser.add_argument("--yes", action="store_true", help="Package large databases without asking")
+    parser.add_argument("--force", action="store_true", help="Rebuild archives even if their sources are unchanged")
+    parser.add_argument("--format", choices=ARCHIVE_FORMATS, default="zip",
+                        help="Archive format (tar.zst needs the zstandard package)")
+    parser.add_argument("--fast-deflate", action="store_true",
+                        help="Compress with libdeflate if installed (faster, but the archive "
+                             "SHA256 then differs from a zlib build of the same files)")
     
     args = parser.parse_args()
     
+    global USE_LIBDEFLATE
+    USE_LIBDEFLATE = args.fast_deflate
+    
     if args.list:
         list_databases()
         return
@@ -218,6 +638,12 @@ def main():
     print("=" * 60)
     print(f"Version: {VERSION}")
     print(f"Output directory: {OUTPUT_DIR}")
+    print(f"SHA256 backend: {describe_hash_backend()}")
+    print(f"Deflate backend: {describe_deflate_backend()}")
+    
+    if args.format == 'tar.zst' and zstandard is None:
+        print("\n[ERROR] --format tar.zst needs the 'zstandard' package (pip install zstandard)")
+        return
     
     # Create output directory
     os.makedirs(OUTPUT_DIR, exist_ok=True)
@@ -244,11 +670,27 @@ def main():
     
     print(f"\nDatabases to package: {', '.join(db_ids)}")
     
-    results = []
+    # Ask about large databases up front; the packaging itself then runs unattended
+    approved = []
     for db_id in db_ids:
-        result = package_database(db_id)
-        if result:
-            results.append(result)
+        db_info = AVAILABLE_DATABASES.get(db_id)
+        if (db_info and not args.yes and os.path.exists(db_info["source_dir"])
+                and not confirm_large_database(db_info)):
+            continue
+        approved.append(db_id)
+    
+    # Databases are independent, so a few are packaged at once; one database's
+    # disk-bound stitching overlaps another's compression
+    results = []
+    if approved:
+        with ThreadPoolExecutor(max_workers=min(len(approved), PACKAGE_WORKERS)) as pool:
+            def package(db_id):
+                return package_database(db_id, confirmed=True, force=args.force,
+                                        archive_format=args.format)
+            
+            for result in pool.map(package, approved):
+                if result:
+                    results.append(result)
     
     # Summary
     if results:
@@ -282,26 +724,17 @@ def main():
         print("=" * 60)
         
         for r in results:
-            tool = "blast" if r["type"] == "blast" else "mmseqs"
-            db_folder = r["id"].replace("_blast", "").replace("_mmseqs", "")
-            print(f'''
-{{
-  "id": "{r['id']}",
-  "distribution": {{
-    "type": "s3",
-    "url": "https://sen-lab-protein-databases.s3.us-east-2.amazonaws.com/databases/{db_folder}/{VERSION}/{r['filename']}",
-    "sha256": "{r['sha256']}",
-    "compressed": true
-  }}
-}}''')
+            print(MANIFEST_SNIPPET.format(folder=s3_folder(r["id"]), version=VERSION, **r))
         
         print("\n" + "=" * 60)
         print("UPLOAD COMMANDS")
         print("=" * 60)
         print("\nUpload to S3 using AWS CLI:")
         for r in results:
-            db_folder = r["id"].replace("_blast", "").replace("_mmseqs", "")
-            print(f'aws s3 cp "{r["file"]}" s3://sen-lab-protein-databases/databases/{db_folder}/{VERSION}/{r["filename"]}')
+            destination = f's3://sen-lab-protein-databases/databases/{s3_folder(r["id"])}/{VERSION}/{r["filename"]}'
+            print(f'aws s3 cp "{r["file"]}" {destination}')
+            # The .sha256 sidecar goes next to the archive so downloads can be checked with sha256sum -c
+            print(f'aws s3 cp "{r["file"]}.sha256" {destination}.sha256')
     
     else:
         print("\nNo databases were packaged.")
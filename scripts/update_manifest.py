@@ -7,6 +7,7 @@ and updates the manifest file with new dates and versions.
 """
 
 import argparse
+import difflib
 import json
 import sys
 from datetime import datetime
@@ -117,6 +118,9 @@ def main():
     print(f"Updates available: {updates_info.get('updates_available')}")
     print()
     
+    # update_manifest() edits in place; keep the old serialization for the dry-run diff
+    original_lines = json.dumps(manifest, indent=2).splitlines() if args.dry_run else None
+    
     # Update manifest
     print("Applying updates...")
     updated_manifest = update_manifest(manifest, updates_info)
@@ -127,8 +131,16 @@ def main():
     
     if args.dry_run:
         print("\n[DRY RUN] Changes not saved.")
-        print("\nUpdated manifest would be:")
-        print(json.dumps(updated_manifest, indent=2)[:500] + "...")
+        print("\nChanges to the manifest:")
+        diff = difflib.unified_diff(
+            original_lines,
+            json.dumps(updated_manifest, indent=2).splitlines(),
+            fromfile=args.manifest,
+            tofile=f"{args.manifest} (updated)",
+            lineterm="",
+        )
+        for line in diff:
+            print(line)
     else:
         save_json(args.manifest, updated_manifest)
         print(f"\nManifest saved to: {args.manifest}")
@@ -7,6 +7,7 @@ import os
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import core.config_manager as config_manager_module
 import core.micromamba_manager as micromamba_manager_module
@@ -23,15 +24,6 @@ def is_macos():
     return sys.platform == "darwin"
 
 
-def check_command(cmd):
-    """Check if a command is available."""
-    try:
-        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        return True
-    except Exception:
-        return False
-
-
 def find_blast():
     """Try to find BLAST installation (cross-platform)."""
     if is_windows():
@@ -60,14 +52,9 @@ def find_blast():
         if os.path.exists(path):
             return path
 
-    found = shutil.which("blastp")
-    if found:
-        return found
-
-    if check_command(["blastp", "-version"]):
-        return "blastp"
-
-    return None
+    # which() searches PATH (trying each PATHEXT extension on Windows) without
+    # spawning the tool
+    return shutil.which("blastp")
 
 
 def find_mmseqs():
@@ -97,14 +84,7 @@ def find_mmseqs():
         if os.path.exists(path):
             return path
 
-    found = shutil.which("mmseqs")
-    if found:
-        return found
-
-    if check_command(["mmseqs", "--help"]):
-        return "mmseqs"
-
-    return None
+    return shutil.which("mmseqs")
 
 
 def find_clustalo():
@@ -118,22 +98,12 @@ def find_clustalo():
             if os.path.exists(path):
                 return path
 
-    if check_command(["clustalo", "--version"]):
-        return "clustalo"
-
     return None
 
 
 def find_blastdbcmd():
     """Try to find blastdbcmd."""
-    found = shutil.which("blastdbcmd")
-    if found:
-        return found
-
-    if check_command(["blastdbcmd", "-version"]):
-        return "blastdbcmd"
-
-    return None
+    return shutil.which("blastdbcmd")
 
 
 def check_wsl():
@@ -251,9 +221,14 @@ def collect_diagnostics(config_path="config.json"):
         "Biopython": _check_python_dependency("Bio"),
     }
 
+    # Each probe spawns processes (a WSL round trip on Windows), so run them side by side
+    with ThreadPoolExecutor(max_workers=len(TOOLS) + 1) as pool:
+        wsl_available = pool.submit(check_wsl) if is_windows() else None
+        statuses = dict(zip(TOOLS, pool.map(runtime.get_tool_status, TOOLS)))
+
     tool_diagnostics = {}
     for tool_id, spec in TOOLS.items():
-        status = runtime.get_tool_status(tool_id)
+        status = statuses[tool_id]
         tool_diagnostics[tool_id] = {
             "display_name": spec.display_name,
             "installed": status.installed,
@@ -274,7 +249,7 @@ def collect_diagnostics(config_path="config.json"):
         "managed_env_name": config.get_managed_env_name(),
         "preferred_tool_sources": config.get_preferred_tool_sources(),
         "tool_source_overrides": config.get_tool_source_overrides(),
-        "wsl_available": check_wsl() if is_windows() else None,
+        "wsl_available": wsl_available.result() if wsl_available else None,
         "tools": tool_diagnostics,
         "databases": _database_diagnostics(config),
         "config_path": os.path.abspath(config_path),
@@ -9,6 +9,22 @@ import pytest
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
+@pytest.fixture(autouse=True)
+def isolated_blast_result_cache(tmp_path, monkeypatch):
+    """Keep BLASTP result caching out of the user cache directory during tests"""
+    from core.blast_worker import BLASTWorker
+    monkeypatch.setattr(BLASTWorker, "RESULT_CACHE_DIR", str(tmp_path / "blastp_result_cache"))
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """A headless QApplication shared by tests that build widgets"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
 @pytest.fixture
 def tmp_dir(tmp_path):
     """Provide a clean temporary directory"""
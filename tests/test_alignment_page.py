@@ -0,0 +1,49 @@
+"""Tests for ui/alignment_page.py background worker bookkeeping"""
+import threading
+from unittest.mock import patch
+
+import pytest
+from PyQt5.QtCore import QEventLoop, QTimer
+
+
+def _spin_until(app, condition, timeout_ms=5000):
+    loop = QEventLoop()
+    timer = QTimer()
+    timer.timeout.connect(lambda: condition() and loop.quit())
+    timer.start(10)
+    QTimer.singleShot(timeout_ms, loop.quit)
+    loop.exec_()
+    timer.stop()
+    app.processEvents()
+
+
+@pytest.fixture
+def release():
+    """Hold every tool probe until the test sets the event"""
+    gate = threading.Event()
+
+    def probe(_tool_id):
+        gate.wait(5)
+        return True, "1.0", "/usr/bin/tool"
+
+    with patch("core.alignment_worker.check_alignment_tool_installation", side_effect=probe):
+        yield gate
+        gate.set()
+
+
+class TestSupersededWorkers:
+    def test_superseded_tool_check_is_tracked_until_finished(self, qapp, release):
+        from ui.alignment_page import AlignmentPage
+        page = AlignmentPage()
+        _spin_until(qapp, lambda: page.tool_check_worker is not None, 500)
+        page.check_system_requirements(refresh=True)
+        page.check_system_requirements(refresh=True)
+
+        running = [w for w in page._background_workers if w.isRunning()]
+        assert len(running) >= 2
+        assert page.tool_check_worker in page._background_workers
+
+        release.set()
+        _spin_until(qapp, lambda: not page._background_workers)
+        assert page._background_workers == set()
+        page.deleteLater()
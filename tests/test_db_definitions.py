@@ -1,4 +1,7 @@
+import pytest
+
 from core.db_definitions import (
+    NCBI_DATABASES,
     LOCAL_NUCLEOTIDE_DEFAULT,
     REMOTE_NUCLEOTIDE_DEFAULT,
     get_blastn_databases,
@@ -22,3 +25,10 @@ def test_blastn_default_database_depends_on_source():
 def test_remote_blastn_support_check():
     assert is_remote_blastn_database_supported("core_nt") is True
     assert is_remote_blastn_database_supported("16S_ribosomal_RNA") is False
+
+
+def test_database_tables_are_read_only():
+    with pytest.raises(TypeError):
+        NCBI_DATABASES["custom"] = "Custom database"
+    with pytest.raises(TypeError):
+        get_blastn_databases(False)["custom"] = "Custom database"
@@ -1,7 +1,10 @@
 """Tests for utils/fasta_parser.py"""
 import pytest
 
-from utils.fasta_parser import FastaParser, FastaSequence, FastaParseError, validate_amino_acid_sequence
+from utils.fasta_parser import (
+    FastaParser, FastaSequence, FastaParseError, STRIP_NON_LETTERS, strip_non_letters,
+    validate_amino_acid_sequence, invalid_residue_message, prepare_protein_queries,
+)
 
 
 class TestFastaSequence:
@@ -150,3 +153,41 @@ class TestValidateAminoAcidSequence:
     def test_invalid(self):
         ok, msg = validate_amino_acid_sequence("123")
         assert ok is False
+
+
+class TestStripNonLetters:
+    def test_removes_whitespace_digits_and_punctuation(self):
+        assert "1 MVHLT\tPEEK-10\r\nSAV*\xa0".translate(STRIP_NON_LETTERS) == "MVHLTPEEKSAV"
+
+    def test_removes_characters_beyond_latin1(self):
+        # Zero-width space, non-breaking hyphen, em dash and smart quotes from pasted text
+        assert strip_non_letters("MVH\u200bLT\u2011PE\u2014EK\u201cSAV\u201d") == "MVHLTPEEKSAV"
+
+
+class TestPrepareProteinQueries:
+    def test_bare_sequence_is_cleaned(self):
+        assert prepare_protein_queries("  mvhl tpe\n12 ekk\n") == "MVHLTPEEKK"
+
+    def test_zero_width_space_is_removed(self):
+        assert prepare_protein_queries("MVHL\u200bTPEEK") == "MVHLTPEEK"
+
+    def test_batch_is_rejoined(self):
+        text = ">seqA desc\nmvhl\ntpe\n>seqB\nMKTA\n"
+        assert prepare_protein_queries(text) == ">seqA desc\nMVHLTPE\n>seqB\nMKTA\n"
+
+    def test_empty_input_raises(self):
+        with pytest.raises(FastaParseError):
+            prepare_protein_queries(" \n 12 ")
+
+    def test_empty_record_names_its_id(self):
+        with pytest.raises(FastaParseError, match="Empty sequence: seqB"):
+            prepare_protein_queries(">seqA\nMVHL\n>seqB extra\n\n")
+
+    def test_invalid_residue_is_reported(self):
+        with pytest.raises(FastaParseError, match="seqA: Invalid residue B at position 3"):
+            prepare_protein_queries(">seqA\nMVBLZ\n")
+
+    def test_invalid_residue_message(self):
+        assert invalid_residue_message("MVHL") is None
+        assert invalid_residue_message("MXVB") == "Invalid residue X at position 2 (found: BX)"
+
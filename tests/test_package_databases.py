@@ -0,0 +1,153 @@
+"""Tests for scripts/package_databases.py archive writing"""
+import hashlib
+import importlib.util
+import os
+import zipfile
+import zlib
+
+import pytest
+
+
+_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                       "scripts", "package_databases.py")
+
+
+@pytest.fixture
+def packager(tmp_path, monkeypatch):
+    spec = importlib.util.spec_from_file_location("package_databases", _SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "PACKAGE_CACHE_PATH", str(tmp_path / ".package_cache.json"))
+    return module
+
+
+@pytest.fixture
+def db_files(tmp_path):
+    """A small database: compressible text, a dense .nsq file and an empty file"""
+    src = tmp_path / "src"
+    src.mkdir()
+    contents = {
+        "mydb.phr": b">sp|P69905| Hemoglobin subunit alpha\n" * 2000,
+        "mydb.nsq": os.urandom(50_000),
+        "mydb.pin": b"",
+    }
+    for name, data in contents.items():
+        (src / name).write_bytes(data)
+    paths = sorted(str(src / name) for name in contents)
+    return paths, contents
+
+
+class TestWriteArchive:
+    def test_zip_members_match_sources(self, packager, tmp_path, db_files):
+        paths, contents = db_files
+        output = str(tmp_path / "out" / "mydb.zip")
+        os.makedirs(os.path.dirname(output))
+
+        sha256, file_hashes = packager.write_archive(output, paths)
+
+        with zipfile.ZipFile(output) as zf:
+            assert zf.testzip() is None
+            assert zf.namelist() == sorted(contents)
+            for info in zf.infolist():
+                data = contents[info.filename]
+                assert info.file_size == len(data)
+                assert info.CRC == zlib.crc32(data)
+                assert zf.read(info.filename) == data
+            # Dense data is stored rather than deflated
+            assert zf.getinfo("mydb.nsq").compress_type == zipfile.ZIP_STORED
+            assert zf.getinfo("mydb.phr").compress_type == zipfile.ZIP_DEFLATED
+        assert file_hashes == {name: hashlib.sha256(data).hexdigest() for name, data in contents.items()}
+
+        with open(output, "rb") as f:
+            assert sha256 == hashlib.sha256(f.read()).hexdigest()
+        with open(f"{output}.sha256") as f:
+            assert f.read() == f"{sha256}  mydb.zip\n"
+
+    def test_unchanged_sources_reuse_archive_unless_forced(self, packager, tmp_path, db_files, monkeypatch):
+        paths, _ = db_files
+        output = str(tmp_path / "mydb.zip")
+        first = packager.write_archive(output, paths)
+        os.unlink(f"{output}.sha256")
+
+        calls = []
+        write_zip = packager._write_zip
+        monkeypatch.setattr(packager, "_write_zip", lambda *args: calls.append(args) or write_zip(*args))
+
+        assert packager.write_archive(output, paths) == first
+        assert calls == []
+        # A missing sidecar is restored from the cached digest
+        with open(f"{output}.sha256") as f:
+            assert f.read() == f"{first[0]}  mydb.zip\n"
+
+        assert packager.write_archive(output, paths, force=True) == first
+        assert len(calls) == 1
+
+    def test_changed_source_rebuilds_archive(self, packager, tmp_path, db_files):
+        paths, contents = db_files
+        output = str(tmp_path / "mydb.zip")
+        packager.write_archive(output, paths)
+
+        with open(os.path.join(os.path.dirname(paths[0]), "mydb.phr"), "ab") as f:
+            f.write(b">sp|P68871| Hemoglobin subunit beta\n")
+        sha256, file_hashes = packager.write_archive(output, paths)
+
+        with zipfile.ZipFile(output) as zf:
+            assert zf.testzip() is None
+            assert zf.read("mydb.phr").endswith(b"beta\n")
+        with open(output, "rb") as f:
+            assert sha256 == hashlib.sha256(f.read()).hexdigest()
+        assert file_hashes["mydb.phr"] != hashlib.sha256(contents["mydb.phr"]).hexdigest()
+
+    def test_zlib_is_the_default_backend(self, packager, tmp_path, db_files, monkeypatch):
+        paths, _ = db_files
+        calls = []
+
+        def deflate_compress(data, level):
+            calls.append(level)
+            compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+            return compressor.compress(data) + compressor.flush()
+
+        fake_deflate = type("FakeDeflate", (), {"deflate_compress": staticmethod(deflate_compress)})
+        monkeypatch.setattr(packager, "deflate", fake_deflate)
+
+        packager.write_archive(str(tmp_path / "mydb.zip"), paths)
+        assert calls == []
+        assert packager.deflate_backend_id().startswith("zlib ")
+
+        monkeypatch.setattr(packager, "USE_LIBDEFLATE", True)
+        assert packager.deflate_backend_id().startswith("libdeflate")
+        # Switching backend invalidates the cached archive
+        packager.write_archive(str(tmp_path / "mydb.zip"), paths)
+        assert calls
+        with zipfile.ZipFile(tmp_path / "mydb.zip") as zf:
+            assert zf.testzip() is None
+
+    def test_compression_runs_at_most_a_window_ahead(self, packager, tmp_path, monkeypatch):
+        src = tmp_path / "many"
+        src.mkdir()
+        paths = []
+        for i in range(12):
+            path = src / f"mydb.{i:02d}"
+            path.write_bytes(b"ACDEFGHIKLMNPQRSTVWY" * 100)
+            paths.append(str(path))
+        monkeypatch.setattr(packager, "COMPRESS_WINDOW", 3)
+
+        started = []
+        appended = []
+        compress_member = packager._compress_member
+        append_member = packager._append_member
+        monkeypatch.setattr(packager, "_compress_member",
+                            lambda filepath, spool_dir: started.append(filepath) or compress_member(filepath, spool_dir))
+
+        def record_append(zf, filepath, arcname, member):
+            # The file being appended plus at most COMPRESS_WINDOW submitted after it
+            assert len(started) - len(appended) <= 1 + 3
+            appended.append(filepath)
+            append_member(zf, filepath, arcname, member)
+
+        monkeypatch.setattr(packager, "_append_member", record_append)
+        packager.write_archive(str(tmp_path / "many.zip"), paths)
+
+        assert appended == paths
+        with zipfile.ZipFile(tmp_path / "many.zip") as zf:
+            assert zf.testzip() is None
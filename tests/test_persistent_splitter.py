@@ -0,0 +1,61 @@
+"""Tests for ui/widgets/persistent_splitter.py"""
+import pytest
+
+
+@pytest.fixture
+def settings_file(tmp_path, monkeypatch):
+    """Point the splitter's QSettings at an INI file instead of the user's settings"""
+    from PyQt5.QtCore import QSettings
+    import ui.widgets.persistent_splitter as module
+
+    path = str(tmp_path / "settings.ini")
+    monkeypatch.setattr(module, "QSettings", lambda *_: QSettings(path, QSettings.IniFormat))
+    return path
+
+
+def make_splitter(qapp):
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel
+    from ui.widgets.persistent_splitter import PersistentSplitter
+
+    window = QWidget()
+    splitter = PersistentSplitter(Qt.Vertical, "test_splitter")
+    splitter.addWidget(QLabel("top"))
+    splitter.addWidget(QLabel("bottom"))
+    QVBoxLayout(window).addWidget(splitter)
+    window.resize(300, 400)
+    return window, splitter
+
+
+class TestPersistentSplitter:
+    def test_drag_is_saved_once_after_the_delay(self, qapp, settings_file):
+        from PyQt5.QtCore import QSettings
+        window, splitter = make_splitter(qapp)
+        splitter.restore_state([100, 300])
+        window.show()
+
+        for pos in (120, 140, 160):
+            splitter.moveSplitter(pos, 1)
+        assert not QSettings(settings_file, QSettings.IniFormat).contains("test_splitter")
+
+        splitter._save_timer.timeout.emit()
+        assert QSettings(settings_file, QSettings.IniFormat).contains("test_splitter")
+        window.close()
+
+    def test_pending_save_is_flushed_when_the_window_closes(self, qapp, settings_file):
+        from PyQt5.QtCore import QSettings
+        window, splitter = make_splitter(qapp)
+        splitter.restore_state([100, 300])
+        window.show()
+
+        splitter.moveSplitter(150, 1)
+        sizes = splitter.sizes()
+        assert splitter._save_timer.isActive()
+        window.close()
+
+        assert not splitter._save_timer.isActive()
+        window, restored = make_splitter(qapp)
+        restored.restore_state([100, 300])
+        window.show()
+        assert restored.sizes() == sizes
+        window.close()
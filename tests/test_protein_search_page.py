@@ -0,0 +1,68 @@
+"""Tests for ui/protein_search_page.py startup behaviour"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PyQt5.QtCore import QEventLoop, QTimer
+
+
+def _spin(app, ms):
+    loop = QEventLoop()
+    QTimer.singleShot(ms, loop.quit)
+    loop.exec_()
+    app.processEvents()
+
+
+@pytest.fixture
+def page(qapp):
+    runtime = MagicMock()
+    runtime.get_missing_tools_for_feature.return_value = []
+    runtime.get_tool_status.return_value = MagicMock(version="15.6")
+    with patch("ui.protein_search_page.get_tool_runtime", return_value=runtime):
+        from ui.protein_search_page import ProteinSearchPage
+        page = ProteinSearchPage()
+        yield page
+        page.deleteLater()
+
+
+class TestMMseqsDatabaseGroup:
+    def test_startup_timers_run_before_group_is_built(self, qapp, page):
+        _spin(qapp, 700)
+        assert not page._mmseqs_db_built
+        assert not hasattr(page, "mmseqs_info_label")
+
+    def test_requirements_checked_after_group_is_built(self, qapp, page):
+        page.diamond_radio.setChecked(True)
+        assert page._mmseqs_db_built
+        _spin(qapp, 50)
+        assert "MMseqs2 ready (15.6)" in page.mmseqs_info_label.text()
+
+
+class TestBlastCancel:
+    def test_cancel_button_stops_search_and_restores_run(self, page):
+        worker = MagicMock()
+        worker.isRunning.return_value = True
+        page.blast_worker = worker
+        page.process_button.setEnabled(False)
+        page.cancel_button.setEnabled(True)
+
+        page.cancel_button.click()
+
+        worker.cancel.assert_called_once_with()
+        assert not page.cancel_button.isEnabled()
+        page._on_search_cancelled()
+        assert page.process_button.isEnabled()
+        assert page.cancel_button.isHidden()
+
+    def test_query_info_describes_the_submitted_query(self, page):
+        page.remote_radio.setChecked(True)
+        page.input_text.setPlainText(">q1\nMVHLTPEEK\n>q2\nMVLSPADKT\n")
+        with patch("ui.protein_search_page.BLASTWorker") as worker_cls:
+            worker_cls.return_value.isRunning.return_value = False
+            page._run_blast()
+
+        # Editing the input while blastp runs must not change the reported query
+        page.input_text.setPlainText(">other\nMKT\n")
+        page._on_blast_finished("", [])
+
+        assert page.current_query_info["query_name"] == "2 queries"
+        assert page.current_query_info["query_length"] == str(len(">q1\nMVHLTPEEK\n>q2\nMVLSPADKT"))
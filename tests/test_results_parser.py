@@ -1,7 +1,30 @@
 """Tests for utils/results_parser.py"""
 import pytest
 
-from utils.results_parser import SearchHit, BLASTResultsParser, MMSeqsResultsParser
+from utils.results_parser import (
+    SearchHit, BLASTResultsParser, MMSeqsResultsParser, distinct_query_ids, rank_hits,
+)
+
+
+class TestQueryGrouping:
+    def _batch(self):
+        return [
+            SearchHit(rank=1, accession="A1", evalue=1e-10, query_id="seqA"),
+            SearchHit(rank=2, accession="A2", evalue=1e-30, query_id="seqA"),
+            SearchHit(rank=1, accession="B1", evalue=1e-50, query_id="seqB"),
+            SearchHit(rank=2, accession="B2", evalue=1e-5, query_id="seqB"),
+        ]
+
+    def test_distinct_query_ids_in_first_seen_order(self):
+        assert distinct_query_ids(self._batch()) == ["seqA", "seqB"]
+        assert distinct_query_ids([SearchHit(query_id=""), SearchHit(query_id="")]) == []
+
+    def test_rank_hits_keeps_queries_apart(self):
+        hits = self._batch()
+        rank_hits(hits, key=lambda h: h.evalue)
+        assert [(h.query_id, h.accession, h.rank) for h in hits] == [
+            ("seqA", "A2", 1), ("seqA", "A1", 2), ("seqB", "B1", 1), ("seqB", "B2", 2),
+        ]
 
 
 class TestSearchHit:
@@ -39,6 +62,25 @@ class TestBLASTResultsParser:
         hits = BLASTResultsParser.parse_xml("/nonexistent/file.xml")
         assert hits == []
 
+    def test_parse_xml_batch_tags_hits_with_query(self, tmp_path):
+        hit = (
+            "<Hit><Hit_id>sp|P69905|HBA_HUMAN</Hit_id><Hit_def>Hemoglobin alpha</Hit_def>"
+            "<Hit_len>142</Hit_len><Hit_hsps><Hsp><Hsp_evalue>1e-50</Hsp_evalue>"
+            "<Hsp_bit-score>200</Hsp_bit-score><Hsp_identity>100</Hsp_identity>"
+            "<Hsp_align-len>100</Hsp_align-len><Hsp_query-from>1</Hsp_query-from>"
+            "<Hsp_query-to>100</Hsp_query-to></Hsp></Hit_hsps></Hit>"
+        )
+        iterations = "".join(
+            f"<Iteration><Iteration_query-def>{name} test protein</Iteration_query-def>"
+            f"<Iteration_query-len>100</Iteration_query-len><Iteration_hits>{hit}</Iteration_hits></Iteration>"
+            for name in ("seqA", "seqB")
+        )
+        xml = tmp_path / "batch.xml"
+        xml.write_text(f"<BlastOutput><BlastOutput_iterations>{iterations}</BlastOutput_iterations></BlastOutput>")
+
+        hits = BLASTResultsParser.parse_xml(str(xml))
+        assert [(h.query_id, h.rank) for h in hits] == [("seqA", 1), ("seqB", 1)]
+
     def test_extract_accession_genbank(self):
         acc = BLASTResultsParser._extract_accession("ref|NP_000509.1|", "hemoglobin")
         assert acc == "000509.1"
@@ -0,0 +1,27 @@
+"""Tests for ui/widgets/searchable_combobox.py filtering"""
+import pytest
+
+
+@pytest.fixture
+def combo(qapp):
+    from ui.widgets.searchable_combobox import SearchableComboBox
+    combo = SearchableComboBox()
+    combo.setItems({"swissprot": "Curated protein sequences", "nr": "Non-redundant protein sequences"})
+    yield combo
+    combo.deleteLater()
+
+
+class TestFilterItems:
+    def test_matches_name_or_description(self, combo):
+        combo.filter_items("SWISS")
+        assert [combo.itemText(i) for i in range(combo.count())] == ["swissprot"]
+        combo.filter_items("non-redundant")
+        assert [combo.itemText(i) for i in range(combo.count())] == ["nr"]
+        combo.filter_items("")
+        assert combo.count() == 2
+
+    def test_does_not_match_across_name_and_description(self, combo):
+        combo.filter_items("protcurated")
+        assert combo.count() == 0
+        combo.filter_items("prot\0curated")
+        assert combo.count() == 0
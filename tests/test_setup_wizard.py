@@ -11,7 +11,6 @@ from setup_wizard import (
     find_mmseqs,
     find_clustalo,
     find_blastdbcmd,
-    check_command,
     collect_diagnostics,
     main,
     get_install_hint,
@@ -30,17 +29,6 @@ class TestPlatformDetection:
         assert is_macos() == (sys.platform == "darwin")
 
 
-class TestCheckCommand:
-    @patch("setup_wizard.subprocess.run")
-    def test_returns_true_on_success(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=0)
-        assert check_command(["echo", "test"]) is True
-
-    @patch("setup_wizard.subprocess.run", side_effect=FileNotFoundError)
-    def test_returns_false_on_missing(self, mock_run):
-        assert check_command(["nonexistent"]) is False
-
-
 class TestFindBlast:
     @patch("setup_wizard.is_windows", return_value=False)
     @patch("setup_wizard.is_macos", return_value=True)
@@ -54,11 +42,19 @@ class TestFindBlast:
     @patch("setup_wizard.is_macos", return_value=True)
     @patch("setup_wizard.os.path.exists", return_value=False)
     @patch("setup_wizard.shutil.which", return_value=None)
-    @patch("setup_wizard.check_command", return_value=False)
     def test_not_found(self, *_):
         result = find_blast()
         assert result is None
 
+    @patch("setup_wizard.is_windows", return_value=False)
+    @patch("setup_wizard.is_macos", return_value=False)
+    @patch("setup_wizard.os.path.exists", return_value=False)
+    @patch("setup_wizard.shutil.which", return_value=None)
+    @patch("setup_wizard.subprocess.run")
+    def test_not_found_without_launching_anything(self, mock_run, *_):
+        assert find_blast() is None
+        mock_run.assert_not_called()
+
 
 class TestFindMmseqs:
     @patch("setup_wizard.is_windows", return_value=False)
@@ -78,7 +74,6 @@ class TestFindClustalo:
 
     @patch("setup_wizard.shutil.which", return_value=None)
     @patch("setup_wizard.is_macos", return_value=False)
-    @patch("setup_wizard.check_command", return_value=False)
     def test_not_found(self, *_):
         result = find_clustalo()
         assert result is None
@@ -90,7 +85,6 @@ class TestFindBlastdbcmd:
         assert find_blastdbcmd() == "/usr/local/bin/blastdbcmd"
 
     @patch("setup_wizard.shutil.which", return_value=None)
-    @patch("setup_wizard.check_command", return_value=False)
     def test_not_found(self, *_):
         assert find_blastdbcmd() is None
 
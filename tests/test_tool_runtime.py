@@ -53,3 +53,13 @@ class TestToolRuntime:
             assert "not available" in str(exc)
         else:
             raise AssertionError("Expected ToolRuntimeError for unsupported managed install")
+
+    def test_popen_resolved_wraps_wsl_backend(self, tmp_path, monkeypatch):
+        runtime = _fresh_runtime(tmp_path)
+        launched = []
+        monkeypatch.setattr(tool_runtime_module.subprocess, "Popen", lambda cmd, **kw: launched.append(cmd))
+
+        runtime.popen_resolved(tool_runtime_module.ToolResolution("mmseqs", "wsl", "mmseqs", "wsl"), ["search"])
+        runtime.popen_resolved(tool_runtime_module.ToolResolution("mmseqs", "system", "/usr/bin/mmseqs", "native"), ["search"])
+
+        assert launched == [["wsl", "mmseqs", "search"], ["/usr/bin/mmseqs", "search"]]
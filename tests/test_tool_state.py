@@ -1,5 +1,7 @@
 """Tests for core/tool_state.py."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 from core.tool_state import ToolStateStore, ToolStatus
 
 
@@ -30,3 +32,17 @@ class TestToolStateStore:
         assert status.source == "managed"
         assert status.executable_path == "/tmp/mmseqs"
         assert status.last_checked is not None
+
+    def test_concurrent_updates_are_all_persisted(self, tmp_path):
+        state_path = tmp_path / "tool_state.json"
+        store = ToolStateStore(state_file=str(state_path))
+        tool_ids = [f"tool{i}" for i in range(16)]
+
+        def update(tool_id):
+            store.update(tool_id, installed=True, version="1.0", source="system", executable_path=None)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(update, tool_ids))
+
+        reloaded = ToolStateStore(state_file=str(state_path))
+        assert all(reloaded.get(tool_id).installed for tool_id in tool_ids)
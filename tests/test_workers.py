@@ -1,12 +1,18 @@
 """Tests for worker command construction and logic (mocked subprocess calls)"""
 import os
 import tempfile
+import zipfile
 from unittest.mock import patch, MagicMock, call
 import pytest
+from PyQt5.QtCore import Qt
 
 from core.blast_worker import BLASTWorker
 from core.blastn_worker import BLASTNWorker
-from core.alignment_worker import check_clustalo_installation, AlignmentWorker, SequenceAlignmentPrep
+from core.database_download_worker import DatabaseDownloadWorker
+from core.alignment_worker import (
+    check_clustalo_installation, AlignmentWorker, SequenceAlignmentPrep,
+    format_alignment, parse_alignment,
+)
 
 
 # ── check_clustalo_installation ──────────────────────────────────────
@@ -94,11 +100,124 @@ class TestSequenceAlignmentPrep:
         assert valid is False
         assert count == 1
 
+    def test_validate_gt_inside_header_is_not_a_second_sequence(self, tmp_path):
+        fasta = tmp_path / "one.fasta"
+        fasta.write_text(">single desc->x\nMVHLTPEEK\n")
+        valid, msg, count = SequenceAlignmentPrep.validate_fasta_for_alignment(str(fasta))
+        assert valid is False
+        assert count == 1
+
+    def test_validate_empty_file(self, tmp_path):
+        fasta = tmp_path / "empty.fasta"
+        fasta.write_text("")
+        valid, msg, count = SequenceAlignmentPrep.validate_fasta_for_alignment(str(fasta))
+        assert (valid, count) == (False, 0)
+
+    def test_validate_rescans_only_after_the_file_changes(self, tmp_path):
+        fasta = tmp_path / "pair.fasta"
+        fasta.write_text(">a\nMVHL\n>b\nMVHLTP\n")
+        with patch("builtins.open", wraps=open) as mock_open:
+            SequenceAlignmentPrep.validate_fasta_for_alignment(str(fasta))
+            valid, msg, count = SequenceAlignmentPrep.validate_fasta_for_alignment(str(fasta), max_sequences=100)
+            assert mock_open.call_count == 1
+        assert (valid, count) == (True, 2)
+
+        fasta.write_text(">a\nMVHL\n>b\nMVHLTP\n>c\nMV\n")
+        valid, msg, count = SequenceAlignmentPrep.validate_fasta_for_alignment(str(fasta))
+        assert count == 3
+        assert "2-6" in msg
+
     def test_validate_nonexistent(self):
         valid, msg, count = SequenceAlignmentPrep.validate_fasta_for_alignment("/no/file")
         assert valid is False
 
 
+# ── AlignmentWorker cancellation ─────────────────────────────────────
+
+class TestAlignmentWorkerCancel:
+    def test_cancel_terminates_running_aligner(self, tmp_path):
+        import sys
+        import threading
+        import time
+        from core.alignment_worker import AlignmentError
+        worker = AlignmentWorker(str(tmp_path / "in.fasta"))
+        resolution = MagicMock(executable=sys.executable, backend="native")
+
+        timer = threading.Timer(0.3, worker.cancel)
+        timer.start()
+        started = time.monotonic()
+        with pytest.raises(AlignmentError):
+            worker._run_subprocess_with_live_feedback(
+                resolution, ["-c", "import time; time.sleep(30)"], 60, "Test"
+            )
+        timer.join()
+        assert time.monotonic() - started < 10
+        assert worker._current_proc is None
+
+    @patch("core.alignment_worker.get_tool_runtime")
+    def test_cancel_after_finished_does_not_emit_cancelled(self, mock_runtime_factory, tmp_path):
+        fasta = tmp_path / "in.fasta"
+        fasta.write_text(">a\nMV\n>b\nMV\n")
+        mock_runtime_factory.return_value.resolve_tool.return_value = MagicMock(
+            executable="/usr/bin/clustalo", backend="native")
+        worker = AlignmentWorker(str(fasta))
+        events = []
+        # cancel() lands between finished and the end of run()
+        worker.finished.connect(lambda *_: (events.append("finished"), worker.cancel()))
+        worker.cancelled.connect(lambda: events.append("cancelled"))
+
+        with patch.object(worker, "_prepare_native_temp", return_value=str(fasta)), \
+                patch.object(worker, "_run_aligner", return_value=">a\nMV\n>b\nMV\n"), \
+                patch.object(worker, "_save_output", return_value=str(tmp_path / "out.fasta")):
+            worker.run()
+
+        assert events == ["finished"]
+
+
+# ── Alignment format conversion ──────────────────────────────────────
+
+class TestAlignmentFormatConversion:
+    def test_fasta_round_trips_through_clustal(self):
+        msa = parse_alignment(">a\nMV-L\n>b\nMVHL\n", "fasta")
+        clustal = format_alignment(msa, "clustal")
+        assert clustal.startswith("CLUSTAL")
+
+        back = format_alignment(parse_alignment(clustal, "clustal"), "fasta")
+        assert back == ">a\nMV-L\n>b\nMVHL\n"
+
+    def test_unknown_format_raises(self):
+        with pytest.raises(ValueError):
+            parse_alignment(">a\nMV\n>b\nMV\n", "nexus")
+
+
+# ── BLASTWorker XML formatting ───────────────────────────────────────
+
+class TestBLASTWorkerParseXml:
+    def test_formats_hits(self, sample_blast_xml_file):
+        html = BLASTWorker("MVHLT", "swissprot").parse_blast_xml(sample_blast_xml_file)
+        assert "Found 2 significant alignment(s)" in html
+        assert "#1. ref|NP_000509.1| hemoglobin subunit beta [Homo sapiens]" in html
+        assert "#2. sp|P02023|HBB_MOUSE Hemoglobin subunit beta [Mus musculus]" in html
+        assert "140/147 (95.2%)" in html
+
+    def test_no_hits(self, tmp_path):
+        xml = tmp_path / "empty.xml"
+        xml.write_text(
+            "<BlastOutput><BlastOutput_db>pdb</BlastOutput_db><BlastOutput_iterations>"
+            "<Iteration><Iteration_query-def>q</Iteration_query-def>"
+            "<Iteration_hits></Iteration_hits></Iteration></BlastOutput_iterations></BlastOutput>"
+        )
+        html = BLASTWorker("MVHLT", "pdb").parse_blast_xml(str(xml))
+        assert "No significant alignments found." in html
+        assert "<b>Database:</b> pdb" in html
+
+    def test_malformed_xml(self, tmp_path):
+        xml = tmp_path / "bad.xml"
+        xml.write_text("<BlastOutput><Iteration>")
+        html = BLASTWorker("MVHLT", "pdb").parse_blast_xml(str(xml))
+        assert "Error parsing BLAST results" in html
+
+
 # ── MMseqsWorker sensitivity mapping ─────────────────────────────────
 
 class TestMMseqsWorkerParams:
@@ -125,6 +244,73 @@ class TestMMseqsWorkerParams:
         assert w.get_identity_color("20") == "#e74c3c"
         assert w.get_identity_color("bad") == "#7f8c8d"
 
+    def test_format_results_shows_top_20_of_all(self, tmp_path):
+        from core.mmseqs_runner import MMseqsWorker
+        m8 = tmp_path / "results.m8"
+        m8.write_text("".join(
+            f"query\tP{i:05d}\tdesc {i}\t90.0\t100\t10\t0\t1\t100\t1\t100\t1e-30\t200\n"
+            for i in range(25)
+        ))
+        html = MMseqsWorker("MVHLT", "/db/path").format_results(str(m8), "", "")
+        assert "Found 25 alignment(s)" in html
+        assert "showing top 20" in html
+        assert "#20. desc 19" in html
+        assert "#21." not in html
+
+    def test_run_search_streams_log_as_progress(self):
+        import subprocess
+        import sys
+        from core.mmseqs_runner import MMseqsWorker
+        runtime = MagicMock()
+        runtime.popen_resolved.side_effect = lambda _resolution, _args, **kw: subprocess.Popen(
+            [sys.executable, "-c", "import sys; print('prefilter'); print('align', file=sys.stderr); sys.exit(3)"],
+            **kw,
+        )
+        w = MMseqsWorker("MVHLT", "/db/path")
+        w.SEARCH_LOG_TAIL = 1
+        lines = []
+        w.progress.connect(lines.append)
+
+        returncode, tail = w._run_search(runtime, MagicMock(), ["search"])
+
+        assert returncode == 3
+        assert sorted(lines) == ["align", "prefilter"]
+        assert tail in ("align", "prefilter")
+
+    def test_run_search_throttles_progress(self):
+        import subprocess
+        import sys
+        from core.mmseqs_runner import MMseqsWorker
+        runtime = MagicMock()
+        runtime.popen_resolved.side_effect = lambda _resolution, _args, **kw: subprocess.Popen(
+            [sys.executable, "-c", "for i in range(2000): print(f'step {i}')"], **kw
+        )
+        w = MMseqsWorker("MVHLT", "/db/path")
+        w.PROGRESS_INTERVAL = 60
+        lines = []
+        w.progress.connect(lines.append)
+
+        returncode, tail = w._run_search(runtime, MagicMock(), ["search"])
+
+        assert returncode == 0
+        # The first line right away, then only the final one
+        assert lines == ["step 0", "step 1999"]
+        assert tail.endswith("step 1999")
+
+    def test_run_search_times_out(self):
+        import subprocess
+        import sys
+        from core.mmseqs_runner import MMseqsWorker
+        runtime = MagicMock()
+        runtime.popen_resolved.side_effect = lambda _resolution, _args, **kw: subprocess.Popen(
+            [sys.executable, "-c", "import time; time.sleep(30)"], **kw
+        )
+        w = MMseqsWorker("MVHLT", "/db/path")
+        w.SEARCH_TIMEOUT = 0.2
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            w._run_search(runtime, MagicMock(), ["search"])
+
 
 class TestRuntimeIntegratedWorkers:
     @patch("core.blast_worker.BLASTResultsParser.parse_xml", return_value=[])
@@ -142,7 +328,9 @@ class TestRuntimeIntegratedWorkers:
         resolution = MagicMock(executable="/managed/blastp", backend="native")
         runtime.resolve_tool.return_value = resolution
         runtime.prepare_path.side_effect = lambda _resolution, path: path
-        runtime.run_resolved.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        process = runtime.popen_resolved.return_value
+        process.communicate.return_value = ("", "")
+        process.returncode = 0
         mock_runtime_factory.return_value = runtime
 
         worker = BLASTWorker("MVHLTPEEKSAVTAL", "swissprot", use_remote=True)
@@ -152,9 +340,156 @@ class TestRuntimeIntegratedWorkers:
         worker.run()
 
         runtime.resolve_tool.assert_called_once_with("blastp")
-        assert runtime.run_resolved.called
+        assert runtime.popen_resolved.called
+        args = runtime.popen_resolved.call_args[0][1]
+        assert args[args.index("-max_hsps") + 1] == "1"
+        assert args[args.index("-query") + 1] == "-"
+        process.communicate.assert_called_once_with(">query\nMVHLTPEEKSAVTAL\n")
         assert finished_payload == [("<html></html>", [])]
 
+    @patch("core.blast_worker.BLASTResultsParser.parse_xml", return_value=[])
+    @patch.object(BLASTWorker, "parse_blast_xml", return_value="<html></html>")
+    @patch("core.blast_worker.get_tool_runtime")
+    def test_blast_worker_submits_fasta_batch_in_one_run(
+        self, mock_runtime_factory, _mock_parse_html, _mock_parse_structured
+    ):
+        runtime = MagicMock()
+        runtime.resolve_tool.return_value = MagicMock(executable="/managed/blastp", backend="native")
+        runtime.prepare_path.side_effect = lambda _resolution, path: path
+        process = runtime.popen_resolved.return_value
+        process.communicate.return_value = ("", "")
+        process.returncode = 0
+        mock_runtime_factory.return_value = runtime
+        batch = ">seqA\nMVHLTPEEKSAVTAL\n>seqB\nMKTAYIAKQRQISFV\n"
+
+        BLASTWorker(batch, "swissprot", use_remote=True).run()
+
+        assert runtime.popen_resolved.call_count == 1
+        process.communicate.assert_called_once_with(batch)
+
+    @patch("core.blast_worker.get_tool_runtime")
+    def test_blast_worker_reports_invalid_query_without_running(self, mock_runtime_factory):
+        worker = BLASTWorker(">seqA\nMVHLJ\n", "swissprot", use_remote=True)
+        errors = []
+        worker.error.connect(errors.append)
+
+        worker.run()
+
+        mock_runtime_factory.assert_not_called()
+        assert errors == ["seqA: Invalid residue J at position 5 (found: J)"]
+
+    @patch("core.blast_worker.get_tool_runtime")
+    def test_blast_worker_cancelled_before_start(self, mock_runtime_factory):
+        runtime = MagicMock()
+        runtime.resolve_tool.return_value = MagicMock(executable="/managed/blastp", backend="native")
+        runtime.prepare_path.side_effect = lambda _resolution, path: path
+        mock_runtime_factory.return_value = runtime
+
+        worker = BLASTWorker("MVHLTPEEKSAVTAL", "swissprot", use_remote=True)
+        emitted = []
+        worker.finished.connect(lambda html, data: emitted.append(html))
+        worker.error.connect(emitted.append)
+
+        worker.cancel()
+        worker.run()
+
+        runtime.popen_resolved.assert_not_called()
+        assert emitted == []
+
+    @patch("core.blast_worker.get_tool_runtime")
+    def test_blast_worker_cancel_stops_running_blastp(self, mock_runtime_factory):
+        import subprocess
+        import sys
+        import threading
+        import time
+        runtime = MagicMock()
+        runtime.resolve_tool.return_value = MagicMock(executable="/managed/blastp", backend="native")
+        runtime.prepare_path.side_effect = lambda _resolution, path: path
+        # Stand-in for a remote search that would otherwise run for minutes
+        runtime.popen_resolved.side_effect = lambda _resolution, _args, **kwargs: subprocess.Popen(
+            [sys.executable, "-c", "import time; time.sleep(30)"], **kwargs)
+        mock_runtime_factory.return_value = runtime
+
+        worker = BLASTWorker("MVHLTPEEKSAVTAL", "swissprot", use_remote=True)
+        emitted = []
+        worker.finished.connect(lambda html, data: emitted.append(html))
+        worker.error.connect(emitted.append)
+        worker.progress.connect(lambda _msg: threading.Timer(0.2, worker.cancel).start())
+        cancelled = []
+        worker.cancelled.connect(lambda: cancelled.append(True))
+
+        started = time.monotonic()
+        worker.run()
+
+        assert time.monotonic() - started < 10
+        assert worker._process.returncode != 0
+        assert emitted == []
+        assert cancelled == [True]
+
+    @patch("core.blast_worker.BLASTResultsParser.parse_xml")
+    @patch.object(BLASTWorker, "parse_blast_xml", return_value="<html>hits</html>")
+    @patch("core.blast_worker.get_tool_runtime")
+    def test_blast_worker_repeat_search_served_from_cache(
+        self, mock_runtime_factory, _mock_parse_html, mock_parse_structured
+    ):
+        from utils.results_parser import SearchHit
+        mock_parse_structured.return_value = [SearchHit(rank=1, accession="P69905", evalue=1e-50)]
+        runtime = MagicMock()
+        runtime.resolve_tool.return_value = MagicMock(executable="/managed/blastp", backend="native")
+        runtime.prepare_path.side_effect = lambda _resolution, path: path
+        process = runtime.popen_resolved.return_value
+        process.communicate.return_value = ("", "")
+        process.returncode = 0
+        mock_runtime_factory.return_value = runtime
+
+        payloads = []
+        for _ in range(2):
+            worker = BLASTWorker("MVHLTPEEKSAVTAL", "swissprot", use_remote=True)
+            worker.finished.connect(lambda html, data: payloads.append((html, data)))
+            worker.run()
+
+        assert runtime.popen_resolved.call_count == 1
+        assert payloads[0] == payloads[1]
+        assert payloads[1][1][0].accession == "P69905"
+
+    def test_blast_result_cache_evicts_least_recently_used(self, monkeypatch):
+        monkeypatch.setattr(BLASTWorker, "RESULT_CACHE_MAX_ENTRIES", 2)
+        workers = [BLASTWorker(seq, "swissprot") for seq in ("MVHLT", "MKTAY", "MALWM")]
+        paths = [w._result_cache_path() for w in workers]
+        workers[0]._save_cached_result(paths[0], "<html>0</html>", [])
+        workers[1]._save_cached_result(paths[1], "<html>1</html>", [])
+        os.utime(paths[0], (1, 1))
+        os.utime(paths[1], (2, 2))
+        # Reading the oldest entry makes it the most recently used
+        assert workers[0]._load_cached_result(paths[0]) == ("<html>0</html>", [])
+
+        workers[2]._save_cached_result(paths[2], "<html>2</html>", [])
+
+        assert [os.path.exists(p) for p in paths] == [True, False, True]
+
+        BLASTWorker.clear_result_cache()
+        assert not os.path.exists(BLASTWorker.result_cache_dir())
+
+    def test_blast_remote_cache_entries_expire(self, monkeypatch):
+        worker = BLASTWorker("MVHLT", "swissprot", use_remote=True)
+        path = worker._result_cache_path()
+        worker._save_cached_result(path, "<html>old</html>", [])
+        assert worker._load_cached_result(path) == ("<html>old</html>", [])
+
+        monkeypatch.setattr(BLASTWorker, "REMOTE_RESULT_TTL", -1)
+        assert worker._load_cached_result(path) is None
+
+    def test_blast_local_cache_key_follows_database_files(self, tmp_path):
+        db_dir = tmp_path / "dbs"
+        db_dir.mkdir()
+        (db_dir / "mydb.phr").write_bytes(b"v1")
+        worker = BLASTWorker("MVHLT", "mydb", use_remote=False, local_db_path=str(db_dir))
+        before = worker._result_cache_path()
+        assert worker._result_cache_path() == before
+
+        (db_dir / "mydb.phr").write_bytes(b"rebuilt")
+        assert worker._result_cache_path() != before
+
     def test_blastn_worker_rejects_unsupported_remote_database(self):
         worker = BLASTNWorker("ATGCATGCATGC", "16S_ribosomal_RNA", use_remote=True)
         errors = []
@@ -164,3 +499,30 @@ class TestRuntimeIntegratedWorkers:
 
         assert errors
         assert "Remote BLASTN does not support" in errors[0]
+
+
+# ── DatabaseDownloadWorker ───────────────────────────────────────────
+
+class TestDatabaseDownloadWorkerExtractZip:
+    def test_extracts_every_member_in_parallel(self, tmp_path):
+        archive = tmp_path / "db.zip"
+        contents = {f"swissprot.{ext}": os.urandom(1000) * (i + 1)
+                    for i, ext in enumerate(["pin", "phr", "psq", "pdb", "pot"])}
+        contents["nested/deep/readme.txt"] = b"hello"
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+            for name, data in contents.items():
+                zf.writestr(name, data)
+
+        worker = DatabaseDownloadWorker(MagicMock(), str(tmp_path))
+        worker.EXTRACT_WORKERS = 3
+        dest = tmp_path / "out"
+        dest.mkdir()
+        progress = []
+        # Emitted from pool threads; deliver directly since no event loop runs here
+        worker.progress.connect(lambda done, total, _msg: progress.append((done, total)),
+                                Qt.DirectConnection)
+
+        assert worker._extract_zip(str(archive), str(dest)) == str(dest)
+        for name, data in contents.items():
+            assert (dest / name).read_bytes() == data
+        assert sorted(progress) == [(i, len(contents)) for i in range(1, len(contents) + 1)]
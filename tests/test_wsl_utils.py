@@ -4,6 +4,7 @@ import subprocess
 from unittest.mock import patch, MagicMock
 import pytest
 
+from core import wsl_utils
 from core.wsl_utils import (
     is_windows,
     warmup_wsl,
@@ -55,11 +56,28 @@ class TestWarmupWsl:
     @patch("core.wsl_utils.is_windows", return_value=True)
     @patch("core.wsl_utils.subprocess.run")
     def test_calls_wsl_on_windows(self, mock_run, _):
+        wsl_utils._wsl_warmed.clear()
         warmup_wsl()
         mock_run.assert_called_once()
         args = mock_run.call_args[0][0]
         assert args[0] == "wsl"
 
+    @patch("core.wsl_utils.is_windows", return_value=True)
+    @patch("core.wsl_utils.subprocess.run")
+    def test_warms_once_per_process(self, mock_run, _):
+        wsl_utils._wsl_warmed.clear()
+        warmup_wsl()
+        warmup_wsl()
+        mock_run.assert_called_once()
+
+    @patch("core.wsl_utils.is_windows", return_value=True)
+    @patch("core.wsl_utils.subprocess.run", side_effect=subprocess.TimeoutExpired("wsl", 15))
+    def test_failed_warmup_is_retried(self, mock_run, _):
+        wsl_utils._wsl_warmed.clear()
+        warmup_wsl()
+        warmup_wsl()
+        assert mock_run.call_count == 2
+
 
 # ── is_wsl_available ────────────────────────────────────────────────
 
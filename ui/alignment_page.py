@@ -9,21 +9,25 @@ from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QFileDialog, QLineEdit, QComboBox, QGroupBox, QTextEdit,
     QProgressBar, QMessageBox, QTabWidget, QRadioButton, QButtonGroup,
-    QFrame, QSpinBox, QCheckBox, QSplitter, QScrollArea, QSizePolicy,
+    QFrame, QSpinBox, QCheckBox, QScrollArea, QSizePolicy,
     QDoubleSpinBox,
 )
 from PyQt5.QtCore import pyqtSignal, Qt, QTimer, QSettings
+from PyQt5.QtGui import QTextCursor
 
-from ui.theme import get_theme
+from ui.theme import set_label_state
 from ui.icons import feather_icon, set_button_icon
 from core.tool_install_worker import ToolInstallWorker
 from core.tool_runtime import get_tool_runtime
 from core.tool_registry import alignment_feature_id_for_tool
 from core.alignment_worker import (
     AlignmentWorker,
-    SequenceAlignmentPrep,
+    FastaValidationWorker,
+    ToolCheckWorker,
     check_alignment_tool_installation,
     aligner_display_name,
+    format_alignment,
+    parse_alignment,
     max_sequences_for_tool,
 )
 from ui.dialogs.alignment_viewer_dialog import AlignmentViewerDialog
@@ -33,6 +37,27 @@ from core.pysca_manager import is_pysca_installed, check_pairwise_aligner, PySCA
 from core.pysca_worker import PySCAInstallWorker, PySCARunWorker, PySCAExportWorker
 from ui.widgets.sca_plots_widget import SCAChartsWidget, SCAChartsDialog
 from ui.widgets.pysca_results_widget import PySCAResultsDialog, PySCAResultsStripWidget
+from ui.widgets.persistent_splitter import PersistentSplitter
+
+
+def _link_or_copy(src, dst):
+    """Give *src* a second name at *dst*, copying only across filesystems.
+
+    A hard link costs nothing however large the file is, and it outlives the
+    temporary name when the temp file is cleaned up. The link is made beside
+    *dst* and moved over it, so an existing file is only replaced on success.
+    """
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        return
+    staging = f"{dst}.{os.getpid()}.tmp"
+    try:
+        os.link(src, staging)
+        os.replace(staging, dst)
+    except OSError:
+        # Different volume, or a filesystem without hard links
+        if os.path.exists(staging):
+            os.remove(staging)
+        shutil.copy2(src, dst)
 
 
 class AlignmentPage(QWidget):
@@ -40,21 +65,43 @@ class AlignmentPage(QWidget):
 
     back_requested = pyqtSignal()
 
+    # Progress updates are applied at most this often (latest value wins)
+    PROGRESS_REFRESH_MS = 33
+    # Characters inserted into the Raw Alignment tab per event-loop turn
+    RAW_TEXT_CHUNK = 64 * 1024
+    # Seconds a tool availability check is reused before it is run again
+    TOOL_CHECK_TTL = 300
+    # tool_id -> (time.monotonic() of the check, installed); shared by all pages
+    _tool_check_cache = {}
+
     def __init__(self):
         super().__init__()
         self.alignment_worker = None
         self.input_fasta_path = None
         self.output_alignment_path = None
         self.aligned_content = None
+        # Parsed aligned_content, reused by exports to other formats
+        self._msa_cache = None
         self.loaded_sequences = []
         self.is_temp_fasta = False
+        # Latest input validation; results of superseded runs are ignored
+        self.validation_worker = None
+        self._input_valid = False
         self.tool_install_worker = None
+        self.tool_check_worker = None
+        # Check and validation workers, superseded ones included, until they finish
+        self._background_workers = set()
         self._pending_tool_action = None
         self._align_elapsed_timer = QTimer(self)
         self._align_elapsed_timer.setInterval(1000)
         self._align_elapsed_timer.timeout.connect(self._tick_alignment_elapsed)
         self._align_t0 = None
         self._align_status_base = ""
+        self._pending_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(self.PROGRESS_REFRESH_MS)
+        self._progress_timer.timeout.connect(self._apply_pending_progress)
         self._viewer_dialog = None
         self._sca_charts_dialog = None
         self._alignment_output_format = None
@@ -63,6 +110,10 @@ class AlignmentPage(QWidget):
         self._pysca_run_worker = None
         self._pysca_export_worker = None
         self._pysca_results_dialog = None
+        self._pysca_db_path = None
+        self._pysca_output_dir = None
+        # Bumped whenever the raw alignment text is replaced; stale fills stop
+        self._raw_fill_id = 0
         self._init_ui()
 
         QTimer.singleShot(2000, self.check_system_requirements)
@@ -72,7 +123,7 @@ class AlignmentPage(QWidget):
         root.setContentsMargins(0, 0, 0, 0)
         root.setSpacing(0)
 
-        splitter = QSplitter(Qt.Vertical)
+        splitter = PersistentSplitter(Qt.Vertical, "alignment_splitter")
 
         # ── Top: input controls in a scroll area ─────────────────
         input_scroll = QScrollArea()
@@ -105,8 +156,10 @@ class AlignmentPage(QWidget):
         self.upload_radio.setChecked(True)
         self.input_method_group.addButton(self.upload_radio, 1)
         self.input_method_group.addButton(self.paste_radio, 2)
-        self.upload_radio.toggled.connect(self._on_input_method_changed)
-        self.paste_radio.toggled.connect(self._on_input_method_changed)
+        # One call per switch: the radio being checked, not the one unchecked
+        self.input_method_group.buttonToggled.connect(
+            lambda _button, checked: checked and self._on_input_method_changed()
+        )
         method_row.addWidget(self.upload_radio)
         method_row.addWidget(self.paste_radio)
         method_row.addStretch()
@@ -145,7 +198,7 @@ class AlignmentPage(QWidget):
         ig_layout.addWidget(self.paste_widget)
 
         self.file_info_label = QLabel()
-        self.file_info_label.setProperty("class", "muted")
+        self.file_info_label.setProperty("class", "hint")
         ig_layout.addWidget(self.file_info_label)
 
         input_group.setLayout(ig_layout)
@@ -291,13 +344,34 @@ class AlignmentPage(QWidget):
         viewer_bar.addWidget(viewer_hint, 1)
         rp_layout.addLayout(viewer_bar)
 
-        self.results_tabs = QTabWidget()
-        self.results_tabs.hide()
-        rp_layout.addWidget(self.results_tabs, 1)
+        # Results tabs are built by _ensure_results_tabs after the first alignment
+        self.results_tabs = None
+        self._results_layout = rp_layout
 
         results_panel.hide()
         self._results_panel = results_panel
 
+        splitter.addWidget(self._results_panel)
+        splitter.setStretchFactor(0, 0)
+        splitter.setStretchFactor(1, 1)
+
+        splitter.restore_state([350, 400])
+        self.splitter = splitter
+
+        root.addWidget(splitter)
+
+    def _ensure_results_tabs(self) -> QTabWidget:
+        """Build the Raw / SCA / Export tabs on first use.
+
+        The SCA tab carries a matplotlib canvas and the pySCA controls, so
+        none of it is created until an alignment has actually finished.
+        """
+        if self.results_tabs is not None:
+            return self.results_tabs
+
+        self.results_tabs = QTabWidget()
+        self._results_layout.addWidget(self.results_tabs, 1)
+
         # Tab 1: Raw Alignment
         raw_tab = QWidget()
         rl = QVBoxLayout(raw_tab)
@@ -306,6 +380,7 @@ class AlignmentPage(QWidget):
         self.raw_alignment_text.setReadOnly(True)
         self.raw_alignment_text.setProperty("class", "mono")
         self.raw_alignment_text.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.raw_alignment_text.setUndoRedoEnabled(False)
         rl.addWidget(self.raw_alignment_text)
         self.results_tabs.addTab(raw_tab, feather_icon("file-text", 16), "Raw Alignment")
 
@@ -461,8 +536,6 @@ class AlignmentPage(QWidget):
 
         self.results_tabs.addTab(sca_scroll, feather_icon("bar-chart-2", 16), "SCA Analysis")
 
-        self._pysca_db_path = None
-        self._pysca_output_dir = None
         self._refresh_pysca_status()
 
         # Tab 3: Export
@@ -487,21 +560,7 @@ class AlignmentPage(QWidget):
 
         el.addStretch()
         self.results_tabs.addTab(export_tab, feather_icon("download", 16), "Export")
-
-        splitter.addWidget(self._results_panel)
-        splitter.setStretchFactor(0, 0)
-        splitter.setStretchFactor(1, 1)
-
-        settings = QSettings("SenLab", "ProteinGUI")
-        if settings.contains("alignment_splitter"):
-            splitter.restoreState(settings.value("alignment_splitter"))
-        else:
-            splitter.setSizes([350, 400])
-
-        self.splitter = splitter
-        splitter.splitterMoved.connect(self._save_splitter_state)
-
-        root.addWidget(splitter)
+        return self.results_tabs
 
     def _ensure_alignment_viewer_dialog(self) -> AlignmentViewerDialog:
         if self._viewer_dialog is None:
@@ -578,28 +637,59 @@ class AlignmentPage(QWidget):
             self.load_fasta_file(self.input_fasta_path, is_temp=self.is_temp_fasta)
 
     # ── System requirements ──────────────────────────────────────
-    def check_system_requirements(self):
-        runtime = get_tool_runtime()
+    def check_system_requirements(self, refresh=False):
+        """Show whether the selected aligner is available.
+
+        A check younger than TOOL_CHECK_TTL is reused; otherwise the tool is
+        probed by a ToolCheckWorker and the page updates when it reports back.
+        """
         tool_id = self._selected_tool_id()
-        name = aligner_display_name(tool_id)
-        installed, _version, _path = check_alignment_tool_installation(tool_id)
+        cached = self._tool_check_cache.get(tool_id)
+        if cached is not None:
+            checked_at, installed = cached
+            self._apply_tool_status(tool_id, installed)
+            if not refresh and time.monotonic() - checked_at < self.TOOL_CHECK_TTL:
+                return
+
+        if self.tool_check_worker is not None:
+            self.tool_check_worker.cancel()
+        worker = ToolCheckWorker(tool_id, self)
+        worker.checked.connect(
+            lambda checked_id, installed, w=worker: self._on_tool_checked(w, checked_id, installed)
+        )
+        self._track_worker(worker)
+        worker.finished.connect(worker.deleteLater)
+        self.tool_check_worker = worker
+        worker.start()
+
+    def _track_worker(self, worker):
+        """Keep *worker* referenced until it finishes so the main window can wait for it"""
+        self._background_workers.add(worker)
+        worker.finished.connect(lambda w=worker: self._background_workers.discard(w))
+
+    def _on_tool_checked(self, worker, tool_id, installed):
+        AlignmentPage._tool_check_cache[tool_id] = (time.monotonic(), installed)
+        if worker is not self.tool_check_worker:
+            return
+        self.tool_check_worker = None
+        if tool_id == self._selected_tool_id():
+            self._apply_tool_status(tool_id, installed)
+
+    def _apply_tool_status(self, tool_id, installed):
         if not installed:
+            name = aligner_display_name(tool_id)
             self.warning_label.setText(
                 f"{name} is not currently available. Use the Tools tab to install it, "
                 "or click Run and the app will prompt to install it."
             )
             self.warning_label.show()
-            self.run_button.setEnabled(bool(runtime.get_installable_tools([tool_id])))
+            self.run_button.setEnabled(bool(get_tool_runtime().get_installable_tools([tool_id])))
             return
 
         self.warning_label.hide()
-        # Run stays disabled until a valid FASTA is loaded (see load_fasta_file)
+        # Run stays disabled until a valid FASTA is loaded (see _on_fasta_validated)
         if self.input_fasta_path and os.path.exists(self.input_fasta_path):
-            max_seq = max_sequences_for_tool(tool_id)
-            is_valid, _msg, _c = SequenceAlignmentPrep.validate_fasta_for_alignment(
-                self.input_fasta_path, max_sequences=max_seq
-            )
-            self.run_button.setEnabled(is_valid)
+            self.run_button.setEnabled(self._input_valid)
         else:
             self.run_button.setEnabled(True)
 
@@ -650,7 +740,7 @@ class AlignmentPage(QWidget):
 
     def _on_tool_install_finished(self, _result):
         self.run_button.setEnabled(True)
-        self.check_system_requirements()
+        self.check_system_requirements(refresh=True)
         self.status_label.setText("Required tools installed.")
         pending = self._pending_tool_action
         self._pending_tool_action = None
@@ -664,75 +754,142 @@ class AlignmentPage(QWidget):
         QMessageBox.critical(self, "Tool Install Error", error_msg)
 
     # ── File browsing ────────────────────────────────────────────
+    def _dialog_path(self, file_name=""):
+        """Start path for file dialogs: the last directory used, not the CWD."""
+        last_dir = QSettings("SenLab", "ProteinGUI").value("alignment_last_dir", "", type=str)
+        if not last_dir or not os.path.isdir(last_dir):
+            return file_name
+        return os.path.join(last_dir, file_name) if file_name else last_dir
+
+    def _remember_dialog_dir(self, path):
+        directory = path if os.path.isdir(path) else os.path.dirname(path)
+        QSettings("SenLab", "ProteinGUI").setValue("alignment_last_dir", directory)
+
     def browse_fasta_file(self):
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select FASTA File", "",
+            self, "Select FASTA File", self._dialog_path(),
             "FASTA Files (*.fasta *.fa *.faa);;All Files (*.*)"
         )
         if file_path:
+            self._remember_dialog_dir(file_path)
             self.load_fasta_file(file_path)
 
-    def load_fasta_file(self, file_path, is_temp=False):
+    def load_fasta_file(self, file_path, is_temp=False, announce=False):
+        """
+        Select *file_path* as alignment input and validate it in the background.
+
+        Run stays disabled until validation passes; with *announce*, a
+        confirmation dialog is shown once it does. Returns False only if the
+        file does not exist.
+        """
         if not os.path.exists(file_path):
             QMessageBox.warning(self, "File Not Found", f"File not found: {file_path}")
             return False
 
-        max_seq = max_sequences_for_tool(self._selected_tool_id())
-        is_valid, message, seq_count = SequenceAlignmentPrep.validate_fasta_for_alignment(
-            file_path, max_sequences=max_seq
-        )
-
         self.input_fasta_path = file_path
         self.file_path_input.setText(file_path)
         self.is_temp_fasta = is_temp
+        self.save_fasta_button.setVisible(is_temp)
 
-        t = get_theme()
-        if is_valid:
-            self.file_info_label.setText(message)
-            self.file_info_label.setStyleSheet(f"color: {t.get('success')}; font-style: italic;")
-            self.run_button.setEnabled(True)
-        else:
-            self.file_info_label.setText(message)
-            self.file_info_label.setStyleSheet(f"color: {t.get('error')}; font-style: italic;")
-            self.run_button.setEnabled(False)
+        self._input_valid = False
+        self.run_button.setEnabled(False)
+        self.file_info_label.setText("Validating sequences...")
+        set_label_state(self.file_info_label, "muted")
 
-        self.save_fasta_button.setVisible(is_temp)
-        return is_valid
+        if self.validation_worker is not None:
+            self.validation_worker.cancel()
+        max_seq = max_sequences_for_tool(self._selected_tool_id())
+        worker = FastaValidationWorker(file_path, max_sequences=max_seq, parent=self)
+        worker.validated.connect(
+            lambda is_valid, message, _count: self._on_fasta_validated(worker, is_valid, message, announce)
+        )
+        self._track_worker(worker)
+        worker.finished.connect(worker.deleteLater)
+        self.validation_worker = worker
+        worker.start()
+        return True
+
+    def _on_fasta_validated(self, worker, is_valid, message, announce):
+        if worker is not self.validation_worker:
+            return
+        self.validation_worker = None
+        self._input_valid = is_valid
+
+        self.file_info_label.setText(message)
+        set_label_state(self.file_info_label, "success" if is_valid else "error")
+        self.run_button.setEnabled(is_valid)
+
+        if is_valid and announce:
+            QMessageBox.information(
+                self, "Sequences Loaded",
+                "Sequences have been loaded for alignment.\n\n"
+                "Click 'Save Input FASTA' to save permanently.\n"
+                "Adjust parameters and click 'Run Alignment' when ready."
+            )
 
     # ── Run alignment ────────────────────────────────────────────
     def run_alignment(self):
         if not self._ensure_alignment_tools():
             return
         if self.paste_radio.isChecked():
-            paste_content = self.paste_text.toPlainText().strip()
-            if not paste_content:
-                QMessageBox.warning(self, "No Sequences", "Please paste sequences in FASTA format.")
+            problem = self._preflight_pasted_fasta()
+            if problem:
+                QMessageBox.warning(self, *problem)
                 return
-
             try:
                 fd, temp_path = tempfile.mkstemp(suffix='.fasta', prefix='alignment_input_')
-                with os.fdopen(fd, 'w', encoding='utf-8') as f:
-                    f.write(paste_content)
+                # Write the document block by block rather than copying it
+                # into one string first; the validator skips blank lines
+                with os.fdopen(fd, 'w', buffering=1 << 20, encoding='utf-8') as f:
+                    block = self.paste_text.document().begin()
+                    while block.isValid():
+                        f.write(block.text())
+                        f.write("\n")
+                        block = block.next()
 
                 self.input_fasta_path = temp_path
                 self.is_temp_fasta = True
-
-                max_seq = max_sequences_for_tool(self._selected_tool_id())
-                is_valid, message, seq_count = SequenceAlignmentPrep.validate_fasta_for_alignment(
-                    temp_path, max_sequences=max_seq
-                )
-                if not is_valid:
-                    QMessageBox.warning(self, "Invalid Sequences", message)
-                    os.remove(temp_path)
-                    return
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to save sequences: {str(e)}")
                 return
 
+            # A large paste is validated off the GUI thread; the run starts once it passes
+            self.run_button.setEnabled(False)
+            self.status_label.setText("Validating sequences...")
+            if self.validation_worker is not None:
+                self.validation_worker.cancel()
+            max_seq = max_sequences_for_tool(self._selected_tool_id())
+            worker = FastaValidationWorker(temp_path, max_sequences=max_seq, parent=self)
+            worker.validated.connect(
+                lambda is_valid, message, _count: self._on_paste_validated(worker, is_valid, message, temp_path)
+            )
+            self._track_worker(worker)
+            worker.finished.connect(worker.deleteLater)
+            self.validation_worker = worker
+            worker.start()
+            return
+
         if not self.input_fasta_path:
             QMessageBox.warning(self, "No File", "Please select a FASTA file first.")
             return
+        self._start_alignment()
+
+    def _on_paste_validated(self, worker, is_valid, message, temp_path):
+        if worker is not self.validation_worker:
+            return
+        self.validation_worker = None
+        if not is_valid:
+            self.status_label.setText("Ready")
+            self.run_button.setEnabled(True)
+            QMessageBox.warning(self, "Invalid Sequences", message)
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return
+        self._start_alignment()
 
+    def _start_alignment(self):
         output_format = self.format_combo.currentData()
         iterations = self.iter_spin.value()
         full_iter = self.full_iter_checkbox.isChecked()
@@ -744,7 +901,6 @@ class AlignmentPage(QWidget):
         self.cancel_button.setEnabled(True)
         self.progress_bar.setValue(0)
         self.progress_bar.show()
-        self.results_tabs.hide()
         self._results_panel.hide()
 
         self._align_t0 = time.monotonic()
@@ -763,15 +919,45 @@ class AlignmentPage(QWidget):
         self.alignment_worker.progress.connect(self.on_progress)
         self.alignment_worker.finished.connect(self.on_alignment_finished)
         self.alignment_worker.error.connect(self.on_alignment_error)
+        self.alignment_worker.cancelled.connect(self.on_alignment_cancelled)
         self.alignment_worker.start()
 
+    def _preflight_pasted_fasta(self):
+        """Catch obviously unusable pasted input before it is written to disk.
+
+        Returns a (title, message) warning, or None when the text starts with
+        a FASTA header and has a second one. Reading stops at that second
+        header, so only the top of a large paste is looked at.
+        """
+        headers = 0
+        block = self.paste_text.document().begin()
+        while block.isValid():
+            line = block.text().strip()
+            if line:
+                if line.startswith(">"):
+                    headers += 1
+                    if headers == 2:
+                        return None
+                elif headers == 0:
+                    return ("Invalid Sequences",
+                            "Pasted text must be FASTA, starting with a '>' header line.")
+            block = block.next()
+        if headers == 0:
+            return "No Sequences", "Please paste sequences in FASTA format."
+        return "Invalid Sequences", "At least 2 sequences are required for alignment"
+
     def cancel_alignment(self):
         self._stop_alignment_elapsed_timer()
-        if self.alignment_worker:
+        self.cancel_button.setEnabled(False)
+        if self.alignment_worker and self.alignment_worker.isRunning():
+            # The worker stops its aligner and cleans up; Run comes back on `cancelled`
+            self.alignment_worker.progress.disconnect(self.on_progress)
             self.alignment_worker.cancel()
-            self.alignment_worker.terminate()
-            self.alignment_worker.wait()
+            self.status_label.setText("Cancelling alignment...")
+            return
+        self.on_alignment_cancelled()
 
+    def on_alignment_cancelled(self):
         self.status_label.setText("Alignment cancelled")
         self.run_button.setEnabled(True)
         self.cancel_button.setEnabled(False)
@@ -780,6 +966,8 @@ class AlignmentPage(QWidget):
     def _stop_alignment_elapsed_timer(self):
         self._align_elapsed_timer.stop()
         self._align_t0 = None
+        self._progress_timer.stop()
+        self._pending_progress = None
 
     def _refresh_alignment_status_label(self):
         if self._align_t0 is None:
@@ -793,6 +981,16 @@ class AlignmentPage(QWidget):
         self._refresh_alignment_status_label()
 
     def on_progress(self, percent, message):
+        # Chatty aligners report many times a second; repaint at most once per tick
+        self._pending_progress = (percent, message)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _apply_pending_progress(self):
+        if self._pending_progress is None:
+            return
+        percent, message = self._pending_progress
+        self._pending_progress = None
         self.progress_bar.setValue(percent)
         self._align_status_base = message
         self._refresh_alignment_status_label()
@@ -800,17 +998,18 @@ class AlignmentPage(QWidget):
     def on_alignment_finished(self, aligned_content, output_path):
         self._stop_alignment_elapsed_timer()
         self.aligned_content = aligned_content
+        self._msa_cache = None
         self.output_alignment_path = output_path
         self._alignment_output_format = self.format_combo.currentData()
 
-        self.raw_alignment_text.setPlainText(aligned_content)
+        self._ensure_results_tabs()
+        self._populate_raw(aligned_content)
 
         self.run_button.setEnabled(True)
         self.cancel_button.setEnabled(False)
         self.progress_bar.hide()
         self.status_label.setText("Alignment complete!")
         self._results_panel.show()
-        self.results_tabs.show()
 
         self._refresh_pysca_status()
 
@@ -825,6 +1024,34 @@ class AlignmentPage(QWidget):
             # Auto-run built-in SCA (silent -- no pop-ups if too few sequences)
             self._run_builtin_sca(silent=True)
 
+    def _populate_raw(self, text):
+        """Fill the Raw Alignment tab RAW_TEXT_CHUNK characters at a time.
+
+        setPlainText lays out the whole document in one go, which stalls the
+        event loop on multi-MB alignments. Each chunk is inserted on its own
+        event-loop turn; a newer fill cancels one still in progress.
+        """
+        self._raw_fill_id += 1
+        fill_id = self._raw_fill_id
+        edit = self.raw_alignment_text
+        edit.clear()
+        edit.setUpdatesEnabled(False)
+        cursor = QTextCursor(edit.document())
+
+        def insert_chunk(offset=0):
+            if fill_id != self._raw_fill_id:
+                return
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText(text[offset:offset + self.RAW_TEXT_CHUNK])
+            offset += self.RAW_TEXT_CHUNK
+            if offset < len(text):
+                QTimer.singleShot(0, lambda: insert_chunk(offset))
+            else:
+                edit.setUpdatesEnabled(True)
+                edit.moveCursor(QTextCursor.Start)
+
+        insert_chunk()
+
     def on_alignment_error(self, error_msg):
         self._stop_alignment_elapsed_timer()
         QMessageBox.critical(self, "Alignment Error", f"An error occurred:\n\n{error_msg}")
@@ -839,26 +1066,35 @@ class AlignmentPage(QWidget):
             QMessageBox.warning(self, "No Alignment", "No alignment available to export.")
             return
 
-        if self.format_combo.currentData() == format_type:
+        if self._alignment_output_format == format_type:
             content = self.aligned_content
         else:
-            QMessageBox.information(
-                self, "Format Conversion",
-                f"To export in {format_type.upper()} format, please re-run the alignment "
-                f"with '{format_type.upper()}' selected as the output format."
-            )
-            return
+            # Convert the alignment already in memory instead of re-running it
+            try:
+                if self._msa_cache is None:
+                    self._msa_cache = parse_alignment(
+                        self.aligned_content, self._alignment_output_format
+                    )
+                content = format_alignment(self._msa_cache, format_type)
+            except ValueError as e:
+                QMessageBox.information(
+                    self, "Format Conversion",
+                    f"Could not convert the alignment to {format_type.upper()}:\n{e}\n\n"
+                    f"Re-run the alignment with '{format_type.upper()}' selected as the output format."
+                )
+                return
 
         ext_map = {'fasta': '.fasta', 'clustal': '.aln'}
         ext = ext_map.get(format_type, '.txt')
 
         file_path, _ = QFileDialog.getSaveFileName(
             self, f"Export Alignment as {format_type.upper()}",
-            f"alignment{ext}",
+            self._dialog_path(f"alignment{ext}"),
             f"{format_type.upper()} Files (*{ext});;All Files (*.*)"
         )
 
         if file_path:
+            self._remember_dialog_dir(file_path)
             try:
                 with open(file_path, 'w', encoding='utf-8') as f:
                     f.write(content)
@@ -872,13 +1108,14 @@ class AlignmentPage(QWidget):
             return
 
         file_path, _ = QFileDialog.getSaveFileName(
-            self, "Save FASTA File", "sequences.fasta",
+            self, "Save FASTA File", self._dialog_path("sequences.fasta"),
             "FASTA Files (*.fasta *.fa);;All Files (*.*)"
         )
 
         if file_path:
+            self._remember_dialog_dir(file_path)
             try:
-                shutil.copy2(self.input_fasta_path, file_path)
+                _link_or_copy(self.input_fasta_path, file_path)
                 QMessageBox.information(self, "Save Successful", f"FASTA file saved to:\n{file_path}")
                 self.input_fasta_path = file_path
                 self.file_path_input.setText(file_path)
@@ -1085,10 +1322,11 @@ class AlignmentPage(QWidget):
             QMessageBox.warning(self, "pySCA", "No .db file available.")
             return
         path, _ = QFileDialog.getSaveFileName(
-            self, "Save pySCA .db file", "sca_results.db",
+            self, "Save pySCA .db file", self._dialog_path("sca_results.db"),
             "Pickle DB (*.db);;All Files (*.*)"
         )
         if path:
+            self._remember_dialog_dir(path)
             shutil.copy2(self._pysca_db_path, path)
             QMessageBox.information(self, "Saved", f"Saved to:\n{path}")
 
@@ -1097,10 +1335,11 @@ class AlignmentPage(QWidget):
             QMessageBox.warning(self, "pySCA", "No .db file available.")
             return
         export_dir = QFileDialog.getExistingDirectory(
-            self, "Select export directory"
+            self, "Select export directory", self._dialog_path()
         )
         if not export_dir:
             return
+        self._remember_dialog_dir(export_dir)
 
         self.pysca_export_csv_btn.setEnabled(False)
         self._pysca_export_worker = PySCAExportWorker(self._pysca_db_path, export_dir)
@@ -1128,18 +1367,6 @@ class AlignmentPage(QWidget):
         else:
             subprocess.Popen(["xdg-open", d])
 
-    def _save_splitter_state(self):
-        settings = QSettings("SenLab", "ProteinGUI")
-        settings.setValue("alignment_splitter", self.splitter.saveState())
-
     def load_sequences_from_search(self, fasta_path, source_info=None):
         """Load sequences from a search result (BLAST/MMseqs2)."""
-        success = self.load_fasta_file(fasta_path, is_temp=True)
-
-        if success:
-            QMessageBox.information(
-                self, "Sequences Loaded",
-                "Sequences have been loaded for alignment.\n\n"
-                "Click 'Save Input FASTA' to save permanently.\n"
-                "Adjust parameters and click 'Run Alignment' when ready."
-            )
+        self.load_fasta_file(fasta_path, is_temp=True, announce=True)
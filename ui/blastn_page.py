@@ -10,7 +10,7 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import pyqtSignal, Qt
 from PyQt5.QtGui import QFont
 
-from ui.theme import get_theme
+from ui.theme import set_label_state
 from ui.icons import feather_icon, set_button_icon
 from ui.widgets.results_panel import SearchResultsPanel
 from core.db_definitions import (
@@ -24,9 +24,10 @@ from core.array_backend import cuda_available
 from core.config_manager import get_config
 from core.tool_install_worker import ToolInstallWorker
 from core.tool_runtime import get_tool_runtime
-from utils.fasta_parser import FastaParser, FastaParseError
+from utils.fasta_parser import FastaParser, FastaParseError, strip_non_letters
 from utils.export_manager import ResultsExporter, ExportError, show_export_error, show_export_success
 from ui.dialogs.nucleotide_search_dialog import NucleotideSearchDialog
+from ui.widgets.db_description import db_description_timer
 
 
 def validate_nucleotide_sequence(sequence):
@@ -202,6 +203,7 @@ class BLASTNPage(QWidget):
         db_sel = QVBoxLayout()
         self.db_combo = QComboBox()
         self.db_combo.currentTextChanged.connect(self.on_database_changed)
+        self._db_description_timer = db_description_timer(self, self.update_database_description)
 
         self.db_description = QLabel()
         self.db_description.setWordWrap(True)
@@ -398,17 +400,16 @@ class BLASTNPage(QWidget):
 
     def _update_sequence_counter(self):
         text = self.input_text.toPlainText().strip().upper()
-        count = len(''.join(c for c in text if c.isalpha()))
+        count = len(strip_non_letters(text))
         self.sequence_counter.setText(f"{count} nucleotides")
-        t = get_theme()
         if count == 0:
-            self.sequence_counter.setStyleSheet(f"color:{t.get('text_muted')};")
+            set_label_state(self.sequence_counter, "muted")
         elif count < 10:
-            self.sequence_counter.setStyleSheet(f"color:{t.get('error')}; font-weight:600;")
+            set_label_state(self.sequence_counter, "error", strong=True)
         elif count > 50000:
-            self.sequence_counter.setStyleSheet(f"color:{t.get('warning')}; font-weight:600;")
+            set_label_state(self.sequence_counter, "warning", strong=True)
         else:
-            self.sequence_counter.setStyleSheet(f"color:{t.get('success')}; font-weight:600;")
+            set_label_state(self.sequence_counter, "success", strong=True)
 
     # ── FASTA upload ──────────────────────────────────────────────
 
@@ -478,19 +479,16 @@ class BLASTNPage(QWidget):
                 'source': 'genbank', 'accession': accession,
                 'title': title, 'organism': organism, 'id': accession}
             self.search_info_label.setText(f"Loaded: {accession} ({organism})")
-            self.search_info_label.setStyleSheet(
-                f"color:{get_theme().get('success')}; font-weight:600;")
+            set_label_state(self.search_info_label, "success", strong=True)
 
     # ── Database helpers ──────────────────────────────────────────
 
     def on_database_changed(self):
-        self.update_database_description()
+        self._db_description_timer.start()
 
     def update_database_description(self):
-        text = self.db_combo.currentText()
-        db = text.split(' - ')[0] if ' - ' in text else text
         desc = get_blastn_databases(self.remote_radio.isChecked()).get(
-            db, "Database information not available"
+            self.db_combo.currentData(), "Database information not available"
         )
         self.db_description.setText(desc)
 
@@ -632,7 +630,7 @@ class BLASTNPage(QWidget):
         if not sequence:
             self.status_label.setText("Please enter a nucleotide sequence first.")
             return
-        sequence = "".join(c for c in sequence if c.isalpha())
+        sequence = strip_non_letters(sequence)
         is_valid, invalid_chars = validate_nucleotide_sequence(sequence)
         if not is_valid:
             self.status_label.setText(
@@ -687,15 +685,14 @@ class BLASTNPage(QWidget):
         if not sequence:
             self.status_label.setText("Please enter a nucleotide sequence first.")
             return
-        sequence = ''.join(c for c in sequence if c.isalpha())
+        sequence = strip_non_letters(sequence)
         is_valid, invalid_chars = validate_nucleotide_sequence(sequence)
         if not is_valid:
             self.status_label.setText(
                 f"Invalid sequence: found characters {', '.join(sorted(invalid_chars))}")
             return
 
-        db_text = self.db_combo.currentText()
-        database = self.db_combo.currentData() or (db_text.split(' - ')[0] if ' - ' in db_text else db_text)
+        database = self.db_combo.currentData()
         use_remote = self.remote_radio.isChecked()
         if use_remote and not is_remote_blastn_database_supported(database):
             self.status_label.setText(
@@ -739,7 +736,7 @@ class BLASTNPage(QWidget):
             'tool': 'BLASTN',
             'query_name': self.current_sequence_metadata.get('id', 'query'),
             'query_length': str(len(self.input_text.toPlainText().strip())),
-            'database': self.db_combo.currentText().split(' - ')[0],
+            'database': self.db_combo.currentData(),
             'search_time': f"{elapsed:.1f}s",
         }
         self.results_panel.set_results(results_data, self.current_query_info)
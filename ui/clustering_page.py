@@ -5,10 +5,10 @@ from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QFileDialog, QLineEdit, QComboBox, QGroupBox,
     QTextEdit, QProgressBar, QMessageBox, QTabWidget, QTableWidget,
-    QTableWidgetItem, QDoubleSpinBox, QCheckBox, QScrollArea, QSplitter,
+    QTableWidgetItem, QDoubleSpinBox, QCheckBox, QScrollArea,
     QFrame, QSpinBox, QSizePolicy
 )
-from PyQt5.QtCore import pyqtSignal, Qt, QTimer, QSettings
+from PyQt5.QtCore import pyqtSignal, Qt, QTimer
 from PyQt5.QtGui import QPixmap
 
 from ui.theme import get_theme
@@ -19,6 +19,7 @@ from core.clustering_visualizer import create_distribution_chart, create_text_su
 from core.tool_install_worker import ToolInstallWorker
 from core.tool_runtime import get_tool_runtime
 from ui.dialogs.chart_maximize_dialog import ChartMaximizeDialog
+from ui.widgets.persistent_splitter import PersistentSplitter
 
 
 class ClusteringPage(QWidget):
@@ -46,7 +47,7 @@ class ClusteringPage(QWidget):
         root.setContentsMargins(0, 0, 0, 0)
         root.setSpacing(0)
 
-        splitter = QSplitter(Qt.Vertical)
+        splitter = PersistentSplitter(Qt.Vertical, "clustering_splitter")
 
         # ── Top: input controls ──────────────────────────────────
         input_scroll = QScrollArea()
@@ -307,14 +308,8 @@ class ClusteringPage(QWidget):
         splitter.setStretchFactor(0, 0)
         splitter.setStretchFactor(1, 1)
 
-        settings = QSettings("SenLab", "ProteinGUI")
-        if settings.contains("clustering_splitter"):
-            splitter.restoreState(settings.value("clustering_splitter"))
-        else:
-            splitter.setSizes([400, 300])
-
+        splitter.restore_state([400, 300])
         self.splitter = splitter
-        splitter.splitterMoved.connect(self._save_splitter_state)
 
         root.addWidget(splitter)
 
@@ -582,10 +577,6 @@ class ClusteringPage(QWidget):
 
     # ── Helpers ───────────────────────────────────────────────────
 
-    def _save_splitter_state(self):
-        settings = QSettings("SenLab", "ProteinGUI")
-        settings.setValue("clustering_splitter", self.splitter.saveState())
-
     def _maximize_chart(self):
         if not self.chart_path or not os.path.exists(self.chart_path):
             QMessageBox.warning(self, "No Chart Available", "No chart is currently available.")
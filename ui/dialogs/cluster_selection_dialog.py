@@ -11,6 +11,8 @@ from PyQt5.QtGui import QFont, QDoubleValidator
 
 from typing import List
 
+from utils.results_parser import distinct_query_ids
+
 
 class ClusterSelectionDialog(QDialog):
     """
@@ -119,9 +121,9 @@ class ClusterSelectionDialog(QDialog):
         layout.addWidget(table_label)
         
         self.results_table = QTableWidget()
-        self.results_table.setColumnCount(6)
+        self.results_table.setColumnCount(7)
         self.results_table.setHorizontalHeaderLabels([
-            "", "Rank", "Accession", "E-value", "Identity", "Length"
+            "", "Rank", "Accession", "E-value", "Identity", "Length", "Query"
         ])
         
         # Set column widths
@@ -132,12 +134,15 @@ class ClusterSelectionDialog(QDialog):
         header.setSectionResizeMode(3, QHeaderView.Fixed)  # E-value
         header.setSectionResizeMode(4, QHeaderView.Fixed)  # Identity
         header.setSectionResizeMode(5, QHeaderView.Fixed)  # Length
+        header.setSectionResizeMode(6, QHeaderView.ResizeToContents)  # Query
         
         self.results_table.setColumnWidth(0, 30)
         self.results_table.setColumnWidth(1, 60)
         self.results_table.setColumnWidth(3, 100)
         self.results_table.setColumnWidth(4, 80)
         self.results_table.setColumnWidth(5, 80)
+        # Ranks restart per query in a multi-query batch; show which query each hit is for
+        self.results_table.setColumnHidden(6, len(distinct_query_ids(self.search_hits)) < 2)
         
         # Populate table
         self._populate_table()
@@ -246,6 +251,9 @@ class ClusterSelectionDialog(QDialog):
             length_item = QTableWidgetItem(f"{hit.sequence_length} aa")
             length_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
             self.results_table.setItem(i, 5, length_item)
+            
+            # Query
+            self.results_table.setItem(i, 6, QTableWidgetItem(hit.query_id))
     
     def _on_mode_changed(self):
         """Handle selection mode change"""
@@ -289,7 +297,8 @@ class ClusterSelectionDialog(QDialog):
             if self.selection_mode == 'top_n':
                 checkbox.setEnabled(False)
                 n = self.top_n_spin.value()
-                checkbox.setChecked(i < n)
+                # Top N of each query in a multi-query batch
+                checkbox.setChecked(self.search_hits[i].rank <= n)
             
             elif self.selection_mode == 'evalue':
                 checkbox.setEnabled(False)
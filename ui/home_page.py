@@ -4,7 +4,6 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt, pyqtSignal
 
-from ui.theme import get_theme, PAGE_ACCENTS
 from ui.icons import feather_icon
 
 
@@ -12,7 +11,7 @@ class ServiceCard(QFrame):
     """Card widget for a service on the home page."""
     clicked = pyqtSignal()
 
-    def __init__(self, title, description, accent, icon_name=None, parent=None):
+    def __init__(self, title, description, page_id, icon_name=None, parent=None):
         super().__init__(parent)
         self.setProperty("class", "card")
         self.setCursor(Qt.PointingHandCursor)
@@ -26,20 +25,9 @@ class ServiceCard(QFrame):
         btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         if icon_name:
             btn.setIcon(feather_icon(icon_name, 18, "#FFFFFF"))
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {accent};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 14px;
-            }}
-            QPushButton:hover {{
-                opacity: 0.9;
-            }}
-        """)
+        # Styled by the global QSS; page_id selects the PAGE_ACCENTS colour
+        btn.setProperty("class", "service")
+        btn.setProperty("page", page_id)
         btn.clicked.connect(self.clicked.emit)
 
         desc_lbl = QLabel(description)
@@ -62,6 +50,8 @@ class HomePage(QWidget):
         self._init_ui()
 
     def _init_ui(self):
+        # Build the whole page before Qt lays it out or paints it
+        self.setUpdatesEnabled(False)
         root = QVBoxLayout(self)
         root.setContentsMargins(0, 0, 0, 0)
 
@@ -74,8 +64,6 @@ class HomePage(QWidget):
         layout.setSpacing(24)
         layout.setContentsMargins(40, 36, 40, 36)
 
-        t = get_theme()
-
         # Welcome banner
         banner = QFrame()
         banner.setProperty("class", "card")
@@ -108,11 +96,10 @@ class HomePage(QWidget):
         tools_wrap.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
         tw_layout = QVBoxLayout(tools_wrap)
         tw_layout.setContentsMargins(0, 0, 0, 0)
-        tools_accent = PAGE_ACCENTS.get("tools", t.get("accent"))
         tools_card = ServiceCard(
             "Tools",
             "Install BLAST+, MMseqs2, blastdbcmd, and Clustal Omega for searches, clustering, and alignment",
-            tools_accent,
+            "tools",
             "tool",
         )
         tools_card.clicked.connect(lambda: self.service_selected.emit("tools"))
@@ -146,22 +133,20 @@ class HomePage(QWidget):
         ]
 
         for idx, (sid, title_text, desc, icon) in enumerate(services):
-            accent = PAGE_ACCENTS.get(sid.replace("_downloads", "").replace("_search", ""),
-                                      t.get("accent"))
-            card = ServiceCard(title_text, desc, accent, icon)
+            card = ServiceCard(title_text, desc, sid.replace("_downloads", "").replace("_search", ""), icon)
             card.clicked.connect(lambda _=False, s=sid: self.service_selected.emit(s))
             grid.addWidget(card, idx // 2, idx % 2)
 
-        layout.addWidget(banner)
-        layout.addSpacing(12)
-        layout.addWidget(tools_heading)
-        layout.addLayout(tools_row)
-        layout.addSpacing(20)
-        layout.addWidget(section_divider)
-        layout.addSpacing(20)
-        layout.addWidget(section_header)
-        layout.addWidget(grid_widget)
+        for item in (banner, 12, tools_heading, tools_row, 20,
+                     section_divider, 20, section_header, grid_widget):
+            if isinstance(item, int):
+                layout.addSpacing(item)
+            elif isinstance(item, QWidget):
+                layout.addWidget(item)
+            else:
+                layout.addLayout(item)
         layout.addStretch()
 
         scroll.setWidget(content)
         root.addWidget(scroll)
+        self.setUpdatesEnabled(True)
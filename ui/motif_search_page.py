@@ -15,10 +15,10 @@ from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QFileDialog, QLineEdit, QGroupBox, QTextEdit, QProgressBar,
     QMessageBox, QTabWidget, QFrame,
-    QSpinBox, QFormLayout, QScrollArea, QSplitter, QTableWidget,
+    QSpinBox, QFormLayout, QScrollArea, QTableWidget,
     QTableWidgetItem, QHeaderView, QSizePolicy
 )
-from PyQt5.QtCore import pyqtSignal, Qt, QSettings
+from PyQt5.QtCore import pyqtSignal, Qt
 
 from ui.theme import get_theme
 from ui.icons import feather_icon, set_button_icon
@@ -33,6 +33,7 @@ except ImportError:
     MATPLOTLIB_AVAILABLE = False
 
 from core.motif_worker import MotifSearchWorker
+from ui.widgets.persistent_splitter import PersistentSplitter
 
 
 class MotifInputWidget(QWidget):
@@ -234,7 +235,7 @@ class MotifSearchPage(QWidget):
         root.setContentsMargins(0, 0, 0, 0)
         root.setSpacing(0)
 
-        splitter = QSplitter(Qt.Vertical)
+        splitter = PersistentSplitter(Qt.Vertical, "motif_splitter")
 
         # ── Top: input controls in a scroll area ─────────────────
         input_scroll = QScrollArea()
@@ -391,14 +392,8 @@ class MotifSearchPage(QWidget):
         splitter.setStretchFactor(0, 0)
         splitter.setStretchFactor(1, 1)
 
-        settings = QSettings("SenLab", "ProteinGUI")
-        if settings.contains("motif_splitter"):
-            splitter.restoreState(settings.value("motif_splitter"))
-        else:
-            splitter.setSizes([400, 400])
-
+        splitter.restore_state([400, 400])
         self.splitter = splitter
-        splitter.splitterMoved.connect(self._save_splitter_state)
 
         root.addWidget(splitter)
 
@@ -589,7 +584,3 @@ class MotifSearchPage(QWidget):
             QMessageBox.information(self, "Export Successful", f"Summary exported to:\n{file_path}")
         except Exception as e:
             QMessageBox.critical(self, "Export Error", f"Failed to export:\n{str(e)}")
-
-    def _save_splitter_state(self):
-        settings = QSettings("SenLab", "ProteinGUI")
-        settings.setValue("motif_splitter", self.splitter.saveState())
@@ -10,10 +10,12 @@ from PyQt5.QtWidgets import (
     QSpinBox, QDoubleSpinBox, QScrollArea, QSplitter, QSizePolicy
 )
 from PyQt5.QtCore import pyqtSignal, QTimer, Qt
+from PyQt5.QtGui import QStandardItem
 
-from ui.theme import get_theme
+from ui.theme import set_label_state
 from ui.icons import feather_icon, set_button_icon
 from ui.widgets.results_panel import SearchResultsPanel
+from ui.widgets.db_description import db_description_timer
 from core.db_definitions import NCBI_DATABASES
 from core.blast_worker import BLASTWorker
 from core.mmseqs_runner import MMseqsWorker
@@ -36,9 +38,22 @@ from ui.dialogs.cluster_selection_dialog import ClusterSelectionDialog
 from ui.dialogs.clustering_config_dialog import ClusteringConfigDialog
 from core.sequence_fetcher_worker import SequenceFetcherWorker
 from core.temp_fasta_manager import get_temp_fasta_manager
-from utils.fasta_parser import FastaParser, FastaParseError, validate_amino_acid_sequence
+from utils.fasta_parser import (
+    FastaParser, FastaParseError, strip_non_letters, invalid_residue_message, validate_amino_acid_sequence,
+)
 from utils.export_manager import ResultsExporter, ExportError, show_export_error, show_export_success
 
+# Databases listed first in the BLASTP and MMseqs2 pickers
+_KEY_DATABASES = ("swissprot", "nr", "pdb", "refseq_protein")
+_KEY_DATABASE_SET = frozenset(_KEY_DATABASES)
+
+# BLASTP picker entries (database key, "name - description"), formatted once per process
+_BLAST_DB_ENTRIES = [
+    (db, f"{db} - {NCBI_DATABASES[db]}") for db in _KEY_DATABASES if db in NCBI_DATABASES
+] + [
+    (db, f"{db} - {desc}") for db, desc in NCBI_DATABASES.items() if db not in _KEY_DATABASE_SET
+]
+
 
 class ProteinSearchPage(QWidget):
     back_requested = pyqtSignal()
@@ -49,10 +64,13 @@ class ProteinSearchPage(QWidget):
         super().__init__()
         self.blast_worker = None
         self.mmseqs_worker = None
+        self._diamond_worker = None
+        self._mmseqs_gpu_worker = None
         self.search_start_time = None
         self.current_results_html = ""
         self.current_results_data = []
         self.current_query_info = {}
+        self._blast_query_info = {}
         self.current_database_path = ""
         self.fasta_parser = FastaParser()
         self.exporter = ResultsExporter()
@@ -73,9 +91,10 @@ class ProteinSearchPage(QWidget):
         self._init_ui()
 
         QTimer.singleShot(100, self.scan_installed_databases)
-        QTimer.singleShot(500, self._check_mmseqs_requirements)
 
     def _init_ui(self):
+        # Build the whole page before Qt lays it out or paints it
+        self.setUpdatesEnabled(False)
         root = QVBoxLayout(self)
         root.setContentsMargins(0, 0, 0, 0)
         root.setSpacing(0)
@@ -209,18 +228,26 @@ class ProteinSearchPage(QWidget):
         self.remote_radio.setChecked(True)
         self.remote_radio.toggled.connect(self._on_blast_db_source_changed)
         src_row.addWidget(self.remote_radio)
+        src_row.addStretch()
+        self.clear_blast_cache_btn = QPushButton("Clear Cached Results")
+        self.clear_blast_cache_btn.setProperty("class", "secondary")
+        set_button_icon(self.clear_blast_cache_btn, "x", 14)
+        self.clear_blast_cache_btn.setToolTip("Repeated BLASTP searches are answered from a local cache")
+        self.clear_blast_cache_btn.clicked.connect(self._clear_blast_cache)
+        src_row.addWidget(self.clear_blast_cache_btn)
 
         db_sel = QVBoxLayout()
         self.blast_db_combo = QComboBox()
-        key_dbs = ["swissprot", "nr", "pdb", "refseq_protein"]
-        for db in key_dbs:
-            if db in NCBI_DATABASES:
-                self.blast_db_combo.addItem(f"{db} - {NCBI_DATABASES[db]}")
-        for db, desc in NCBI_DATABASES.items():
-            if db not in key_dbs:
-                self.blast_db_combo.addItem(f"{db} - {desc}")
+        # One batch insert; each item carries its database key as currentData()
+        db_items = []
+        for db, label in _BLAST_DB_ENTRIES:
+            item = QStandardItem(label)
+            item.setData(db, Qt.UserRole)
+            db_items.append(item)
+        self.blast_db_combo.model().invisibleRootItem().appendRows(db_items)
         self.blast_db_combo.setCurrentIndex(0)
         self.blast_db_combo.currentTextChanged.connect(self._on_blast_db_changed)
+        self._blast_db_description_timer = db_description_timer(self, self._update_blast_db_description)
 
         self.blast_db_description = QLabel()
         self.blast_db_description.setWordWrap(True)
@@ -336,10 +363,69 @@ class ProteinSearchPage(QWidget):
 
         # ── MMseqs2 database options ─────────────────────────────
         self.mmseqs_db_group = QGroupBox("Database Options")
+        # Built on first switch to an MMseqs2/DIAMOND tool; BLASTP is the default
+        self._mmseqs_db_built = False
+        self.mmseqs_db_group.setVisible(False)
+        form.addWidget(self.mmseqs_db_group)
+
+        # ── Run / Cancel buttons + status ────────────────────────
+        btn_row = QHBoxLayout()
+        self.process_button = QPushButton("Run BLASTP Search")
+        self.process_button.setProperty("class", "success")
+        set_button_icon(self.process_button, "play", 16, "#FFFFFF")
+        self.process_button.setMinimumHeight(40)
+        self.process_button.clicked.connect(self._run_search)
+
+        self.cancel_button = QPushButton("Cancel Search")
+        self.cancel_button.setProperty("class", "danger")
+        set_button_icon(self.cancel_button, "x", 14, "#FFFFFF")
+        self.cancel_button.setMinimumHeight(40)
+        self.cancel_button.clicked.connect(self._cancel_search)
+        self.cancel_button.setEnabled(False)
+        self.cancel_button.hide()
+
+        btn_row.addWidget(self.process_button, 1)
+        btn_row.addWidget(self.cancel_button)
+        form.addLayout(btn_row)
+
+        self.status_label = QLabel("Ready")
+        self.status_label.setProperty("class", "muted")
+        form.addWidget(self.status_label)
+
+        input_scroll.setWidget(input_widget)
+        splitter.addWidget(input_scroll)
+
+        # ── Bottom: results panel ────────────────────────────────
+        self.results_panel = SearchResultsPanel(show_align_button=True)
+        self.results_panel.export_requested.connect(self._export_results)
+        self.results_panel.cluster_requested.connect(self._on_cluster_results)
+        self.results_panel.align_requested.connect(self._on_align_results)
+        splitter.addWidget(self.results_panel)
+
+        splitter.setStretchFactor(0, 0)
+        splitter.setStretchFactor(1, 1)
+        splitter.setSizes([340, 500])
+
+        root.addWidget(splitter)
+        self.setUpdatesEnabled(True)
+
+    # ── Tool switching ───────────────────────────────────────────
+
+    def _is_blast(self):
+        return self.blast_radio.isChecked()
+
+    def _selected_tool_id(self) -> int:
+        return self.tool_group.checkedId()
+
+    def _build_mmseqs_db_group(self):
+        """Fill the MMseqs2 "Database Options" group the first time it is shown."""
+        if self._mmseqs_db_built:
+            return
+        self._mmseqs_db_built = True
         og = QVBoxLayout()
 
         src_lbl = QLabel("Database Source:")
-        src_lbl.setStyleSheet("font-weight:600;")
+        src_lbl.setProperty("strong", True)
         self.mmseqs_db_source_group = QButtonGroup()
         self.ncbi_radio = QRadioButton("Use NCBI Database (from blast_databases folder)")
         self.custom_ncbi_radio = QRadioButton("Browse for NCBI Database (other location)")
@@ -431,47 +517,13 @@ class ProteinSearchPage(QWidget):
         og.addWidget(self.mmseqs_info_label)
         self.mmseqs_db_group.setLayout(og)
         self._on_mmseqs_db_source_changed()
-        self.mmseqs_db_group.setVisible(False)
-        form.addWidget(self.mmseqs_db_group)
-
-        # ── Run button + status ──────────────────────────────────
-        self.process_button = QPushButton("Run BLASTP Search")
-        self.process_button.setProperty("class", "success")
-        set_button_icon(self.process_button, "play", 16, "#FFFFFF")
-        self.process_button.setMinimumHeight(40)
-        self.process_button.clicked.connect(self._run_search)
-        form.addWidget(self.process_button)
-
-        self.status_label = QLabel("Ready")
-        self.status_label.setProperty("class", "muted")
-        form.addWidget(self.status_label)
-
-        input_scroll.setWidget(input_widget)
-        splitter.addWidget(input_scroll)
-
-        # ── Bottom: results panel ────────────────────────────────
-        self.results_panel = SearchResultsPanel(show_align_button=True)
-        self.results_panel.export_requested.connect(self._export_results)
-        self.results_panel.cluster_requested.connect(self._on_cluster_results)
-        self.results_panel.align_requested.connect(self._on_align_results)
-        splitter.addWidget(self.results_panel)
-
-        splitter.setStretchFactor(0, 0)
-        splitter.setStretchFactor(1, 1)
-        splitter.setSizes([340, 500])
-
-        root.addWidget(splitter)
-
-    # ── Tool switching ───────────────────────────────────────────
-
-    def _is_blast(self):
-        return self.blast_radio.isChecked()
-
-    def _selected_tool_id(self) -> int:
-        return self.tool_group.checkedId()
+        # Let the group paint before the tool lookup runs
+        QTimer.singleShot(0, self._check_mmseqs_requirements)
 
     def _on_tool_changed(self):
         tid = self._selected_tool_id()
+        if tid in (1, 2, 3):
+            self._build_mmseqs_db_group()
         self.blast_db_group.setVisible(tid == 0)
         self.blast_adv_group.setVisible(tid == 0)
         self.mmseqs_db_group.setVisible(tid in (1, 2, 3))
@@ -519,17 +571,21 @@ class ProteinSearchPage(QWidget):
 
     def _update_sequence_counter(self):
         text = self.input_text.toPlainText().strip().upper()
-        count = len("".join(c for c in text if c.isalpha()))
+        if text.startswith(">"):
+            # Multi-FASTA batch for BLASTP; headers are not residues
+            self.sequence_counter.setText(f"{text.count('>')} sequences")
+            set_label_state(self.sequence_counter, "success", strong=True)
+            return
+        count = len(strip_non_letters(text))
         self.sequence_counter.setText(f"{count} amino acids")
-        t = get_theme()
         if count == 0:
-            self.sequence_counter.setStyleSheet(f"color:{t.get('text_muted')};")
+            set_label_state(self.sequence_counter, "muted")
         elif count < 10:
-            self.sequence_counter.setStyleSheet(f"color:{t.get('error')}; font-weight:600;")
+            set_label_state(self.sequence_counter, "error", strong=True)
         elif count > 10000:
-            self.sequence_counter.setStyleSheet(f"color:{t.get('warning')}; font-weight:600;")
+            set_label_state(self.sequence_counter, "warning", strong=True)
         else:
-            self.sequence_counter.setStyleSheet(f"color:{t.get('success')}; font-weight:600;")
+            set_label_state(self.sequence_counter, "success", strong=True)
 
     # ── FASTA upload ─────────────────────────────────────────────
 
@@ -592,18 +648,17 @@ class ProteinSearchPage(QWidget):
             self.protein_info_label.setText(
                 f"Loaded: {metadata.get('protein_name', 'Unknown')} "
                 f"({metadata.get('uniprot_id', 'Unknown')})")
-            self.protein_info_label.setStyleSheet(
-                f"color:{get_theme().get('success')}; font-weight:600;")
+            set_label_state(self.protein_info_label, "success", strong=True)
 
     # ── BLASTP database helpers ──────────────────────────────────
 
     def _on_blast_db_changed(self):
-        self._update_blast_db_description()
+        self._blast_db_description_timer.start()
 
     def _update_blast_db_description(self):
-        text = self.blast_db_combo.currentText()
-        db = text.split(" - ")[0] if " - " in text else text
-        desc = NCBI_DATABASES.get(db, "Database information not available")
+        desc = NCBI_DATABASES.get(
+            self.blast_db_combo.currentData(), "Database information not available"
+        )
         self.blast_db_description.setText(desc)
 
     def _on_blast_db_source_changed(self):
@@ -612,6 +667,10 @@ class ProteinSearchPage(QWidget):
         self.local_db_path.setEnabled(not remote)
         self.blast_browse_button.setEnabled(not remote)
 
+    def _clear_blast_cache(self):
+        BLASTWorker.clear_result_cache()
+        self.status_label.setText("Cached BLASTP results cleared.")
+
     def _browse_blast_db_path(self):
         d = QFileDialog.getExistingDirectory(self, "Select Database Directory", "", QFileDialog.ShowDirsOnly)
         if d:
@@ -693,14 +752,13 @@ class ProteinSearchPage(QWidget):
 
     def _populate_mmseqs_db_dropdown(self):
         self.mmseqs_db_combo.clear()
-        key_dbs = ["swissprot", "nr", "pdb", "refseq_protein"]
-        for db in key_dbs:
+        for db in _KEY_DATABASES:
             if db in NCBI_DATABASES:
                 icon = self._mmseqs_status_icon(db)
                 self.mmseqs_db_combo.addItem(f"{icon} {db}")
-        self.mmseqs_db_combo.insertSeparator(len(key_dbs))
+        self.mmseqs_db_combo.insertSeparator(len(_KEY_DATABASES))
         for db in sorted(NCBI_DATABASES.keys()):
-            if db not in key_dbs:
+            if db not in _KEY_DATABASE_SET:
                 icon = self._mmseqs_status_icon(db)
                 self.mmseqs_db_combo.addItem(f"{icon} {db}")
         if self.mmseqs_db_combo.count() > 0:
@@ -722,28 +780,27 @@ class ProteinSearchPage(QWidget):
         db = self._get_mmseqs_selected_db_name()
         if not db:
             return
-        t = get_theme()
         status = self.conversion_manager.get_database_status(db)
         if status["status"] == "converted":
             self.mmseqs_db_status_label.setText(
                 f"{db} is ready to use (converted: {status.get('converted_date', '')[:10]})")
-            self.mmseqs_db_status_label.setStyleSheet(f"color:{t.get('success')};")
+            set_label_state(self.mmseqs_db_status_label, "success")
         elif status["status"] == "converting":
             self.mmseqs_db_status_label.setText(f"{db} is currently being converted...")
-            self.mmseqs_db_status_label.setStyleSheet(f"color:{t.get('warning')};")
+            set_label_state(self.mmseqs_db_status_label, "warning")
         elif status["status"] == "failed":
             self.mmseqs_db_status_label.setText(
                 f"{db} conversion failed: {status.get('error', 'Unknown')}")
-            self.mmseqs_db_status_label.setStyleSheet(f"color:{t.get('error')};")
+            set_label_state(self.mmseqs_db_status_label, "error")
         else:
             desc = NCBI_DATABASES.get(db, "")
             if db in self.installed_databases:
                 self.mmseqs_db_status_label.setText(
                     f"{db} installed but not converted. Will auto-convert on search.")
-                self.mmseqs_db_status_label.setStyleSheet(f"color:{t.get('text_muted')};")
+                set_label_state(self.mmseqs_db_status_label, "muted")
             else:
                 self.mmseqs_db_status_label.setText(f"{db} not installed. {desc}")
-                self.mmseqs_db_status_label.setStyleSheet(f"color:{t.get('warning')};")
+                set_label_state(self.mmseqs_db_status_label, "warning")
 
     def _on_mmseqs_db_selection_changed(self):
         self._update_mmseqs_db_status_label()
@@ -771,7 +828,9 @@ class ProteinSearchPage(QWidget):
                 w.setVisible(is_cm)
 
     def _check_mmseqs_requirements(self):
-        t = get_theme()
+        # The info label lives in the lazily built MMseqs2 group
+        if not self._mmseqs_db_built:
+            return
         runtime = get_tool_runtime()
         missing = runtime.get_missing_tools_for_feature("protein_mmseqs")
         if missing:
@@ -779,13 +838,13 @@ class ProteinSearchPage(QWidget):
                 "MMseqs2 mode needs MMseqs2 and blastdbcmd. Use the Tools tab to install them, "
                 "or click Run and the app will prompt to install what is missing."
             )
-            self.mmseqs_info_label.setStyleSheet(f"color:{t.get('warning')};")
+            set_label_state(self.mmseqs_info_label, "warning")
             return
         status = runtime.get_tool_status("mmseqs")
         self.mmseqs_info_label.setText(
             f"MMseqs2 ready ({status.version or 'installed'}). First-time DB selection triggers auto-conversion."
         )
-        self.mmseqs_info_label.setStyleSheet(f"color:{t.get('success')};")
+        set_label_state(self.mmseqs_info_label, "success")
 
     def _ensure_feature_tools(self, feature_id: str, retry_callback):
         runtime = get_tool_runtime()
@@ -878,8 +937,7 @@ class ProteinSearchPage(QWidget):
         if not os.path.exists(blast_db_path + ".phr"):
             QMessageBox.critical(self, "Not Found", f"Database files not found at: {blast_db_path}")
             return
-        mmseqs_dir = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "mmseqs_databases")
+        mmseqs_dir = os.path.join(self._project_root, "mmseqs_databases")
         os.makedirs(mmseqs_dir, exist_ok=True)
         mmseqs_path = os.path.join(mmseqs_dir, db_name)
         self.conversion_manager.mark_converting(db_name, blast_db_path, mmseqs_path)
@@ -939,14 +997,22 @@ class ProteinSearchPage(QWidget):
         if not sequence:
             self.status_label.setText("Please enter a protein sequence first.")
             return None
-        sequence = "".join(c for c in sequence if c.isalpha())
-        valid_aa = set("ACDEFGHIKLMNPQRSTVWY")
-        if not all(c in valid_aa for c in sequence):
-            self.status_label.setText("Invalid amino acid sequence.")
+        sequence = strip_non_letters(sequence)
+        error = invalid_residue_message(sequence)
+        if error:
+            self.status_label.setText(error)
             return None
         return sequence
 
+    def _search_running(self):
+        workers = (self.blast_worker, self.mmseqs_worker, self._diamond_worker, self._mmseqs_gpu_worker)
+        return any(w is not None and w.isRunning() for w in workers)
+
     def _run_search(self):
+        # Starting another search would drop the only reference to a running QThread
+        if self._search_running():
+            self.status_label.setText("A search is already running.")
+            return
         tid = self._selected_tool_id()
         if tid == 0:
             self._run_blast()
@@ -958,18 +1024,23 @@ class ProteinSearchPage(QWidget):
             self._run_mmseqs_gpu()
 
     def _run_blast(self):
+        # Never drop the reference to a running QThread; it would be destroyed mid-search
+        if self.blast_worker is not None and self.blast_worker.isRunning():
+            self.status_label.setText("A BLASTP search is already running.")
+            return
         if not self._ensure_feature_tools("protein_blast", self._run_blast):
             return
-        sequence = self._validate_sequence()
-        if not sequence:
+        # Cleanup and validation of the query run in the worker, off the GUI thread
+        query_text = self.input_text.toPlainText()
+        if not query_text.strip():
+            self.status_label.setText("Please enter a protein sequence first.")
             return
 
         self.process_button.setEnabled(False)
         self.status_label.setText("Running BLASTP search... This may take a minute.")
         self.results_panel.clear()
 
-        db_text = self.blast_db_combo.currentText()
-        database = db_text.split(" - ")[0] if " - " in db_text else db_text
+        database = self.blast_db_combo.currentData()
         use_remote = self.remote_radio.isChecked()
         local_path = self.local_db_path.text().strip()
 
@@ -986,12 +1057,41 @@ class ProteinSearchPage(QWidget):
                 self.process_button.setEnabled(True)
                 return
 
+        # Describe the query as submitted; the input box may be edited while blastp runs
+        query_count = query_text.count(">")
+        self._blast_query_info = {
+            "tool": "BLASTP",
+            "query_name": (f"{query_count} queries" if query_count > 1
+                           else self.current_sequence_metadata.get("id", "query")),
+            "query_length": str(len(query_text.strip())),
+            "database": database,
+        }
         self.search_start_time = time.time()
-        self.blast_worker = BLASTWorker(sequence, database, use_remote, local_path,
+        self.blast_worker = BLASTWorker(query_text, database, use_remote, local_path,
                                         advanced_params=self._get_advanced_params())
         self.blast_worker.finished.connect(self._on_blast_finished)
         self.blast_worker.error.connect(self._on_search_error)
+        self.blast_worker.cancelled.connect(self._on_search_cancelled)
+        self.blast_worker.progress.connect(self.status_label.setText)
         self.blast_worker.start()
+        self.cancel_button.setEnabled(True)
+        self.cancel_button.show()
+
+    def _cancel_search(self):
+        if self.blast_worker and self.blast_worker.isRunning():
+            # The worker stops blastp; Run comes back on `cancelled`
+            self.blast_worker.cancel()
+            self.status_label.setText("Cancelling search...")
+            self.cancel_button.setEnabled(False)
+
+    def _on_search_cancelled(self):
+        self.status_label.setText("Search cancelled")
+        self._restore_run_button()
+
+    def _restore_run_button(self):
+        self.process_button.setEnabled(True)
+        self.cancel_button.hide()
+        self.cancel_button.setEnabled(False)
 
     def _run_mmseqs(self):
         if not self._ensure_feature_tools("protein_mmseqs", self._run_mmseqs):
@@ -1062,22 +1162,17 @@ class ProteinSearchPage(QWidget):
         self.mmseqs_worker = MMseqsWorker(sequence, database_path, sensitivity)
         self.mmseqs_worker.finished.connect(self._on_mmseqs_finished)
         self.mmseqs_worker.error.connect(self._on_search_error)
+        self.mmseqs_worker.progress.connect(self.status_label.setText)
         self.mmseqs_worker.start()
 
     def _on_blast_finished(self, results_html, results_data):
         elapsed = time.time() - self.search_start_time if self.search_start_time else 0
         self.current_results_html = results_html
         self.current_results_data = results_data
-        self.current_query_info = {
-            "tool": "BLASTP",
-            "query_name": self.current_sequence_metadata.get("id", "query"),
-            "query_length": str(len(self.input_text.toPlainText().strip())),
-            "database": self.blast_db_combo.currentText().split(" - ")[0],
-            "search_time": f"{elapsed:.1f}s",
-        }
+        self.current_query_info = {**self._blast_query_info, "search_time": f"{elapsed:.1f}s"}
         self.results_panel.set_results(results_data, self.current_query_info)
         self.status_label.setText("Search complete!")
-        self.process_button.setEnabled(True)
+        self._restore_run_button()
 
     def _on_mmseqs_finished(self, results_html, results_data):
         elapsed = time.time() - self.search_start_time if self.search_start_time else 0
@@ -1271,7 +1366,7 @@ class ProteinSearchPage(QWidget):
     def _on_search_error(self, error_msg):
         self.results_panel.clear()
         self.status_label.setText(f"Error: {error_msg[:120]}")
-        self.process_button.setEnabled(True)
+        self._restore_run_button()
 
     # ── Cluster / Align workflows ────────────────────────────────
 
@@ -1281,9 +1376,8 @@ class ProteinSearchPage(QWidget):
             if not self.remote_radio.isChecked():
                 if self.local_db_path.text().strip():
                     return os.path.join(self.local_db_path.text().strip(),
-                        self.blast_db_combo.currentText().split(" - ")[0])
-                db_name = self.blast_db_combo.currentText().split(" - ")[0]
-                return self._resolve_blast_db_path(db_name)
+                        self.blast_db_combo.currentData())
+                return self._resolve_blast_db_path(self.blast_db_combo.currentData())
         return self.current_database_path
 
     def _on_cluster_results(self):
@@ -173,6 +173,15 @@ PAGE_ACCENTS = {
     "database":    "#00897B",
 }
 
+# Per-page accent for home page service buttons, one block per PAGE_ACCENTS entry
+SERVICE_ACCENT_QSS = """
+        QPushButton[class="service"][page="{page}"],
+        QPushButton[class="service"][page="{page}"]:hover,
+        QPushButton[class="service"][page="{page}"]:pressed {{
+            background-color: {accent};
+        }}
+"""
+
 
 class ThemeManager(QObject):
     """Singleton that manages the application theme."""
@@ -226,6 +235,10 @@ class ThemeManager(QObject):
         p = self._palette
         ui_font = _platform_ui_font()
         mono_font = _platform_mono_font()
+        service_accents = "".join(
+            SERVICE_ACCENT_QSS.format(page=page, accent=accent)
+            for page, accent in PAGE_ACCENTS.items()
+        )
 
         qss = f"""
         /* ── Global ─────────────────────────────────────── */
@@ -339,6 +352,19 @@ class ThemeManager(QObject):
             border-color: {p['accent_pressed']};
         }}
 
+        /* Home page service buttons; [page] picks the accent */
+        QPushButton[class="service"],
+        QPushButton[class="service"]:hover,
+        QPushButton[class="service"]:pressed {{
+            background-color: {p['accent']};
+            color: white;
+            border: none;
+            border-radius: 8px;
+            font-size: 14px;
+            font-weight: 600;
+            padding: 14px;
+        }}
+{service_accents}
         QPushButton[class="success"] {{
             background-color: {p['success']};
         }}
@@ -654,6 +680,11 @@ class ThemeManager(QObject):
             font-size: 11px;
         }}
 
+        QLabel[class="hint"] {{
+            color: {p['text_muted']};
+            font-style: italic;
+        }}
+
         QLabel[class="heading"] {{
             font-size: 16px;
             font-weight: 600;
@@ -668,6 +699,27 @@ class ThemeManager(QObject):
             padding: 6px 0;
         }}
 
+        /* Status labels, switched at runtime with set_label_state() */
+        QLabel[state="muted"] {{
+            color: {p['text_muted']};
+        }}
+
+        QLabel[state="success"] {{
+            color: {p['success']};
+        }}
+
+        QLabel[state="warning"] {{
+            color: {p['warning']};
+        }}
+
+        QLabel[state="error"] {{
+            color: {p['error']};
+        }}
+
+        QLabel[strong="true"] {{
+            font-weight: 600;
+        }}
+
         /* ── Status Bar ─────────────────────────────────── */
         QStatusBar {{
             background-color: {p['bg_secondary']};
@@ -715,6 +767,20 @@ class ThemeManager(QObject):
         app.setStyleSheet(qss)
 
 
+def set_label_state(label, state: str, strong: bool = False):
+    """Colour a status label via the global QSS (state: muted/success/warning/error).
+
+    The label is only re-polished when its state actually changes.
+    """
+    if label.property("state") == state and bool(label.property("strong")) == strong:
+        return
+    label.setProperty("state", state)
+    label.setProperty("strong", strong)
+    style = label.style()
+    style.unpolish(label)
+    style.polish(label)
+
+
 def get_theme() -> ThemeManager:
     """Return the singleton ThemeManager instance."""
     return ThemeManager()
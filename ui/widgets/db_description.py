@@ -0,0 +1,22 @@
+"""
+Debounced database description updates, shared by the BLAST search pages.
+"""
+
+from PyQt5.QtCore import QTimer
+
+# Quiet period after the database selection changes before its description is shown
+DB_DESCRIPTION_DELAY_MS = 30
+
+
+def db_description_timer(parent, update):
+    """
+    Single-shot timer that calls *update* DB_DESCRIPTION_DELAY_MS after its last start().
+
+    Start it from the combobox's change signal: arrowing through the list
+    restarts it on every step, so only the final pick is described.
+    """
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(DB_DESCRIPTION_DELAY_MS)
+    timer.timeout.connect(update)
+    return timer
@@ -0,0 +1,50 @@
+"""
+QSplitter that saves its position to QSettings, shared by the tool pages.
+"""
+
+from PyQt5.QtWidgets import QSplitter
+from PyQt5.QtCore import QSettings, QTimer
+
+# Quiet period after the last drag step before the splitter position is saved
+SPLITTER_SAVE_DELAY_MS = 300
+
+
+class PersistentSplitter(QSplitter):
+    """
+    A splitter that remembers its position in QSettings under *settings_key*.
+
+    splitterMoved fires for every pixel of a drag, so the state is written
+    once the drag settles. A pending write is flushed when the splitter is
+    hidden, which also happens when its window closes.
+    """
+
+    def __init__(self, orientation, settings_key, parent=None):
+        super().__init__(orientation, parent)
+        self._settings_key = settings_key
+
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SPLITTER_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.save_state)
+        self.splitterMoved.connect(self._schedule_save)
+
+    def restore_state(self, default_sizes):
+        """Restore the saved position, or apply *default_sizes*; call once the widgets are added"""
+        settings = QSettings("SenLab", "ProteinGUI")
+        if settings.contains(self._settings_key):
+            self.restoreState(settings.value(self._settings_key))
+        else:
+            self.setSizes(default_sizes)
+
+    def save_state(self):
+        """Write the current position now"""
+        self._save_timer.stop()
+        QSettings("SenLab", "ProteinGUI").setValue(self._settings_key, self.saveState())
+
+    def _schedule_save(self, *_):
+        self._save_timer.start()
+
+    def hideEvent(self, event):
+        if self._save_timer.isActive():
+            self.save_state()
+        super().hideEvent(event)
@@ -15,7 +15,7 @@ from PyQt5.QtGui import QFont, QClipboard
 
 from ui.theme import get_theme
 from ui.icons import feather_icon, set_button_icon
-from utils.results_parser import SearchHit
+from utils.results_parser import SearchHit, distinct_query_ids, rank_hits
 
 
 # ── colour helpers ────────────────────────────────────────────────────
@@ -108,7 +108,7 @@ class SummaryBar(QFrame):
 class HitCard(QFrame):
     """Collapsible card for a single search hit."""
 
-    def __init__(self, hit: SearchHit, parent=None):
+    def __init__(self, hit: SearchHit, show_query: bool = False, parent=None):
         super().__init__(parent)
         self.hit = hit
         self._expanded = False
@@ -131,6 +131,13 @@ class HitCard(QFrame):
         self._update_chevron()
         h.addWidget(self._chevron)
 
+        # Ranks restart for each query of a batch, so say which query this is
+        if show_query and hit.query_id:
+            query_lbl = QLabel(hit.query_id)
+            query_lbl.setProperty("class", "muted")
+            query_lbl.setToolTip("Query")
+            h.addWidget(query_lbl)
+
         rank_lbl = QLabel(f"#{hit.rank}")
         rank_lbl.setStyleSheet("font-weight:700; min-width:32px;")
         h.addWidget(rank_lbl)
@@ -391,28 +398,31 @@ class SearchResultsPanel(QWidget):
     # ── internals ─────────────────────────────────────────────────
 
     def _rebuild_cards(self):
-        for card in self._cards:
-            self._card_layout.removeWidget(card)
-            card.deleteLater()
-        self._cards.clear()
-
-        for hit in self._hits:
-            card = HitCard(hit)
-            self._card_layout.insertWidget(self._card_layout.count() - 1, card)
-            self._cards.append(card)
+        # Suspend painting so hundreds of card inserts cause a single relayout
+        self._card_container.setUpdatesEnabled(False)
+        try:
+            for card in self._cards:
+                self._card_layout.removeWidget(card)
+                card.deleteLater()
+            self._cards.clear()
+
+            show_query = len(distinct_query_ids(self._hits)) > 1
+            for hit in self._hits:
+                card = HitCard(hit, show_query)
+                self._card_layout.insertWidget(self._card_layout.count() - 1, card)
+                self._cards.append(card)
+        finally:
+            self._card_container.setUpdatesEnabled(True)
 
     def _apply_sort(self, index: int):
         if not self._hits:
             return
         if index == 0:
-            self._hits.sort(key=lambda h: h.evalue)
+            rank_hits(self._hits, key=lambda h: h.evalue)
         elif index == 1:
-            self._hits.sort(key=lambda h: h.identity_percent, reverse=True)
+            rank_hits(self._hits, key=lambda h: h.identity_percent, reverse=True)
         elif index == 2:
-            self._hits.sort(key=lambda h: h.score, reverse=True)
-
-        for i, hit in enumerate(self._hits):
-            hit.rank = i + 1
+            rank_hits(self._hits, key=lambda h: h.score, reverse=True)
         self._rebuild_cards()
 
     def _set_all_expanded(self, expanded: bool):
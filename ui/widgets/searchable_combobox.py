@@ -1,5 +1,15 @@
 from PyQt5.QtWidgets import QComboBox, QCompleter
-from PyQt5.QtCore import Qt, QStringListModel
+from PyQt5.QtCore import Qt, QSortFilterProxyModel, QTimer
+from PyQt5.QtGui import QStandardItem, QStandardItemModel
+
+# Item role holding the lowercased text and data so the filter matches descriptions too
+_FILTER_ROLE = Qt.UserRole + 1
+# Joins text and data in _FILTER_ROLE; it is stripped from the typed filter, so a
+# match never spans the end of the name and the start of the description
+_FILTER_SEPARATOR = "\0"
+
+# Quiet period after the last keystroke before the list is filtered
+FILTER_DELAY_MS = 120
 
 
 class SearchableComboBox(QComboBox):
@@ -7,7 +17,6 @@ class SearchableComboBox(QComboBox):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        print("Creating SearchableComboBox...")
         
         self.setEditable(True)
         self.setInsertPolicy(QComboBox.NoInsert)
@@ -17,13 +26,29 @@ class SearchableComboBox(QComboBox):
         self.all_data = {}
         self._initializing = True
         
+        # Items live in a source model; the combobox shows a filtered view of it
+        self._source = QStandardItemModel(self)
+        self._proxy = QSortFilterProxyModel(self)
+        self._proxy.setSourceModel(self._source)
+        # Filter role is stored lowercased, so compare without case folding
+        self._proxy.setFilterCaseSensitivity(Qt.CaseSensitive)
+        self._proxy.setFilterKeyColumn(0)
+        self._proxy.setFilterRole(_FILTER_ROLE)
+        self.setModel(self._proxy)
+        
         # Create completer for auto-completion
         self.completer = QCompleter(self)
+        self.completer.setModel(self._proxy)
         self.completer.setCompletionMode(QCompleter.PopupCompletion)
         self.completer.setCaseSensitivity(Qt.CaseInsensitive)
         self.setCompleter(self.completer)
         
-        print("SearchableComboBox created successfully")
+        # Coalesce a burst of keystrokes into one filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self.lineEdit().textChanged.connect(self._filter_timer.start)
     
     def addItemWithData(self, text, data=None):
         """Add item with optional data"""
@@ -31,72 +56,67 @@ class SearchableComboBox(QComboBox):
             self.all_items.append(text)
             if data:
                 self.all_data[text] = data
-            super().addItem(text)
+            self._source.appendRow(self._make_item(text, data))
         except Exception as e:
             print(f"Error adding item {text}: {e}")
     
     def setItems(self, items_dict):
         """Set items from dictionary {text: data}"""
-        print(f"Setting {len(items_dict)} database items...")
-        
         try:
             # Temporarily block signals during initialization
             self.blockSignals(True)
+            self.setUpdatesEnabled(False)
             
-            self.clear()
-            self.all_items.clear()
-            self.all_data.clear()
+            self._proxy.setFilterFixedString("")
+            self._source.clear()
+            self.all_items = list(items_dict.keys())
+            self.all_data = dict(items_dict)
             
-            # Add items more safely
-            for i, (text, data) in enumerate(items_dict.items()):
-                if i % 10 == 0:  # Progress indicator
-                    print(f"  Adding item {i+1}/{len(items_dict)}: {text}")
-                
-                self.all_items.append(text)
-                self.all_data[text] = data
-                super().addItem(text)
-            
-            print("Database items added successfully")
+            # One rowsInserted notification for the whole list
+            self._source.invisibleRootItem().appendRows(
+                [self._make_item(text, data) for text, data in items_dict.items()]
+            )
             
-            # Update completer
-            self.completer.setModel(QStringListModel(self.all_items))
-            print("Completer model updated")
-            
-            # Re-enable signals and connect filtering
+            self.setUpdatesEnabled(True)
             self.blockSignals(False)
             self._initializing = False
             
-            # Connect signals for filtering after initialization
-            self.lineEdit().textChanged.connect(self.filter_items)
-            print("Signals connected")
-            
         except Exception as e:
+            self.setUpdatesEnabled(True)
+            self.blockSignals(False)
             print(f"Error in setItems: {e}")
             import traceback
             traceback.print_exc()
     
+    @staticmethod
+    def _make_item(text, data):
+        item = QStandardItem(text)
+        item.setData(data, Qt.UserRole)
+        item.setData(f"{text}{_FILTER_SEPARATOR}{data or ''}".lower(), _FILTER_ROLE)
+        return item
+    
+    def _apply_filter(self):
+        self.filter_items(self.lineEdit().text())
+    
     def filter_items(self, text):
         """Filter items based on text input"""
         # Skip filtering during initialization
         if getattr(self, '_initializing', False):
             return
-            
-        try:
-            if not text:
-                # Show all items if no filter text
-                self.clear()
-                for item in self.all_items:
-                    super().addItem(item)
-            else:
-                # Filter items that contain the text (case-insensitive)
-                self.clear()
-                filtered_items = [item for item in self.all_items 
-                                if text.lower() in item.lower() or 
-                                   text.lower() in self.all_data.get(item, '').lower()]
-                for item in filtered_items:
-                    super().addItem(item)
-        except Exception as e:
-            print(f"Error in filter_items: {e}")
+        # Called directly, this makes a pending debounced pass redundant
+        self._filter_timer.stop()
+        
+        line_edit = self.lineEdit()
+        cursor = line_edit.cursorPosition()
+        self._proxy.setFilterFixedString(text.lower().replace(_FILTER_SEPARATOR, ""))
+        
+        # Hiding the current row makes QComboBox select another one and
+        # overwrite the edit text; put back what the user typed
+        if line_edit.text() != text:
+            line_edit.blockSignals(True)
+            line_edit.setText(text)
+            line_edit.setCursorPosition(cursor)
+            line_edit.blockSignals(False)
     
     def getCurrentData(self):
         """Get data for currently selected item"""
@@ -1,8 +1,28 @@
 """FASTA file parser with robust validation and error handling"""
 import os
+import re
 from typing import List, Tuple, Optional
 
 
+# str.translate table deleting every non-letter in the Latin-1 range
+# (whitespace, digits, punctuation) in a single pass
+STRIP_NON_LETTERS = str.maketrans("", "", "".join(chr(i) for i in range(256) if not chr(i).isalpha()))
+
+# Standard amino acids accepted for a search query
+VALID_AMINO_ACIDS = frozenset("ACDEFGHIKLMNPQRSTVWY")
+# First residue outside VALID_AMINO_ACIDS in an already stripped, uppercased query
+_INVALID_RESIDUE_RE = re.compile(r"[^ACDEFGHIKLMNPQRSTVWY]")
+
+
+def strip_non_letters(text: str) -> str:
+    """Delete every non-letter from *text*; the Latin-1 range goes through STRIP_NON_LETTERS"""
+    text = text.translate(STRIP_NON_LETTERS)
+    if text.isascii():
+        return text
+    # Pasted text can carry zero-width spaces, dashes or smart quotes beyond Latin-1
+    return "".join(c for c in text if c.isalpha())
+
+
 class FastaSequence:
     """Represents a single FASTA sequence"""
     def __init__(self, header: str, sequence: str):
@@ -253,3 +273,49 @@ def validate_amino_acid_sequence(sequence: str) -> Tuple[bool, str]:
     else:
         return False, error
 
+
+def invalid_residue_message(sequence: str) -> Optional[str]:
+    """Describe the first invalid residue of *sequence*, or return None if it is valid"""
+    bad = _INVALID_RESIDUE_RE.search(sequence)
+    if bad is None:
+        return None
+    others = "".join(sorted(set(sequence[bad.start():]).difference(VALID_AMINO_ACIDS)))
+    return f"Invalid residue {bad.group()} at position {bad.start() + 1} (found: {others})"
+
+
+def prepare_protein_queries(text: str) -> str:
+    """
+    Clean pasted search input: a bare sequence, or a multi-FASTA batch
+    
+    Each record is handled with whole-string operations rather than
+    FastaParser's per-line checks, so large pastes are cheap to clean.
+    
+    Returns:
+        The uppercased sequence, or the batch re-joined as FASTA
+        
+    Raises:
+        FastaParseError: describing the first empty or invalid sequence
+    """
+    text = text.strip()
+    if not text.startswith(">"):
+        sequence = strip_non_letters(text.upper())
+        if not sequence:
+            raise FastaParseError("Please enter a protein sequence first.")
+        error = invalid_residue_message(sequence)
+        if error:
+            raise FastaParseError(error)
+        return sequence
+    
+    batch = []
+    for record in text[1:].split("\n>"):
+        header, _, body = record.partition("\n")
+        header = header.strip()
+        record_id = header.split(maxsplit=1)[0] if header else "Unknown"
+        sequence = strip_non_letters(body.upper())
+        if not sequence:
+            raise FastaParseError(f"Empty sequence: {record_id}")
+        error = invalid_residue_message(sequence)
+        if error:
+            raise FastaParseError(f"{record_id}: {error}")
+        batch.append(f">{header}\n{sequence}\n")
+    return "".join(batch)
@@ -21,6 +21,7 @@ class SearchHit:
     full_sequence: str = ""
     sequence_length: int = 0
     organism: str = ""
+    query_id: str = ""
     
     def to_dict(self):
         """Convert to dictionary for serialization"""
@@ -35,10 +36,28 @@ class SearchHit:
             'query_coverage': self.query_coverage,
             'full_sequence': self.full_sequence,
             'sequence_length': self.sequence_length,
-            'organism': self.organism
+            'organism': self.organism,
+            'query_id': self.query_id
         }
 
 
+def distinct_query_ids(hits: List[SearchHit]) -> List[str]:
+    """Query IDs of *hits* in first-seen order; more than one means a multi-query batch"""
+    return list(dict.fromkeys(hit.query_id for hit in hits if hit.query_id))
+
+
+def rank_hits(hits: List[SearchHit], key, reverse: bool = False) -> None:
+    """Sort *hits* in place by *key* within each query and renumber ranks per query"""
+    query_order = {query_id: i for i, query_id in enumerate(dict.fromkeys(h.query_id for h in hits))}
+    hits.sort(key=key, reverse=reverse)
+    # Stable sort: hits keep their key order inside each query group
+    hits.sort(key=lambda h: query_order[h.query_id])
+    ranks = {}
+    for hit in hits:
+        ranks[hit.query_id] = ranks.get(hit.query_id, 0) + 1
+        hit.rank = ranks[hit.query_id]
+
+
 class BLASTResultsParser:
     """Parse BLAST XML output into SearchHit objects"""
     
@@ -54,6 +73,8 @@ class BLASTResultsParser:
             # Find all iterations (queries)
             for iteration in root.findall('.//Iteration'):
                 query_len = int(iteration.find('Iteration_query-len').text or 0)
+                query_def = iteration.findtext('Iteration_query-def') or ""
+                query_id = query_def.split()[0] if query_def else ""
                 
                 # Find all hits
                 rank = 0
@@ -99,7 +120,8 @@ class BLASTResultsParser:
                         query_coverage=query_coverage,
                         full_sequence="",  # Will be fetched separately if needed
                         sequence_length=hit_len,
-                        organism=organism
+                        organism=organism,
+                        query_id=query_id
                     )
                     
                     hits.append(search_hit)